@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Benchmark of the Base58 encoding/decoding against the previous code.
+
+The previous implementation performed one big int divmod by 58
+per output character, prepending it to the result;
+decoding performed one big int multiply-add and one alphabet
+index search per input character.
+"""
+
+from timeit import timeit
+
+from btclib.base58 import (_b58decode_to_int, _b58encode_from_int, b58decode,
+                           b58decode_many, b58encode, b58encode_many)
+from btclib.utils import hash256
+
+ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+
+def reference_b58encode_from_int(i: int) -> bytes:
+
+    if i == 0:
+        return ALPHABET[0:1]
+
+    result = b""
+    while i:
+        i, idx = divmod(i, 58)
+        result = ALPHABET[idx:idx+1] + result
+
+    return result
+
+
+def reference_b58decode_to_int(v: bytes) -> int:
+
+    i = 0
+    for char in v:
+        i = i * 58 + ALPHABET.index(char)
+    return i
+
+
+def main(number: int = 2000) -> None:
+
+    payloads = {
+        'address (25 bytes)': b'\x00' + hash256(b'address')[:20] + b'\x00' * 4,
+        'WIF (38 bytes)': b'\x80' + hash256(b'wif') + b'\x01' + b'\x00' * 4,
+        'xkey (82 bytes)': hash256(b'xkey') * 2 + bytes(range(18)),
+        'large (1024 bytes)': hash256(b'large') * 32,
+    }
+    for name, payload in payloads.items():
+        i = int.from_bytes(payload, 'big')
+        assert _b58encode_from_int(i) == reference_b58encode_from_int(i)
+        n = number if len(payload) < 1024 else number // 20
+        old = timeit(lambda: reference_b58encode_from_int(i), number=n)
+        new = timeit(lambda: _b58encode_from_int(i), number=n)
+        print(f"{name:>20}: {old/n*1e6:8.2f}us -> {new/n*1e6:8.2f}us "
+              f"({old/new:.2f}x)")
+        v = _b58encode_from_int(i)
+        assert _b58decode_to_int(v) == reference_b58decode_to_int(v) == i
+        old = timeit(lambda: reference_b58decode_to_int(v), number=n)
+        new = timeit(lambda: _b58decode_to_int(v), number=n)
+        print(f"{'decode':>20}: {old/n*1e6:8.2f}us -> {new/n*1e6:8.2f}us "
+              f"({old/new:.2f}x)")
+
+    vs = [hash256(i.to_bytes(4, 'big'))[:21] for i in range(number)]
+    single = timeit(lambda: [b58encode(v) for v in vs], number=1)
+    many = timeit(lambda: b58encode_many(vs), number=1)
+    print(f"{number} b58encode: {single*1e3:.2f}ms, "
+          f"b58encode_many: {many*1e3:.2f}ms")
+    encoded = b58encode_many(vs)
+    single = timeit(lambda: [b58decode(v, 21) for v in encoded], number=1)
+    many = timeit(lambda: b58decode_many(encoded, 21), number=1)
+    print(f"{number} b58decode: {single*1e3:.2f}ms, "
+          f"b58decode_many: {many*1e3:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,7 @@ https://github.com/keis/base58, with the following modifications:
 """
 
 from hashlib import sha256
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
 from .alias import Octets, String
 from .utils import bytes_from_octets, hash256
@@ -45,18 +45,39 @@ from .utils import bytes_from_octets, hash256
 __ALPHABET = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
 __BASE = len(__ALPHABET)
 
+# big int conversions are performed in limbs of 10 base58 digits,
+# each limb being converted two digits at a time
+_LIMB_DIGITS = 10
+_LIMB = __BASE ** _LIMB_DIGITS
+_PAIRS = [bytes([__ALPHABET[i], __ALPHABET[j]])
+          for i in range(__BASE) for j in range(__BASE)]
+_PAIR_BASE = __BASE * __BASE
+
 
 def _b58encode_from_int(i: int) -> bytes:
 
     if i == 0:
         return __ALPHABET[0:1]
 
-    result = b""
+    # limbs, least significant first
+    limbs = []
     while i:
-        i, idx = divmod(i, __BASE)
-        result = __ALPHABET[idx:idx+1] + result
+        i, limb = divmod(i, _LIMB)
+        limbs.append(limb)
 
-    return result
+    pos = len(limbs) * _LIMB_DIGITS
+    result = bytearray(pos)
+    for limb in limbs:
+        limb, a = divmod(limb, _PAIR_BASE)
+        limb, b = divmod(limb, _PAIR_BASE)
+        limb, c = divmod(limb, _PAIR_BASE)
+        limb, d = divmod(limb, _PAIR_BASE)
+        result[pos-_LIMB_DIGITS:pos] = _PAIRS[limb] + _PAIRS[d] + _PAIRS[c] + \
+            _PAIRS[b] + _PAIRS[a]
+        pos -= _LIMB_DIGITS
+
+    # remove the leading zero digits of the most significant limb
+    return bytes(result.lstrip(__ALPHABET[0:1]))
 
 
 def _b58encode(v: bytes) -> bytes:
@@ -84,21 +105,45 @@ def b58encode(v: Octets) -> bytes:
     return _b58encode(v + h256[:4])
 
 
+def b58encode_many(vs: Iterable[Octets]) -> List[bytes]:
+    """Encode multiple bytes-like objects using Base58Check.
+
+    It is equivalent to [b58encode(v) for v in vs].
+    """
+
+    return [_b58encode(v + hash256(v)[:4])
+            for v in map(bytes_from_octets, vs)]
+
+
+# decode table: base58 digit value of each byte, 0xFF if invalid
+_DECODE_TABLE = bytes(__ALPHABET.index(c) if c in __ALPHABET else 0xff
+                      for c in range(256))
+
+
 def _b58decode_to_int(v: bytes) -> int:
 
+    # validation and conversion to digit values in a single table pass
+    digits = v.translate(_DECODE_TABLE)
+    if b'\xff' in digits:
+        msg = "Base58 string contains invalid characters"
+        raise ValueError(msg)
+
+    # leading partial limb, then full limbs of 10 digits
+    n = len(digits)
+    start = n % _LIMB_DIGITS
     i = 0
-    for char in v:
-        i *= __BASE
-        i += __ALPHABET.index(char)
+    for digit in digits[:start]:
+        i = i * __BASE + digit
+    for k in range(start, n, _LIMB_DIGITS):
+        d0, d1, d2, d3, d4, d5, d6, d7, d8, d9 = digits[k:k+_LIMB_DIGITS]
+        limb = (((d0*58 + d1)*58 + d2)*58 + d3)*58 + d4
+        limb = (((((limb*58 + d5)*58 + d6)*58 + d7)*58 + d8)*58) + d9
+        i = i * _LIMB + limb
     return i
 
 
 def _b58decode(v: bytes, out_size: Optional[int]) -> bytes:
 
-    if any(x not in __ALPHABET for x in v):
-        msg = "Base58 string contains invalid characters"
-        raise ValueError(msg)
-
     # preserve leading-0s
     # base58 leading-1s become leading-0s
     nPad = len(v)
@@ -116,15 +161,12 @@ def _b58decode(v: bytes, out_size: Optional[int]) -> bytes:
         return result
 
     m = f"Invalid base58 decoded size: "
-    m += "{len(result)} bytes instead of {out_size}"
+    m += f"{len(result)} bytes instead of {out_size}"
     raise ValueError(m)
 
 
-def b58decode(v: String, out_size: Optional[int] = None) -> bytes:
-    """Decode a Base58Check encoded bytes-like object or ASCII string.
-
-    Optionally, it also ensures required output size.
-    """
+def _b58decode_check(v: String, out_size: Optional[int]) -> bytes:
+    # decode and strip the checksum, after having verified it
 
     if isinstance(v, str):
         v = v.encode("ascii")
@@ -141,3 +183,22 @@ def b58decode(v: String, out_size: Optional[int] = None) -> bytes:
         raise ValueError(m)
 
     return result
+
+
+def b58decode(v: String, out_size: Optional[int] = None) -> bytes:
+    """Decode a Base58Check encoded bytes-like object or ASCII string.
+
+    Optionally, it also ensures required output size.
+    """
+
+    return _b58decode_check(v, out_size)
+
+
+def b58decode_many(vs: Iterable[String],
+                   out_size: Optional[int] = None) -> List[bytes]:
+    """Decode multiple Base58Check encoded objects or ASCII strings.
+
+    It is equivalent to [b58decode(v, out_size) for v in vs].
+    """
+
+    return [_b58decode_check(v, out_size) for v in vs]
@@ -13,12 +13,12 @@
 Base58 encoding of public keys and scripts as addresses.
 """
 
-from typing import List, Tuple, Union
+from typing import Iterable, List, Tuple
 
-from .alias import Octets, PubKey, String, XkeyDict
-from .base58 import b58decode, b58encode
+from .alias import Octets, PubKey, String
+from .base58 import b58decode, b58decode_many, b58encode
 from .base58wif import _pubkeytuple_from_wif
-from .bip32 import deserialize
+from .bip32 import BIP32Key, deserialize
 from .network import _CURVES, _NETWORKS, _P2PKH_PREFIXES, _P2SH_PREFIXES
 from .to_pubkey import to_pubkey_bytes
 from .utils import bytes_from_octets, hash160, sha256
@@ -32,12 +32,8 @@ def b58address_from_h160(prefix: bytes, h160: Octets) -> bytes:
     return b58encode(payload)
 
 
-def h160_from_b58address(b58addr: String) -> Tuple[bytes, bytes, str, bool]:
+def _h160_from_payload(payload: bytes) -> Tuple[bytes, bytes, str, bool]:
 
-    if isinstance(b58addr, str):
-        b58addr = b58addr.strip()
-
-    payload = b58decode(b58addr, 21)
     prefix = payload[0:1]
     if prefix in _P2PKH_PREFIXES:
         i = _P2PKH_PREFIXES.index(prefix)
@@ -51,6 +47,26 @@ def h160_from_b58address(b58addr: String) -> Tuple[bytes, bytes, str, bool]:
     return prefix, payload[1:], _NETWORKS[i], is_script_hash
 
 
+def h160_from_b58address(b58addr: String) -> Tuple[bytes, bytes, str, bool]:
+
+    if isinstance(b58addr, str):
+        b58addr = b58addr.strip()
+
+    payload = b58decode(b58addr, 21)
+    return _h160_from_payload(payload)
+
+
+def h160s_from_b58addresses(
+        b58addrs: Iterable[String]) -> List[Tuple[bytes, bytes, str, bool]]:
+    """Return (prefix, h160, network, is_script_hash) for each address.
+
+    It is equivalent to [h160_from_b58address(a) for a in b58addrs].
+    """
+
+    b58addrs = [a.strip() if isinstance(a, str) else a for a in b58addrs]
+    return [_h160_from_payload(p) for p in b58decode_many(b58addrs, 21)]
+
+
 def p2pkh(pubkey: PubKey, compressed: bool = True, network: str = 'mainnet') -> bytes:
     """Return the p2pkh address corresponding to a public key."""
 
@@ -75,7 +91,7 @@ def p2pkh_from_wif(wif: String) -> bytes:
     return p2pkh(pubkey, compressed, network)
 
 
-def p2pkh_from_xpub(d: Union[XkeyDict, String]) -> bytes:
+def p2pkh_from_xpub(d: BIP32Key) -> bytes:
     """Return the p2pkh address."""
     if not isinstance(d, dict):
         d = deserialize(d)
@@ -133,7 +149,7 @@ def p2wpkh_p2sh_from_wif(wif: String) -> bytes:
     return p2wpkh_p2sh(pubkey, network)
 
 
-def p2wpkh_p2sh_from_xpub(d: Union[XkeyDict, String]) -> bytes:
+def p2wpkh_p2sh_from_xpub(d: BIP32Key) -> bytes:
     """Return the p2wpkh-p2sh (base58 legacy) Segwit address."""
     if not isinstance(d, dict):
         d = deserialize(d)
@@ -11,7 +11,7 @@
 from typing import Optional, Tuple, TypedDict, Union
 
 from . import bip32
-from .alias import Octets, String, XkeyDict
+from .alias import Octets, String
 from .base58 import b58decode, b58encode
 from .curve import Curve
 from .curvemult import mult
@@ -22,7 +22,7 @@ from .secpoint import bytes_from_point, point_from_octets
 from .utils import bytes_from_octets
 
 
-def wif_from_xprv(xkey: Union[XkeyDict, String]) -> bytes:
+def wif_from_xprv(xkey: bip32.BIP32Key) -> bytes:
     """Return the WIF encoding of a BIP32 extended private key.
 
     The WIF is always of the compressed kind,
@@ -67,7 +67,7 @@ def wif_from_prvkey(prvkey: Union[int, Octets],
     return b58encode(payload)
 
 
-def prvkeytuple_from_xprvwif(xkeywif: Union[XkeyDict, String],
+def prvkeytuple_from_xprvwif(xkeywif: bip32.BIP32Key,
                              network: str = 'mainnet') -> Tuple[int, bool, str]:
     """Return a verified-as-valid private key tuple (prvkey, compressed, network).
 
@@ -112,7 +112,7 @@ def prvkeytuple_from_wif(wif: String) -> Tuple[int, bool, str]:
     return q, compressed, network
 
 
-def prvkeytuple_from_xprv(xkey: Union[XkeyDict, String]) -> Tuple[int, bool, str]:
+def prvkeytuple_from_xprv(xkey: bip32.BIP32Key) -> Tuple[int, bool, str]:
     """Return the (private key, compressed, network) tuple from a BIP32 xprv."""
 
     if not isinstance(xkey, dict):
@@ -43,55 +43,81 @@ with the following modifications:
 * interface mimics the native python3 base64 interface, i.e.
   it supports encoding bytes-like objects to ASCII bytes,
   and decoding ASCII bytes-like objects or ASCII strings to bytes.
+* table-driven checksum computation on bytes of 5-bit values,
+  with the checksum state after the expanded HRP being cached
 """
 
 
-from typing import Iterable, List, Tuple, Union
+from functools import lru_cache, reduce
+from operator import xor
+from typing import Iterable, Tuple
 
 from .alias import String
 
 __ALPHABET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
 
+# translation tables between 5-bit values and bech32 characters,
+# 0xFF marking invalid characters
+_ENCODE_TABLE = __ALPHABET.encode('ascii') + bytes(256 - 32)
+_DECODE_TABLE = bytes(__ALPHABET.find(chr(c)) & 0xff for c in range(256))
 
-def _polymod(values: Iterable[int]) -> int:
-    """Internal function that computes the bech32 checksum."""
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
-    chk = 1
+_GENERATOR = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+
+# generator contribution for each value of the 5 top bits of the state
+_POLYMOD_TABLE = [reduce(xor, (g for i, g in enumerate(_GENERATOR)
+                               if (top >> i) & 1), 0)
+                  for top in range(32)]
+
+
+def _polymod(values: Iterable[int], chk: int = 1) -> int:
+    """Internal function that computes the bech32 checksum.
+
+    The computation starts from the chk state,
+    allowing to resume it (e.g. after the expanded HRP).
+    """
+    table = _POLYMOD_TABLE
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = ((chk & 0x1ffffff) << 5) ^ value ^ table[chk >> 25]
     return chk
 
 
-def _hrp_expand(hrp: str) -> List[int]:
+def _hrp_expand(hrp: str) -> bytes:
     """Expand the HRP into values for checksum computation."""
-    return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
+    h = hrp.encode('ascii')
+    return bytes(x >> 5 for x in h) + b'\x00' + bytes(x & 31 for x in h)
 
 
-def _create_checksum(hrp: str, data: List[int]) -> List[int]:
+@lru_cache(maxsize=32)
+def _hrp_polymod(hrp: str) -> int:
+    """Return the checksum state after the expanded HRP."""
+    return _polymod(_hrp_expand(hrp))
+
+
+def _create_checksum(hrp: str, data: bytes) -> bytes:
     """Compute the checksum values given HRP and data."""
-    values = _hrp_expand(hrp) + data
-    polymod = _polymod(values + [0, 0, 0, 0, 0, 0]) ^ 1
-    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
-    return checksum
+    polymod = _polymod(data + bytes(6), _hrp_polymod(hrp)) ^ 1
+    return bytes((polymod >> 5 * (5 - i)) & 31 for i in range(6))
 
 
-def b32encode(hrp: str, data: List[int]) -> bytes:
+def b32encode(hrp: str, data: Iterable[int]) -> bytes:
     """Compute a bech32 string given HRP and data values."""
+    data = bytes(data)
+    if data and max(data) > 31:
+        raise ValueError(f"Invalid bech32 data value: {max(data)}")
     combined = data + _create_checksum(hrp, data)
-    s = hrp + '1' + ''.join([__ALPHABET[d] for d in combined])
-    return s.encode('ascii')
+    return hrp.encode('ascii') + b'1' + combined.translate(_ENCODE_TABLE)
 
 
-def _verify_checksum(hrp: str, data: List[int]) -> bool:
+def _verify_checksum(hrp: str, data: bytes) -> bool:
     """Verify a checksum given HRP and converted data characters."""
-    return _polymod(_hrp_expand(hrp) + data) == 1
+    return _polymod(data, _hrp_polymod(hrp)) == 1
+
 
+def b32decode(bech: String) -> Tuple[str, bytes]:
+    """Validate a bech32 string, and determine HRP and data.
 
-def b32decode(bech: String) -> Tuple[str, List[int]]:
-    """Validate a bech32 string, and determine HRP and data."""
+    Data values are returned as bytes, one byte for each 5-bit value.
+    """
 
     if isinstance(bech, str):
         bech = bech.strip()
@@ -99,7 +125,7 @@ def b32decode(bech: String) -> Tuple[str, List[int]]:
     if isinstance(bech, bytes):
         bech = bech.decode("ascii")
 
-    if any(ord(x) < 48 or ord(x) > 122 for x in bech):
+    if bech and (min(bech) < '0' or max(bech) > 'z'):
         msg = "Bech32 string contains ASCII characters outside [48-122]"
         raise ValueError(msg)
     if bech.lower() != bech and bech.upper() != bech:
@@ -121,10 +147,10 @@ def b32decode(bech: String) -> Tuple[str, List[int]]:
 
     hrp = bech[:pos]
 
-    if not all(x in __ALPHABET for x in bech[pos+1:]):
+    data = bech[pos+1:].encode('ascii').translate(_DECODE_TABLE)
+    if b'\xff' in data:
         msg = "Bech32 string data part contains invalid characters"
         raise ValueError(msg)
-    data = [__ALPHABET.find(x) for x in bech[pos+1:]]
 
     if _verify_checksum(hrp, data):
         return hrp, data[:-6]
@@ -39,15 +39,17 @@ with the following modifications:
 * detailed error messages and exteded safety checks
 * check that bech32 addresses are not longer than 90 characters
   (as this is not enforced by bech32.b32decode anymore)
+* bytes to/from 5-bit values conversion of the witness program
+  through big ints, instead of the per-value accumulator loop
 """
 
 
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, List, Tuple
 
-from .alias import Octets, PubKey, String, XkeyDict
+from .alias import Octets, PubKey, String
 from .base58wif import _pubkeytuple_from_wif
 from .bech32 import b32decode, b32encode
-from .bip32 import deserialize
+from .bip32 import BIP32Key, deserialize
 from .to_pubkey import to_pubkey_bytes
 from .network import _CURVES, _NETWORKS, _P2W_PREFIXES
 from .utils import bytes_from_octets, hash160, sha256
@@ -94,6 +96,49 @@ def _convertbits(data: Iterable[int], frombits: int,
     return ret
 
 
+# 10-bit values as pairs of 5-bit values
+_QUINTET_PAIRS = [bytes([i >> 5, i & 31]) for i in range(1024)]
+# 5-bit values as base32 digits, for int() conversion
+_BASE32_DIGITS = b'0123456789abcdefghijklmnopqrstuv' + bytes(256 - 32)
+
+
+def _b32_from_bytes(data: bytes) -> bytes:
+    """Regroup bytes into 5-bit values, zero padding the last one.
+
+    It is equivalent to bytes(_convertbits(data, 8, 5)),
+    converting all bytes at once through a big int,
+    then splitting it into pairs of 5-bit values.
+    """
+    n = len(data)
+    nvalues = (8 * n + 4) // 5
+    nbits = 10 * ((nvalues + 1) // 2)
+    i = int.from_bytes(data, 'big') << (nbits - 8 * n)
+    pairs = _QUINTET_PAIRS
+    result = [pairs[(i >> shift) & 0x3ff]
+              for shift in range(nbits - 10, -1, -10)]
+    return b''.join(result)[:nvalues]
+
+
+def _bytes_from_b32(data: bytes) -> bytes:
+    """Regroup 5-bit values into bytes, rejecting invalid padding.
+
+    It is equivalent to bytes(_convertbits(data, 5, 8, False)),
+    converting all values at once through a big int.
+    """
+    nbits = 5 * len(data)
+    pad = nbits % 8
+    if pad >= 5:
+        raise ValueError(f"invalid padding ({pad} bits)")
+    if not data:
+        return b''
+    if max(data) > 31:
+        raise ValueError(f"invalid value {max(data)}")
+    i = int(data.translate(_BASE32_DIGITS), 32)
+    if i & ((1 << pad) - 1):
+        raise ValueError("non-zero padding")
+    return (i >> pad).to_bytes(nbits // 8, 'big')
+
+
 def _check_witness(witvers: int, witprog: bytes):
     l = len(witprog)
     if witvers == 0:
@@ -116,10 +161,27 @@ def b32address_from_witness(wv: int, wp: Octets, network: str = 'mainnet') -> by
     wp = bytes_from_octets(wp)
     _check_witness(wv, wp)
     hrp = _P2W_PREFIXES[_NETWORKS.index(network)]
-    ret = b32encode(hrp, [wv] + _convertbits(wp, 8, 5))
+    ret = b32encode(hrp, bytes([wv]) + _b32_from_bytes(wp))
     return ret
 
 
+def b32addresses_from_witnesses(witnesses: Iterable[Tuple[int, Octets]],
+                                network: str = 'mainnet') -> List[bytes]:
+    """Encode multiple bech32 native SegWit addresses.
+
+    It is equivalent to
+    [b32address_from_witness(wv, wp, network) for wv, wp in witnesses].
+    """
+
+    hrp = _P2W_PREFIXES[_NETWORKS.index(network)]
+    result = []
+    for wv, wp in witnesses:
+        wp = bytes_from_octets(wp)
+        _check_witness(wv, wp)
+        result.append(b32encode(hrp, bytes([wv]) + _b32_from_bytes(wp)))
+    return result
+
+
 def witness_from_b32address(b32addr: String) -> Tuple[int, bytes, str, bool]:
     """Decode a bech32 native SegWit address."""
 
@@ -140,15 +202,15 @@ def witness_from_b32address(b32addr: String) -> Tuple[int, bytes, str, bool]:
         raise ValueError(f"Bech32 address with empty data")
 
     witvers = data[0]
-    witprog = _convertbits(data[1:], 5, 8, False)
-    _check_witness(witvers, bytes(witprog))
+    witprog = _bytes_from_b32(data[1:])
+    _check_witness(witvers, witprog)
 
     if len(witprog) == 20:
         is_script_hash = False
     else:
         is_script_hash = True
 
-    return witvers, bytes(witprog), _NETWORKS[i], is_script_hash
+    return witvers, witprog, _NETWORKS[i], is_script_hash
 
 
 def p2wpkh(pubkey: PubKey, network: str = 'mainnet') -> bytes:
@@ -168,7 +230,7 @@ def p2wpkh_from_wif(wif: String) -> bytes:
     return p2wpkh(pubkey, network)
 
 
-def p2wpkh_from_xpub(d: Union[XkeyDict, String]) -> bytes:
+def p2wpkh_from_xpub(d: BIP32Key) -> bytes:
     """Return the p2wpkh (native SegWit) address."""
     if not isinstance(d, dict):
         d = deserialize(d)
@@ -30,16 +30,29 @@ A BIP32 extended key is 78 bytes:
 - [ 9:13] index
 - [13:45] chain code
 - [45:78] compressed pubkey or [0x00][prvkey]
+
+Derived extended keys, private ones included, are kept in a
+module-level LRU cache of up to 4096 nodes (enabled by default and
+shared among threads), so that common path prefixes are derived
+only once: use derivation_cache_resize(0) to disable it and
+derivation_cache_clear(unpin=True) to drop the cached keys.
 """
 
 import copy
 import hmac
-from typing import Iterable, List, Tuple, TypedDict, Union
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import (Dict, Iterable, Iterator, List, NamedTuple, Optional,
+                    Sequence, Tuple, TypedDict, Union)
 
 from . import bip39, electrum
-from .alias import INF, Octets, Path, Point, String, XkeyDict
+from .alias import INF, Octets
+from .alias import Path as PathLike
+from .alias import Point, String, XkeyDict
 from .base58 import b58decode, b58encode
-from .curvemult import mult
+from .curve import _jac_from_aff
+from .curvemult import _generator_table, _mult_fixed
 from .curves import secp256k1 as ec
 from .mnemonic import Mnemonic
 from .network import (_NETWORKS, _P2WPKH_P2SH_PRV_PREFIXES,
@@ -53,7 +66,7 @@ from .network import (_NETWORKS, _P2WPKH_P2SH_PRV_PREFIXES,
                       TEST_tprv, TEST_tpub, TEST_uprv, TEST_Uprv, TEST_upub,
                       TEST_Upub, TEST_vprv, TEST_Vprv, TEST_vpub, TEST_Vpub)
 from .secpoint import bytes_from_point, point_from_octets
-from .utils import bytes_from_octets, hash160
+from .utils import bytes_from_octets, hash160, stream_map
 
 
 def _check_version_key(v: bytes, k: bytes) -> None:
@@ -85,7 +98,10 @@ def _check_depth_pfp_index(d: int, pfp: bytes, i: bytes) -> None:
             raise ValueError(m)
 
 
-def deserialize(xkey: Octets) -> XkeyDict:
+def deserialize(xkey: Union[Octets, "ExtendedKey"]) -> XkeyDict:
+
+    if isinstance(xkey, ExtendedKey):
+        return xkey.to_dict()
 
     if isinstance(xkey, str):
         xkey = xkey.strip()
@@ -123,7 +139,10 @@ def deserialize(xkey: Octets) -> XkeyDict:
     return d
 
 
-def serialize(d: XkeyDict) -> bytes:
+def serialize(d: Union[XkeyDict, "ExtendedKey"]) -> bytes:
+
+    if isinstance(d, ExtendedKey):
+        return d.serialize()
 
     if len(d['key']) != 33:
         m = f"Invalid {len(d['key'])}-bytes BIP32 'key' length"
@@ -158,18 +177,9 @@ def serialize(d: XkeyDict) -> bytes:
     return b58encode(t)
 
 
-def fingerprint(d: Union[XkeyDict, String]) -> bytes:
+def fingerprint(d: "BIP32Key") -> bytes:
 
-    if not isinstance(d, dict):
-        d = deserialize(d)
-
-    if d['key'][0] == 0:
-        P = mult(d['q'])
-        pubkey = bytes_from_point(P, True, ec)
-        return hash160(pubkey)[:4]
-
-    # must be a public key
-    return hash160(d['key'])[:4]
+    return ExtendedKey.from_xkey(d).fingerprint
 
 
 def rootxprv_from_seed(seed: Octets, version: Octets = MAIN_xprv) -> bytes:
@@ -206,18 +216,10 @@ def rootxprv_from_bip39mnemonic(mnemonic: Mnemonic,
     return rootxprv_from_seed(seed, version)
 
 
-def masterxprv_from_electrummnemonic(mnemonic: Mnemonic,
-                                     passphrase: str = "",
-                                     network: str = 'mainnet') -> bytes:
-    """Return BIP32 master extended private key from Electrum mnemonic.
-
-    Note that for a 'standard' mnemonic the derivation path is "m",
-    for a 'segwit' mnemonic it is "m/0h" instead.
-    """
+def _masterxprv_from_electrumseed(version: str, seed: bytes,
+                                  network: str) -> bytes:
 
-    version, seed = electrum._seed_from_mnemonic(mnemonic, passphrase)
     prefix = _NETWORKS.index(network)
-
     if version == 'standard':
         xversion = _XPRV_PREFIXES[prefix]
         return rootxprv_from_seed(seed, xversion)
@@ -229,60 +231,85 @@ def masterxprv_from_electrummnemonic(mnemonic: Mnemonic,
         raise ValueError(f"Unmanaged electrum mnemonic version ({version})")
 
 
-def xpub_from_xprv(d: Union[XkeyDict, String]) -> bytes:
-    """Neutered Derivation (ND).
+def masterxprv_from_electrummnemonic(mnemonic: Mnemonic,
+                                     passphrase: str = "",
+                                     network: str = 'mainnet') -> bytes:
+    """Return BIP32 master extended private key from Electrum mnemonic.
 
-    Derivation of the extended public key corresponding to an extended
-    private key (“neutered” as it removes the ability to sign transactions).
+    Note that for a 'standard' mnemonic the derivation path is "m",
+    for a 'segwit' mnemonic it is "m/0h" instead.
     """
 
-    if isinstance(d, dict):
-        d = copy.copy(d)
-    else:
-        d = deserialize(d)
+    version, seed = electrum._seed_from_mnemonic(mnemonic, passphrase)
+    return _masterxprv_from_electrumseed(version, seed, network)
 
-    if d['key'][0] != 0:
-        raise ValueError("extended key is not a private one")
 
-    d['Q'] = mult(d['q'])
-    d['key'] = bytes_from_point(d['Q'], True, ec)
-    d['q'] = 0
-    d['version'] = _PUB_VERSIONS[_PRV_VERSIONS.index(d['version'])]
+# (mnemonic, seed, root/master extended private key)
+SeedResult = Tuple[Mnemonic, bytes, bytes]
 
-    return serialize(d)
 
+def _bip39_worker(args: Tuple[Mnemonic, str, Octets]) -> SeedResult:
+    mnemonic, passphrase, version = args
+    seed = bip39.seed_from_mnemonic(mnemonic, passphrase)
+    return mnemonic, seed, rootxprv_from_seed(seed, version)
 
-def _ckd(d: XkeyDict, index: bytes) -> None:
 
-    # d is a prvkey
-    if d['key'][0] == 0:
-        d['depth'] += 1
-        Pbytes = bytes_from_point(mult(d['q']), True, ec)
-        d['parent_fingerprint'] = hash160(Pbytes)[:4]
-        d['index'] = index
-        if index[0] >= 0x80:  # hardened derivation
-            h = hmac.digest(d['chain_code'], d['key'] + index, 'sha512')
-        else:                 # normal derivation
-            h = hmac.digest(d['chain_code'], Pbytes + index, 'sha512')
-        d['chain_code'] = h[32:]
-        offset = int.from_bytes(h[:32], byteorder='big')
-        d['q'] = (d['q'] + offset) % ec.n
-        d['key'] = b'\x00' + d['q'].to_bytes(32, 'big')
-        d['Q'] = INF
-    # d is a pubkey
-    else:
-        if index[0] >= 0x80:
-            raise ValueError("hardened derivation from pubkey is impossible")
-        d['depth'] += 1
-        d['parent_fingerprint'] = hash160(d['key'])[:4]
-        d['index'] = index
-        h = hmac.digest(d['chain_code'], d['key'] + index, 'sha512')
-        d['chain_code'] = h[32:]
-        offset = int.from_bytes(h[:32], byteorder='big')
-        Offset = mult(offset)
-        d['Q'] = ec.add(d['Q'], Offset)
-        d['key'] = bytes_from_point(d['Q'], True, ec)
-        d['q'] = 0
+def _electrum_worker(args: Tuple[Mnemonic, str, str]) -> SeedResult:
+    mnemonic, passphrase, network = args
+    version, seed = electrum._seed_from_mnemonic(mnemonic, passphrase)
+    return mnemonic, seed, _masterxprv_from_electrumseed(version, seed, network)
+
+
+def rootxprvs_from_bip39mnemonics(mnemonics: Iterable[Mnemonic],
+                                  passphrase: str = "",
+                                  version: Octets = MAIN_xprv,
+                                  max_workers: Optional[int] = None,
+                                  threads: bool = False
+                                  ) -> Iterator[SeedResult]:
+    """Yield (mnemonic, seed, root xprv) for BIP39 mnemonics.
+
+    The PBKDF2 seed computations are distributed over a pool of
+    max_workers processes (threads, if threads is True, as hashlib
+    releases the GIL); if max_workers is 1, they are performed
+    in the current process.
+    Results are yielded in the input order, as soon as available;
+    the input iterable is consumed lazily.
+    """
+
+    args = ((mnemonic, passphrase, version) for mnemonic in mnemonics)
+    return stream_map(_bip39_worker, args, max_workers, threads)
+
+
+def masterxprvs_from_electrummnemonics(mnemonics: Iterable[Mnemonic],
+                                       passphrase: str = "",
+                                       network: str = 'mainnet',
+                                       max_workers: Optional[int] = None,
+                                       threads: bool = False
+                                       ) -> Iterator[SeedResult]:
+    """Yield (mnemonic, seed, master xprv) for Electrum mnemonics.
+
+    The seed computations are distributed over a pool of
+    max_workers processes (threads, if threads is True, as hashlib
+    releases the GIL); if max_workers is 1, they are performed
+    in the current process.
+    Results are yielded in the input order, as soon as available;
+    the input iterable is consumed lazily.
+
+    See also masterxprv_from_electrummnemonic.
+    """
+
+    args = ((mnemonic, passphrase, network) for mnemonic in mnemonics)
+    return stream_map(_electrum_worker, args, max_workers, threads)
+
+
+def xpub_from_xprv(d: "BIP32Key") -> bytes:
+    """Neutered Derivation (ND).
+
+    Derivation of the extended public key corresponding to an extended
+    private key (“neutered” as it removes the ability to sign transactions).
+    """
+
+    return ExtendedKey.from_xkey(d).xpub().serialize()
 
 
 def _indexes_from_path(path: str) -> Tuple[List[bytes], bool]:
@@ -312,27 +339,115 @@ def _indexes_from_path(path: str) -> Tuple[List[bytes], bool]:
     return indexes, absolute
 
 
-def derive(d: Union[XkeyDict, String], path: Path) -> bytes:
-    """Derive an extended key across a path spanning multiple depth levels.
+def _mult_base(m: int) -> Point:
+    # m*G using the precomputed fixed-base table of the generator
+    return ec._aff_from_jac(_mult_fixed(m, _generator_table(ec), ec))
 
-    Derivation is according to:
-    
-    - absolute path as "m/44h/0'/1H/0/10" string
-    - relative path as "./0/10" string
-    - relative path as iterable integer indexes
-    - relative one level child derivation with single integer index
-    - relative one level child derivation with single 4-bytes index
-    """
 
-    if isinstance(d, dict):
-        d = copy.copy(d)
-    else:
-        d = deserialize(d)
+@lru_cache(maxsize=1024)
+def _compiled_path(path: str) -> Tuple[Tuple[bytes, ...], bool]:
+    # parsed (indexes, absolute) of a derivation path string
+    indexes, absolute = _indexes_from_path(path.strip())
+    return tuple(indexes), absolute
+
+
+def _index_from_step(step: Union[int, bytes, str]) -> bytes:
+    # 4-bytes index from an integer, a 4-bytes index, or a "44h" string
+
+    if isinstance(step, int):
+        if not 0 <= step <= 0xffffffff:
+            raise ValueError(f"Invalid index: {step}")
+        return step.to_bytes(4, byteorder='big')
+    if isinstance(step, bytes):
+        if len(step) != 4:
+            raise ValueError(f"Index must be 4-bytes, not {len(step)}")
+        return step
+    indexes, _ = _compiled_path("./" + step.strip())
+    if len(indexes) != 1:
+        raise ValueError(f"Invalid derivation path step: {step}")
+    return indexes[0]
 
-    if isinstance(path, str):
-        path = path.strip()
-        indexes, absolute = _indexes_from_path(path)
-        if absolute and d["depth"] != 0:
+
+class Path:
+    """Compiled BIP32 derivation path.
+
+    The path is parsed and validated only once: string parsing results
+    are cached, so that equal path strings share the same indexes tuple.
+    Child paths are obtained as path / i, where i is an integer,
+    a 4-bytes index, or a step string like "44h",
+    without any further parsing of the parent path.
+
+    Path instances are accepted by derive and by ExtendedKey.derive:
+    e.g. Path("m/44h/0h/0h") / 0 / i is the i-th receive address path
+    of the first BIP44 account.
+    """
+
+    __slots__ = ('indexes', 'absolute')
+
+    def __init__(self, path: Union[str, Iterable[int]] = ".") -> None:
+        if isinstance(path, str):
+            self.indexes, self.absolute = _compiled_path(path)
+        else:
+            self.indexes = tuple(_index_from_step(i) for i in path)
+            self.absolute = False
+            if len(self.indexes) > 255:
+                m = f'Derivation path depth {len(self.indexes)}>255'
+                raise ValueError(m)
+
+    @classmethod
+    def _from_indexes(cls, indexes: Tuple[bytes, ...],
+                      absolute: bool) -> "Path":
+        result = cls.__new__(cls)
+        result.indexes = indexes
+        result.absolute = absolute
+        return result
+
+    def __truediv__(self, step: Union[int, bytes, str]) -> "Path":
+        if len(self.indexes) == 255:
+            raise ValueError('Derivation path depth 256>255')
+        indexes = self.indexes + (_index_from_step(step),)
+        return Path._from_indexes(indexes, self.absolute)
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Path):
+            return NotImplemented
+        return (self.indexes, self.absolute) == (other.indexes, other.absolute)
+
+    def __hash__(self) -> int:
+        return hash((self.indexes, self.absolute))
+
+    def __str__(self) -> str:
+        steps = ['m' if self.absolute else '.']
+        for index in self.indexes:
+            i = int.from_bytes(index, 'big')
+            if i >= 0x80000000:
+                steps.append(f"{i - 0x80000000}h")
+            else:
+                steps.append(str(i))
+        return '/'.join(steps)
+
+    def __repr__(self) -> str:
+        return f"Path('{self}')"
+
+
+# derivation path: compiled Path, string, integer indexes, or single index
+BIP32Path = Union[PathLike, Path]
+
+
+def _indexes_from_any_path(path: BIP32Path, depth: int) -> Sequence[bytes]:
+
+    indexes: Sequence[bytes]
+    if isinstance(path, Path):
+        indexes = path.indexes
+        if path.absolute and depth != 0:
+            msg = "Absolute derivation path for non-root master key"
+            raise ValueError(msg)
+    elif isinstance(path, str):
+        indexes, absolute = _compiled_path(path)
+        if absolute and depth != 0:
             msg = "Absolute derivation path for non-root master key"
             raise ValueError(msg)
     elif isinstance(path, int):
@@ -344,18 +459,355 @@ def derive(d: Union[XkeyDict, String], path: Path) -> bytes:
     else:
         indexes = [i.to_bytes(4, byteorder='big') for i in path]
 
-    final_depth = d["depth"] + len(indexes)
+    final_depth = depth + len(indexes)
     if final_depth > 255:
         raise ValueError(f'Derivation path final depth {final_depth}>255')
 
-    for index in indexes:
-        _ckd(d, index)
+    return indexes
 
-    return serialize(d)
+
+class ExtendedKey:
+    """BIP32 extended key, serialized only when required.
+
+    It is an alternative to XkeyDict and to the base58 serialization,
+    accepted wherever they are: as derivations return new ExtendedKey
+    instances, multi-step derivations never need base58 encoding
+    and decoding.
+    The public key point, the fingerprint, and the serialization
+    are computed at most once and then cached:
+    instances must be considered immutable.
+
+    The public key point of a private key is computed only if needed
+    (e.g. not for hardened derivation), with a single fixed-base
+    multiplication: deriving a private path costs at most
+    one multiplication per level.
+    """
+
+    __slots__ = ('version', 'depth', 'parent_fingerprint', 'index',
+                 'chain_code', 'key', 'q', 'network',
+                 '_Q', '_fingerprint', '_serialized')
+
+    def __init__(self, version: bytes, depth: int, parent_fingerprint: bytes,
+                 index: bytes, chain_code: bytes, key: bytes,
+                 q: int = 0, Q: Optional[Point] = None,
+                 network: str = '') -> None:
+        self.version = version
+        self.depth = depth
+        self.parent_fingerprint = parent_fingerprint
+        self.index = index
+        self.chain_code = chain_code
+        self.key = key
+        self.q = q  # non-zero for private key only
+        self.network = network
+        self._Q = Q
+        self._fingerprint: Optional[bytes] = None
+        self._serialized: Optional[bytes] = None
+
+    @classmethod
+    def from_xkey(cls, xkey: "BIP32Key") -> "ExtendedKey":
+        """Return an ExtendedKey from any BIP32 key representation."""
+
+        if isinstance(xkey, ExtendedKey):
+            return xkey
+        serialized: Optional[bytes] = None
+        if isinstance(xkey, dict):
+            d = xkey
+        else:
+            d = deserialize(xkey)
+            if isinstance(xkey, str):
+                xkey = xkey.strip().encode('ascii')
+            # a copy: do not keep a reference to a mutable caller object
+            serialized = bytes(xkey)
+        is_prv = d['key'][0] == 0
+        Q = None if is_prv or d['Q'][1] == 0 else d['Q']
+        result = cls(d['version'], d['depth'], d['parent_fingerprint'],
+                     d['index'], d['chain_code'], d['key'],
+                     d['q'] if is_prv else 0, Q, d['network'])
+        result._serialized = serialized
+        return result
+
+    @property
+    def is_private(self) -> bool:
+        return self.key[0] == 0
+
+    @property
+    def Q(self) -> Point:
+        """Return the public key point, also for private keys."""
+        if self._Q is None:
+            if self.is_private:
+                self._Q = _mult_base(self.q)
+            else:
+                self._Q = point_from_octets(self.key, ec)
+        return self._Q
+
+    @property
+    def pubkey(self) -> bytes:
+        """Return the compressed public key, also for private keys."""
+        if self.is_private:
+            return bytes_from_point(self.Q, True, ec)
+        return self.key
+
+    @property
+    def fingerprint(self) -> bytes:
+        if self._fingerprint is None:
+            self._fingerprint = hash160(self.pubkey)[:4]
+        return self._fingerprint
+
+    def to_dict(self) -> XkeyDict:
+        """Return the equivalent XkeyDict."""
+        return {
+            'version'            : self.version,
+            'depth'              : self.depth,
+            'parent_fingerprint' : self.parent_fingerprint,
+            'index'              : self.index,
+            'chain_code'         : self.chain_code,
+            'key'                : self.key,
+            'q'                  : self.q,
+            'Q'                  : INF if self.is_private else self.Q,
+            'network'            : self.network
+        }
+
+    def serialize(self) -> bytes:
+        """Return the base58 serialization, computed only once."""
+        if self._serialized is None:
+            self._serialized = serialize(self.to_dict())
+        return self._serialized
+
+    def xpub(self) -> "ExtendedKey":
+        """Neutered Derivation (ND), see xpub_from_xprv."""
+
+        if not self.is_private:
+            raise ValueError("extended key is not a private one")
+        version = _PUB_VERSIONS[_PRV_VERSIONS.index(self.version)]
+        result = ExtendedKey(version, self.depth, self.parent_fingerprint,
+                             self.index, self.chain_code, self.pubkey,
+                             0, self.Q, self.network)
+        result._fingerprint = self._fingerprint
+        return result
+
+    def ckd(self, index: bytes) -> "ExtendedKey":
+        """Child Key Derivation (CKD) at the given 4-bytes index."""
+
+        if self.is_private:
+            if index[0] >= 0x80:  # hardened derivation
+                h = hmac.digest(self.chain_code, self.key + index, 'sha512')
+            else:                 # normal derivation
+                h = hmac.digest(self.chain_code, self.pubkey + index, 'sha512')
+            offset = int.from_bytes(h[:32], byteorder='big')
+            q = (self.q + offset) % ec.n
+            key = b'\x00' + q.to_bytes(32, 'big')
+            Q = None
+        else:
+            if index[0] >= 0x80:
+                raise ValueError("hardened derivation from pubkey is impossible")
+            h = hmac.digest(self.chain_code, self.key + index, 'sha512')
+            offset = int.from_bytes(h[:32], byteorder='big')
+            OffsetJ = _mult_fixed(offset, _generator_table(ec), ec)
+            Q = ec._aff_from_jac(ec._add_jac(_jac_from_aff(self.Q), OffsetJ))
+            key = bytes_from_point(Q, True, ec)
+            q = 0
+        return ExtendedKey(self.version, self.depth + 1, self.fingerprint,
+                           index, h[32:], key, q, Q, self.network)
+
+    def derive(self, path: BIP32Path) -> "ExtendedKey":
+        """Derive an extended key across a path, see derive.
+
+        Intermediate nodes are served by (and stored in)
+        the module derivation cache.
+        """
+
+        result = self
+        for index in _indexes_from_any_path(path, self.depth):
+            result = _DERIVATION_CACHE.ckd(result, index)
+        return result
+
+
+# BIP32 extended key: ExtendedKey, XkeyDict, or base58 serialization
+BIP32Key = Union[XkeyDict, String, ExtendedKey]
+
+
+# (version, depth, chain_code, key) of the parent, child index
+_NodeId = Tuple[bytes, int, bytes, bytes, bytes]
+
+
+class DerivationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    pinned: int
+
+
+class _DerivationCache:
+    # LRU cache of derived nodes, plus permanently pinned ones;
+    # a lock guards lookup, insertion and eviction,
+    # as derivations may run on thread pools
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.nodes: "OrderedDict[_NodeId, ExtendedKey]" = OrderedDict()
+        self.pinned: Dict[_NodeId, ExtendedKey] = dict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def ckd(self, parent: ExtendedKey, index: bytes,
+            pin: bool = False) -> ExtendedKey:
+        node_id = (parent.version, parent.depth,
+                   parent.chain_code, parent.key, index)
+        with self.lock:
+            child = self.pinned.get(node_id)
+            if child is None:
+                child = self.nodes.pop(node_id, None)
+                if child is not None:
+                    # most recently used
+                    self.nodes[node_id] = child
+            if child is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if child is None:
+            # computed outside the lock
+            child = parent.ckd(index)
+            with self.lock:
+                if not pin and self.maxsize > 0:
+                    self.nodes[node_id] = child
+                    while len(self.nodes) > self.maxsize:
+                        self.nodes.popitem(last=False)
+        if pin:
+            with self.lock:
+                self.nodes.pop(node_id, None)
+                self.pinned[node_id] = child
+        return child
+
+    def clear(self, unpin: bool) -> None:
+        with self.lock:
+            self.nodes.clear()
+            self.hits = 0
+            self.misses = 0
+            if unpin:
+                self.pinned.clear()
+
+
+_DERIVATION_CACHE_SIZE = 4096
+_DERIVATION_CACHE = _DerivationCache(_DERIVATION_CACHE_SIZE)
+
+
+def derivation_cache_resize(maxsize: int = _DERIVATION_CACHE_SIZE) -> None:
+    """Resize (and clear) the LRU cache of derived nodes.
+
+    The maxsize bound is the number of cached nodes, pinned excluded;
+    a maxsize of 0 disables the LRU cache. Pinned nodes are kept.
+    """
+    if maxsize < 0:
+        raise ValueError(f"Negative cache size ({maxsize})")
+    with _DERIVATION_CACHE.lock:
+        _DERIVATION_CACHE.maxsize = maxsize
+    derivation_cache_clear()
+
+
+def derivation_cache_info() -> DerivationCacheInfo:
+    """Return the derivation cache statistics."""
+    with _DERIVATION_CACHE.lock:
+        return DerivationCacheInfo(_DERIVATION_CACHE.hits,
+                                   _DERIVATION_CACHE.misses,
+                                   _DERIVATION_CACHE.maxsize,
+                                   len(_DERIVATION_CACHE.nodes),
+                                   len(_DERIVATION_CACHE.pinned))
+
+
+def derivation_cache_clear(unpin: bool = False) -> None:
+    """Clear the derivation cache and its statistics.
+
+    Pinned nodes are kept, unless unpin is True.
+    """
+    _DERIVATION_CACHE.clear(unpin)
 
 
-def crack_prvkey(parent_xpub: Union[XkeyDict, String],
-                 child_xprv: Union[XkeyDict, String]) -> bytes:
+def derivation_cache_pin(d: BIP32Key, path: BIP32Path) -> ExtendedKey:
+    """Derive an extended key, permanently caching all the path nodes.
+
+    Pinning e.g. the account-level "m/84h/0h/0h" nodes, later
+    derivations of "m/84h/0h/0h/0/i" only compute the last two steps.
+    """
+
+    result = ExtendedKey.from_xkey(d)
+    for index in _indexes_from_any_path(path, result.depth):
+        result = _DERIVATION_CACHE.ckd(result, index, True)
+    return result
+
+
+def derive(d: BIP32Key, path: BIP32Path) -> bytes:
+    """Derive an extended key across a path spanning multiple depth levels.
+
+    Derivation is according to:
+
+    - absolute path as "m/44h/0'/1H/0/10" string
+    - relative path as "./0/10" string
+    - relative path as iterable integer indexes
+    - relative one level child derivation with single integer index
+    - relative one level child derivation with single 4-bytes index
+    - compiled Path object, parsed only once
+
+    Use ExtendedKey.derive to avoid the base58 serialization
+    of the derived key.
+
+    Intermediate and derived nodes, private keys included, are kept
+    in the module derivation cache: see derivation_cache_resize
+    and derivation_cache_clear.
+    """
+
+    return ExtendedKey.from_xkey(d).derive(path).serialize()
+
+
+# number of children sharing a single modular inversion in derive_range
+_RANGE_CHUNK = 256
+
+
+def derive_range(xpub: BIP32Key, start: int, count: int,
+                 pubkeys: bool = False) -> Iterator[bytes]:
+    """Yield the children of an extended public key in an index range.
+
+    Yield the serialized extended public keys (or the compressed
+    public keys, if pubkeys is True) for the non-hardened
+    indexes in [start, start+count).
+
+    The offset*G multiplications use the fixed-base table of the
+    generator, the additions are performed in Jacobian coordinates, and
+    each chunk of child points is converted to affine coordinates
+    with a single modular inversion.
+    """
+
+    xkey = ExtendedKey.from_xkey(xpub)
+    if xkey.is_private:
+        raise ValueError("extended key is not a public one")
+    if start < 0 or count < 0 or start + count > 0x80000000:
+        m = f"Invalid non-hardened index range [{start}, {start+count})"
+        raise ValueError(m)
+    if xkey.depth == 255:
+        raise ValueError(f'Derivation path final depth {xkey.depth+1}>255')
+
+    T = _generator_table(ec)
+    QJ = _jac_from_aff(xkey.Q)
+    for chunk_start in range(start, start + count, _RANGE_CHUNK):
+        chunk_end = min(chunk_start + _RANGE_CHUNK, start + count)
+        indexes = [i.to_bytes(4, 'big') for i in range(chunk_start, chunk_end)]
+        hs = [hmac.digest(xkey.chain_code, xkey.key + index, 'sha512')
+              for index in indexes]
+        QJs = [ec._add_jac(QJ, _mult_fixed(int.from_bytes(h[:32], 'big'), T, ec))
+               for h in hs]
+        for index, h, Q in zip(indexes, hs, ec._aff_from_jac_batch(QJs)):
+            key = bytes_from_point(Q, True, ec)
+            if pubkeys:
+                yield key
+            else:
+                child = ExtendedKey(xkey.version, xkey.depth + 1,
+                                    xkey.fingerprint, index, h[32:], key,
+                                    0, Q, xkey.network)
+                yield child.serialize()
+
+
+def crack_prvkey(parent_xpub: BIP32Key, child_xprv: BIP32Key) -> bytes:
 
     if isinstance(parent_xpub, dict):
         p = copy.copy(parent_xpub)
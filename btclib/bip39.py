@@ -39,13 +39,33 @@ Checksummed entropy (**ENT+CS**) is converted from/to mnemonic.
 from hashlib import pbkdf2_hmac, sha256
 
 from .alias import Octets
-from .entropy import BinStr, Entropy, _bits, binstr_from_entropy
-from .mnemonic import (Mnemonic, _entropy_from_indexes, _indexes_from_entropy,
-                       _indexes_from_mnemonic, _mnemonic_from_indexes)
+from .entropy import (BinStr, Entropy, IntEntropy, _binstr_from_int, _bits,
+                      _bits_slice, _int_from_entropy)
+from .mnemonic import (Mnemonic, _indexes_from_int_entropy,
+                       _indexes_from_mnemonic, _int_entropy_from_indexes,
+                       _mnemonic_from_indexes)
 
 _words = tuple(b // 32 * 3 for b in _bits)
 
 
+def _int_entropy_checksum(entropy: IntEntropy) -> int:
+    """Return the checksum of the (int, bit length) input entropy.
+
+    Entropy must be 128, 160, 192, 224, or 256 bits;
+    the checksum is made of its bit length / 32 bits.
+    """
+
+    int_entropy, nbits = entropy
+    if nbits not in _bits:
+        msg = f"Invalid number of bits ({nbits}) for BIP39 entropy; "
+        msg += f"must be in {_bits}"
+        raise ValueError(msg)
+    bytes_entropy = int_entropy.to_bytes(nbits // 8, 'big')
+    # leftmost bits of the 256-bit checksum
+    checksum_bits = nbits // 32
+    return sha256(bytes_entropy).digest()[0] >> (8 - checksum_bits)
+
+
 def _entropy_checksum(binstr_entropy: BinStr) -> BinStr:
     """Return the checksum of the binary string input entropy.
 
@@ -55,24 +75,8 @@ def _entropy_checksum(binstr_entropy: BinStr) -> BinStr:
     """
 
     nbits = len(binstr_entropy)
-    int_entropy = int(binstr_entropy, 2)
-    if nbits not in _bits:
-        msg = f"Invalid number of bits ({nbits}) for BIP39 entropy; "
-        msg += f"must be in {_bits}"
-        raise ValueError(msg)
-    nbytes = (nbits+7)//8
-    bytes_entropy = int_entropy.to_bytes(nbytes, 'big')
-
-    # 256-bit checksum
-    byteschecksum = sha256(bytes_entropy).digest()
-    # integer checksum (leading zeros are lost)
-    intchecksum = int.from_bytes(byteschecksum, 'big')
-    # convert checksum to binary '01' string
-    checksum = bin(intchecksum)[2:]  # remove '0b'
-    checksum = checksum.zfill(256)   # pad with leading lost zeros
-    # leftmost bits
-    checksum_bits = nbytes // 4
-    return checksum[:checksum_bits]
+    checksum = _int_entropy_checksum((int(binstr_entropy, 2), nbits))
+    return _binstr_from_int(checksum, nbits // 32)
 
 
 def mnemonic_from_entropy(entropy: Entropy, lang: str = "en") -> Mnemonic:
@@ -91,14 +95,21 @@ def mnemonic_from_entropy(entropy: Entropy, lang: str = "en") -> Mnemonic:
     length, then only the leftmost bits are retained.
     """
 
-    binstr_entropy = binstr_from_entropy(entropy, _bits)
-    checksum = _entropy_checksum(binstr_entropy)
-    indexes = _indexes_from_entropy(binstr_entropy + checksum, lang)
+    int_entropy, nbits = _int_from_entropy(entropy, _bits)
+    checksum = _int_entropy_checksum((int_entropy, nbits))
+    checksum_bits = nbits // 32
+    cs_entropy = (int_entropy << checksum_bits) + checksum
+    indexes = _indexes_from_int_entropy((cs_entropy, nbits + checksum_bits),
+                                        lang)
     return _mnemonic_from_indexes(indexes, lang)
 
 
-def entropy_from_mnemonic(mnemonic: Mnemonic, lang: str = "en") -> BinStr:
-    """Convert mnemonic sentence to entropy, verifying checksum."""
+def _int_entropy_from_mnemonic(mnemonic: Mnemonic, lang: str = "en",
+                               abbreviated: bool = False) -> IntEntropy:
+    """Convert mnemonic sentence to (int, bit length) entropy.
+
+    See entropy_from_mnemonic.
+    """
 
     words = len(mnemonic.split())
     if words not in _words:
@@ -106,21 +117,38 @@ def entropy_from_mnemonic(mnemonic: Mnemonic, lang: str = "en") -> BinStr:
         msg += f"expected: {_words}"
         raise ValueError(msg)
 
-    indexes = _indexes_from_mnemonic(mnemonic, lang)
-    cs_entropy = _entropy_from_indexes(indexes, lang)
+    indexes = _indexes_from_mnemonic(mnemonic, lang, abbreviated)
+    cs_entropy, cs_bits = _int_entropy_from_indexes(indexes, lang)
 
     # entropy is only the first part of cs_entropy
-    bits = int(len(cs_entropy)*32/33)
-    binstr_entropy = cs_entropy[:bits]
+    bits = cs_bits*32//33
+    entropy = _bits_slice((cs_entropy, cs_bits), 0, bits), bits
 
     # the second part being the checksum, to be verified
-    checksum = _entropy_checksum(binstr_entropy)
-    if cs_entropy[bits:] != checksum:
-        m = f"invalid mnemonic checksum ({cs_entropy[bits:]}); "
-        m += f"expected: {checksum}"
+    checksum = _int_entropy_checksum(entropy)
+    checksum_bits = cs_bits - bits
+    mnemonic_checksum = _bits_slice((cs_entropy, cs_bits), bits, cs_bits)
+    if mnemonic_checksum != checksum:
+        m = "invalid mnemonic checksum "
+        m += f"({_binstr_from_int(mnemonic_checksum, checksum_bits)}); "
+        m += f"expected: {_binstr_from_int(checksum, checksum_bits)}"
         raise ValueError(m)
 
-    return binstr_entropy
+    return entropy
+
+
+def entropy_from_mnemonic(mnemonic: Mnemonic, lang: str = "en",
+                          abbreviated: bool = False) -> BinStr:
+    """Convert mnemonic sentence to entropy, verifying checksum.
+
+    If abbreviated is True, words can be abbreviated to their
+    unambiguous prefixes (e.g. the first four letters):
+    as the seed is computed from the full words, the full mnemonic
+    must then be recovered using mnemonic_from_entropy.
+    """
+
+    entropy = _int_entropy_from_mnemonic(mnemonic, lang, abbreviated)
+    return _binstr_from_int(*entropy)
 
 
 def seed_from_mnemonic(mnemonic: Mnemonic, passphrase: str,
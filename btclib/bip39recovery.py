@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""BIP39 mnemonic recovery for missing or erroneous words.
+
+Missing words (marked as '?') and words not in the word-list
+are enumerated over the whole word-list, as well as the words
+at the explicitly suspected positions.
+Candidates are first filtered with the BIP39 checksum,
+discarding e.g. 15/16 of the candidates for 12-word mnemonics
+without any PBKDF2 computation.
+The surviving candidates are then checked against a target address
+or extended public key, computing the PBKDF2 seeds and
+the BIP32 derivations in parallel.
+"""
+
+from itertools import product
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from . import bip32
+from .alias import String
+from .base58address import h160_from_b58address
+from .bech32address import has_segwit_prefix, witness_from_b32address
+from .bip39 import _int_entropy_checksum, _words, seed_from_mnemonic
+from .mnemonic import Mnemonic, _mnemonic_from_indexes
+from .network import (_NETWORKS, _P2WPKH_P2SH_PUB_PREFIXES,
+                      _P2WPKH_PUB_PREFIXES, _XPRV_PREFIXES)
+from .utils import hash160, stream_map
+from .wordlists import _wordlists
+
+# target kind ('xpub', 'p2pkh', 'p2wpkh-p2sh', 'p2wpkh') and payload
+Target = Tuple[str, bytes]
+
+
+def candidates(mnemonic: Mnemonic, lang: str = "en",
+               positions: Iterable[int] = ()) -> Iterator[Mnemonic]:
+    """Yield the candidate mnemonics with valid BIP39 checksum.
+
+    Missing words (marked as '?'), words not in the word-list,
+    and words at the given positions are replaced
+    by all the word-list words; a missing last word is directly
+    computed from the checksum for each value of its entropy bits.
+    """
+
+    words = mnemonic.split()
+    nwords = len(words)
+    if nwords not in _words:
+        msg = f"mnemonic with wrong number of words ({nwords}); "
+        msg += f"expected: {_words}"
+        raise ValueError(msg)
+
+    indexes: List[int] = list()
+    unknown: List[int] = list()
+    for i, word in enumerate(words):
+        try:
+            indexes.append(_wordlists.index(word, lang))
+        except ValueError:
+            indexes.append(0)
+            unknown.append(i)
+    for i in positions:
+        if not 0 <= i < nwords:
+            raise ValueError(f"Invalid word position: {i}")
+        if i not in unknown:
+            unknown.append(i)
+    unknown.sort()
+
+    n = _wordlists.language_length(lang)
+    bpw = _wordlists.bits_per_word(lang)
+    bits = nwords * bpw
+    cs_bits = bits // 33
+    entropy_bits = bits - cs_bits
+
+    # the missing last word is computed from the checksum,
+    # enumerating only its entropy bits
+    last = nwords - 1 in unknown
+    if last:
+        unknown.remove(nwords - 1)
+        indexes[-1] = 0
+
+    # integer checksummed entropy, with unknown words set to zero
+    base = 0
+    for index in indexes:
+        base = base * n + index
+    weights = [n ** (nwords - 1 - i) for i in unknown]
+
+    for values in product(range(n), repeat=len(unknown)):
+        cs_entropy = base
+        for i, w, v in zip(unknown, weights, values):
+            cs_entropy += (v - indexes[i]) * w
+        candidate = list(indexes)
+        for i, v in zip(unknown, values):
+            candidate[i] = v
+        if last:
+            entropy = cs_entropy >> cs_bits
+            for e in range(1 << (bpw - cs_bits)):
+                checksum = _int_entropy_checksum((entropy + e, entropy_bits))
+                candidate[-1] = (e << cs_bits) + checksum
+                yield _mnemonic_from_indexes(candidate, lang)
+        else:
+            checksum = _int_entropy_checksum((cs_entropy >> cs_bits,
+                                              entropy_bits))
+            if checksum == cs_entropy & ((1 << cs_bits) - 1):
+                yield _mnemonic_from_indexes(candidate, lang)
+
+
+def _target(target: String) -> Tuple[Target, str]:
+    # (kind, payload) and network of the target address or xpub
+
+    if isinstance(target, str):
+        target = target.strip()
+    else:
+        target = target.strip().decode('ascii')
+    if has_segwit_prefix(target):
+        wv, wp, network, _ = witness_from_b32address(target)
+        if wv != 0 or len(wp) != 20:
+            raise ValueError(f"Not a p2wpkh address: {target}")
+        return ('p2wpkh', wp), network
+    try:
+        _, h160, network, is_script_hash = h160_from_b58address(target)
+    except Exception:
+        xkey = bip32.ExtendedKey.from_xkey(target)
+        if xkey.is_private:
+            raise ValueError("Not a public extended key")
+        return ('xpub', xkey.key), xkey.network
+    return ('p2wpkh-p2sh' if is_script_hash else 'p2pkh', h160), network
+
+
+def _default_path(target: String) -> str:
+    # BIP44/49/84 first receive address or account derivation path
+
+    (kind, _), network = _target(target)
+    coin = "0h" if network == 'mainnet' else "1h"
+    if kind == 'xpub':
+        version = bip32.ExtendedKey.from_xkey(target).version
+        if version in _P2WPKH_P2SH_PUB_PREFIXES:
+            purpose = "49h"
+        elif version in _P2WPKH_PUB_PREFIXES:
+            purpose = "84h"
+        else:
+            purpose = "44h"
+        return f"m/{purpose}/{coin}/0h"
+    purpose = {'p2pkh': "44h", 'p2wpkh-p2sh': "49h", 'p2wpkh': "84h"}[kind]
+    return f"m/{purpose}/{coin}/0h/0/0"
+
+
+def _check_worker(args: Tuple[Mnemonic, str, bip32.Path, Target,
+                              bytes]) -> Optional[Mnemonic]:
+    mnemonic, passphrase, path, (kind, payload), version = args
+    seed = seed_from_mnemonic(mnemonic, passphrase, False)
+    xkey = bip32.ExtendedKey.from_xkey(bip32.rootxprv_from_seed(seed, version))
+    # candidate roots are all different:
+    # bypass the derivation cache, as there would be no hits
+    for index in path.indexes:
+        xkey = xkey.ckd(index)
+    pubkey = xkey.pubkey
+    if kind == 'xpub':
+        found = pubkey == payload
+    elif kind == 'p2wpkh-p2sh':
+        found = hash160(b'\x00\x14' + hash160(pubkey)) == payload
+    else:
+        found = hash160(pubkey) == payload
+    return mnemonic if found else None
+
+
+def recover(mnemonic: Mnemonic, target: String, passphrase: str = "",
+            path: Optional[str] = None, lang: str = "en",
+            positions: Iterable[int] = (),
+            max_workers: Optional[int] = None,
+            threads: bool = False) -> Iterator[Mnemonic]:
+    """Yield the candidate mnemonics matching the target.
+
+    The target is a p2pkh, p2wpkh-p2sh, or p2wpkh address,
+    or an extended public key: it must be derived from the
+    mnemonic root key along the absolute derivation path,
+    by default the BIP44/49/84 first receive address path
+    (e.g. "m/84h/0h/0h/0/0") or account path (e.g. "m/84h/0h/0h").
+
+    See candidates for the enumerated words.
+    The candidates are checked by a pool of max_workers processes
+    (as many as the processors, if None), or threads if threads
+    is True (as hashlib releases the GIL during PBKDF2);
+    if max_workers is 1, they are checked in the current process.
+    """
+
+    kind_payload, network = _target(target)
+    compiled = bip32.Path(path or _default_path(target))
+    version = _XPRV_PREFIXES[_NETWORKS.index(network)]
+    args = ((m, passphrase, compiled, kind_payload, version)
+            for m in candidates(mnemonic, lang, positions))
+    for result in stream_map(_check_worker, args, max_workers, threads):
+        if result is not None:
+            yield result
@@ -11,7 +11,7 @@
 """Elliptic curve class."""
 
 from math import sqrt
-from typing import Union
+from typing import List, Sequence, Union
 
 from .alias import INF, INFJ, JacPoint, Point
 from .numbertheory import legendre_symbol, mod_inv, mod_sqrt
@@ -195,6 +195,34 @@ class Curve:
             y = (Q[1]*mod_inv(Z2*Q[2], self._p)) % self._p
             return x, y
 
+    def _aff_from_jac_batch(self, Qs: Sequence[JacPoint]) -> List[Point]:
+        # points are assumed to be on curve
+        # Montgomery's trick: a single mod_inv for the whole batch
+        Zs = [Q[2] for Q in Qs if Q[2] != 0]
+        if not Zs:
+            return [INF] * len(Qs)
+        prods = [Zs[0]]
+        for Z in Zs[1:]:
+            prods.append(prods[-1] * Z % self._p)
+        inv = mod_inv(prods[-1], self._p)
+        Zinvs = [0] * len(Zs)
+        for i in range(len(Zs)-1, 0, -1):
+            Zinvs[i] = inv * prods[i-1] % self._p
+            inv = inv * Zs[i] % self._p
+        Zinvs[0] = inv
+        result: List[Point] = list()
+        i = 0
+        for Q in Qs:
+            if Q[2] == 0:  # Infinity point in Jacobian coordinates
+                result.append(INF)
+            else:
+                Zinv2 = Zinvs[i] * Zinvs[i]
+                x = Q[0] * Zinv2 % self._p
+                y = Q[1] * Zinv2 * Zinvs[i] % self._p
+                result.append((x, y))
+                i += 1
+        return result
+
     def _x_aff_from_jac(self, Q: JacPoint) -> int:
         # point is assumed to be on curve
         if Q[2] == 0:  # Infinity point in Jacobian coordinates
@@ -11,6 +11,7 @@
 """Elliptic curve point multiplication functions."""
 
 import heapq
+from functools import lru_cache
 from typing import List, Sequence
 
 from .alias import INFJ, JacPoint, Point
@@ -49,6 +50,83 @@ def _mult_jac(m: int, Q: JacPoint, ec: Curve) -> JacPoint:
     return R
 
 
+# fixed-base table: window size in bits
+_W = 4
+
+FixedBaseTable = List[List[JacPoint]]
+
+
+def _fixed_base_table(QJ: JacPoint, ec: Curve) -> FixedBaseTable:
+    # T[i][j] = j * 2^(_W*i) * Q, for j in [0, 2^_W - 1]
+    # Point is assumed to be on curve
+
+    T: FixedBaseTable = list()
+    rows = (ec.nlen + _W - 1) // _W
+    for _ in range(rows):
+        row = [INFJ, QJ]
+        for _ in range(2, 1 << _W):
+            row.append(ec._add_jac(row[-1], QJ))
+        T.append(row)
+        QJ = ec._add_jac(row[-1], QJ)  # 2^_W * Q
+    return T
+
+
+def _mult_fixed(m: int, T: FixedBaseTable, ec: Curve) -> JacPoint:
+    # fixed-base multiplication using a precomputed table:
+    # only additions, one for each non-zero _W-bit window of m
+
+    m %= ec.n
+    mask = (1 << _W) - 1
+    R = INFJ
+    i = 0
+    while m > 0:
+        j = m & mask
+        if j:
+            R = ec._add_jac(R, T[i][j])
+        m >>= _W
+        i += 1
+    return R
+
+
+@lru_cache(maxsize=None)
+def _generator_table(ec: Curve) -> FixedBaseTable:
+    # fixed-base table of the curve generator, computed once per curve
+    return _fixed_base_table(ec.GJ, ec)
+
+
+def _windows(m: int, ec: Curve) -> List[int]:
+    # _W-bit windows of m (mod n), most significant first:
+    # the recoding of a scalar can be reused for many different points
+
+    m %= ec.n
+    mask = (1 << _W) - 1
+    windows: List[int] = list()
+    while m > 0:
+        windows.append(m & mask)
+        m >>= _W
+    windows.reverse()
+    return windows
+
+
+def _mult_windows(windows: Sequence[int], QJ: JacPoint,
+                  ec: Curve) -> JacPoint:
+    # fixed-window multiplication, using the recoding provided by _windows
+    # Point is assumed to be on curve
+
+    if not windows or QJ[2] == 0:
+        return INFJ
+    T = [INFJ, QJ]
+    for _ in range(2, 1 << _W):
+        T.append(ec._add_jac(T[-1], QJ))
+    R = INFJ
+    for j in windows:
+        for _ in range(_W):
+            R = ec._add_jac(R, R)
+        if j:
+            R = ec._add_jac(R, T[j])
+    return R
+
+
 def double_mult(u: int, H: Point, v: int, Q: Point = None,
                 ec: Curve = secp256k1) -> Point:
     """Shamir trick for efficient computation of u*H + v*Q"""
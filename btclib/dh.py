@@ -20,16 +20,40 @@ function to use.
 """
 
 from hashlib import sha256
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, List, Sequence
 
-from .alias import HashF, Point
-from .curve import Curve
-from .curvemult import mult
+from .alias import HashF, JacPoint, Point
+from .curve import Curve, _jac_from_aff
+from .curvemult import _mult_windows, _windows, mult
 from .curves import secp256k1
 
 KDF = Callable[[bytes, int, Curve, HashF], Any]
 
 
+def ansi_x963_kdf_stream(z: bytes, size: int,
+                         hf: HashF = sha256) -> Iterator[bytes]:
+    """Yield keying data chunks according to ANS-X9.63-KDF.
+
+    The keying data octet sequence of the requested size is yielded
+    incrementally, one hash digest at a time (the last one possibly
+    truncated), without accumulating it in memory.
+
+    http://www.secg.org/sec1-v2.pdf, section 3.6.1
+    """
+    hsize = hf().digest_size
+    assert size < hsize * (2**32 - 1), "invalid"
+    # the hash state after z is reused for each counter value
+    h_z = hf()
+    h_z.update(z)
+    counter = 1
+    while size > 0:
+        h = h_z.copy()
+        h.update(counter.to_bytes(4, byteorder='big'))
+        yield h.digest()[:size]
+        size -= hsize
+        counter += 1
+
+
 def ansi_x963_kdf(z: bytes, size: int,
                   ec: Curve = secp256k1, hf: HashF = sha256) -> bytes:
     """Return keying data according to ANS-X9.63-KDF.
@@ -39,21 +63,7 @@ def ansi_x963_kdf(z: bytes, size: int,
 
     http://www.secg.org/sec1-v2.pdf, section 3.6.1
     """
-    hsize = hf().digest_size
-    assert size < hsize * (2**32 - 1), "invalid"
-    counter = 1
-    counter_bytes = counter.to_bytes(4, byteorder='big')
-    K_temp = []
-    for i in range((size+1) // hsize):
-        h = hf()
-        h.update(z + counter_bytes)
-        K_temp.append(h.digest())
-        counter += 1
-        counter_bytes = counter.to_bytes(4, byteorder='big')
-        i += 1
-    K_bytes = b''.join(K_temp[i] for i in range(size // hsize))
-    K = int.from_bytes(K_bytes, byteorder='big') >> (size - hsize)
-    return K.to_bytes(ec.psize, 'big')
+    return b''.join(ansi_x963_kdf_stream(z, size, hf))
 
 
 def diffie_hellman(kdf: KDF, dU: int, QV: Point, size: int,
@@ -69,3 +79,29 @@ def diffie_hellman(kdf: KDF, dU: int, QV: Point, size: int,
     shared_secret = P[0]  # shared secret field element
     z = shared_secret.to_bytes(ec.psize, 'big')
     return kdf(z, size, ec, hf)
+
+
+def diffie_hellman_many(kdf: KDF, dU: int, QVs: Sequence[Point], size: int,
+                        ec: Curve = secp256k1,
+                        hf: HashF = sha256) -> List[bytes]:
+    """Diffie-Hellman key agreement with many peers, using the same dU.
+
+    The windowed recoding of the static private key dU is computed once
+    and reused for each peer public key; the shared points are then
+    converted to affine coordinates with a single modular inversion.
+
+    http://www.secg.org/sec1-v2.pdf, section 6.1
+    """
+
+    windows = _windows(dU, ec)
+    PJs: List[JacPoint] = list()
+    for QV in QVs:
+        ec.require_on_curve(QV)
+        PJs.append(_mult_windows(windows, _jac_from_aff(QV), ec))
+    result: List[bytes] = list()
+    for P in ec._aff_from_jac_batch(PJs):
+        if P[1] == 0:
+            raise ValueError("invalid (zero) shared secret")
+        z = P[0].to_bytes(ec.psize, 'big')
+        result.append(kdf(z, size, ec, hf))
+    return result
@@ -15,12 +15,16 @@ Electrum mnemonic is versioned, conveying BIP32 derivation rule too.
 
 import hmac
 from hashlib import pbkdf2_hmac, sha512
-from typing import Tuple
+from itertools import count
+from typing import List, Optional, Tuple
 
 from . import bip32
-from .entropy import BinStr, Entropy, binstr_from_entropy
-from .mnemonic import (Mnemonic, _entropy_from_indexes, _indexes_from_entropy,
-                       _indexes_from_mnemonic, _mnemonic_from_indexes)
+from .entropy import BinStr, Entropy, _binstr_from_int, _int_from_entropy
+from .mnemonic import (Mnemonic, _indexes_from_int_entropy,
+                       _indexes_from_mnemonic, _int_entropy_from_indexes,
+                       _mnemonic_from_indexes)
+from .utils import stream_map
+from .wordlists import _wordlists
 
 _MNEMONIC_VERSIONS = {
     'standard':  '01',  # P2PKH and Multisig P2SH wallets
@@ -29,11 +33,24 @@ _MNEMONIC_VERSIONS = {
     '2fa_segwit': '102',  # Two-factor authenticated wallets, using segwit
 }
 
+# HMAC state after the key, to be copied for each mnemonic
+_SEED_VERSION_HMAC = hmac.new(b"Seed version", digestmod=sha512)
+
+# number of entropy values searched by each task in mnemonic_from_entropy
+_SEARCH_BLOCK = 1024
+
+
+def _seed_version(mnemonic: bytes) -> str:
+    # hex HMAC-SHA512 of the mnemonic, keyed with "Seed version"
+    h = _SEED_VERSION_HMAC.copy()
+    h.update(mnemonic)
+    return h.hexdigest()
+
 
 def version_from_mnemonic(mnemonic: Mnemonic) -> str:
     """Return the Electrum version embedded in the mnemonic sentence."""
 
-    s = hmac.new(b"Seed version", mnemonic.encode(), sha512).hexdigest()
+    s = _seed_version(mnemonic.encode())
 
     if s.startswith(_MNEMONIC_VERSIONS['standard']):
         return 'standard'
@@ -47,8 +64,46 @@ def version_from_mnemonic(mnemonic: Mnemonic) -> str:
     raise ValueError(f"unknown electrum mnemonic version ({s[:3]})")
 
 
+def _search(version: str, int_entropy: int, n_trials: int,
+            lang: str) -> Optional[Tuple[int, Mnemonic]]:
+    """Return the first (entropy, mnemonic) with the given version prefix.
+
+    Entropy values in [int_entropy, int_entropy+n_trials) are tried,
+    updating the word indexes incrementally.
+    """
+
+    wordlist = [w.encode() for w in _wordlists.wordlist(lang)]
+    n = len(wordlist)
+    # electrum considers entropy as integer, losing any leading zero
+    nbits = int_entropy.bit_length()
+    indexes: List[int] = _indexes_from_int_entropy((int_entropy, nbits), lang)
+    words = [wordlist[i] for i in indexes]
+    for trial in range(n_trials):
+        if _seed_version(b' '.join(words)).startswith(version):
+            return int_entropy + trial, _mnemonic_from_indexes(indexes, lang)
+        # next trial: increment the word indexes, with carry
+        i = len(indexes) - 1
+        while i >= 0 and indexes[i] == n - 1:
+            indexes[i] = 0
+            words[i] = wordlist[0]
+            i -= 1
+        if i < 0:
+            indexes.insert(0, 1)
+            words.insert(0, wordlist[1])
+        else:
+            indexes[i] += 1
+            words[i] = wordlist[indexes[i]]
+    return None
+
+
+def _search_worker(args: Tuple[str, int, int, str]) -> Optional[Mnemonic]:
+    result = _search(*args)
+    return None if result is None else result[1]
+
+
 def mnemonic_from_entropy(electrum_version: str, entropy: Entropy,
-                          lang: str = "en") -> Mnemonic:
+                          lang: str = "en",
+                          max_workers: Optional[int] = 1) -> Mnemonic:
     """Convert input entropy to versioned Electrum mnemonic sentence.
 
     Input entropy can be expressed as
@@ -56,6 +111,12 @@ def mnemonic_from_entropy(electrum_version: str, entropy: Entropy,
 
     In the case of binary 0/1 string and bytes-like,
     leading zeros are considered redundant padding.
+
+    The entropy is incremented until the mnemonic has the required
+    version: the search can be split in blocks of consecutive entropy
+    values distributed over a pool of max_workers processes
+    (as many as the processors, if None); anyway, the returned
+    mnemonic is the first valid one, as in the sequential search.
     """
 
     if electrum_version not in _MNEMONIC_VERSIONS:
@@ -64,25 +125,21 @@ def mnemonic_from_entropy(electrum_version: str, entropy: Entropy,
         raise ValueError(m)
     version = _MNEMONIC_VERSIONS[electrum_version]
 
-    binstr_entropy = binstr_from_entropy(entropy)
-    int_entropy = int(binstr_entropy, 2)
-    invalid = True
-    while invalid:
-        # electrum considers entropy as integer, losing any leading zero
-        # so the value of binstr_entropy before the while must be updated
-        nbits = int_entropy.bit_length()
-        binstr_entropy = binstr_from_entropy(int_entropy, nbits)
-        indexes = _indexes_from_entropy(binstr_entropy, lang)
-        mnemonic = _mnemonic_from_indexes(indexes, lang)
-        # version validity check
-        s = hmac.new(b"Seed version",
-                     mnemonic.encode(), sha512).hexdigest()
-        if s.startswith(version):
-            invalid = False
-        # next trial
-        int_entropy += 1
-
-    return mnemonic
+    int_entropy, _ = _int_from_entropy(entropy)
+    if max_workers == 1:
+        while True:
+            result = _search(version, int_entropy, _SEARCH_BLOCK, lang)
+            if result is not None:
+                return result[1]
+            int_entropy += _SEARCH_BLOCK
+
+    args = ((version, int_entropy + i * _SEARCH_BLOCK, _SEARCH_BLOCK, lang)
+            for i in count())
+    for mnemonic in stream_map(_search_worker, args, max_workers):
+        if mnemonic is not None:
+            return mnemonic
+    # the search is unbounded: this line is never reached
+    raise ValueError("no versioned mnemonic found")  # pragma: no cover
 
 
 def entropy_from_mnemonic(mnemonic: Mnemonic, lang: str = "en") -> BinStr:
@@ -91,8 +148,7 @@ def entropy_from_mnemonic(mnemonic: Mnemonic, lang: str = "en") -> BinStr:
     # verify that it is a valid Electrum mnemonic sentence
     _ = version_from_mnemonic(mnemonic)
     indexes = _indexes_from_mnemonic(mnemonic, lang)
-    entropy = _entropy_from_indexes(indexes, lang)
-    return entropy
+    return _binstr_from_int(*_int_entropy_from_indexes(indexes, lang))
 
 
 def _seed_from_mnemonic(mnemonic: Mnemonic, passphrase: str) -> Tuple[str, bytes]:
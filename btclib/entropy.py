@@ -14,34 +14,43 @@ Input entropy can be expressed as
 binary 0/1 string, bytes-like, or integer.
 
 Output entropy is always a binary 0/1 string.
+
+Internally, entropy is handled as (int, bit length) pairs,
+avoiding the repeated conversions from/to binary 0/1 strings:
+the binary 0/1 string functions are thin wrappers.
 """
 
 import math
 import secrets
 from hashlib import sha256
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional, Tuple, Union
 
 BinStr = str  # binary 0/1 string
 Entropy = Union[BinStr, int, bytes]
+IntEntropy = Tuple[int, int]  # (int value, bit length)
 
 _bits = 128, 160, 192, 224, 256
 
 
-def binstr_from_entropy(entr: Entropy,
-                        bits: Union[int, Iterable[int]] = _bits) -> BinStr:
-    """Convert the input entropy to binary 0/1 string.
+def _binstr_from_int(value: int, nbits: int) -> BinStr:
+    # binary 0/1 string of nbits, padded with leading zeros
+    return bin(value)[2:].zfill(nbits)
 
-    Input entropy can be expressed as
-    binary 0/1 string, bytes-like, or integer;
-    by default, it must be 128, 160, 192, 224, or 256 bits.
 
-    In the case of binary 0/1 string and bytes-like
-    leading zeros are not considered redundant padding.
-    In the case of integer, where leading zeros cannot be represented,
-    if the bit length is not an allowed value, then the binary 0/1
-    string is padded with leading zeros up to the first allowed bit
-    length; if the integer bit length is longer than the maximum
-    length, then only the leftmost bits are retained.
+def _bits_slice(entropy: IntEntropy, start: int, stop: int) -> int:
+    """Return the [start:stop] leftmost-first bits of the entropy.
+
+    It is the integer equivalent of the binary 0/1 string slice.
+    """
+    value, nbits = entropy
+    return (value >> (nbits - stop)) & ((1 << (stop - start)) - 1)
+
+
+def _int_from_entropy(entr: Entropy,
+                      bits: Union[int, Iterable[int]] = _bits) -> IntEntropy:
+    """Convert the input entropy to (int, bit length).
+
+    See binstr_from_entropy.
     """
 
     if isinstance(bits, int):
@@ -52,22 +61,22 @@ def binstr_from_entropy(entr: Entropy,
         binstr_entr = entr.strip()
         if binstr_entr[:2] == '0b':
             binstr_entr = binstr_entr[2:]
-        int(binstr_entr, 2)  # check that entr is a valid binary string
+        # check that entr is a valid binary string
+        int_entr = int(binstr_entr, 2)
         nbits = len(binstr_entr)
         # no length adjustment
     elif isinstance(entr, bytes):
         nbits = len(entr) * 8
         int_entr = int.from_bytes(entr, 'big')
-        binstr_entr = bin(int_entr)[2:]  # remove '0b'
         # no length adjustment
     elif isinstance(entr, int):
         if entr < 0:
             raise ValueError(f"negative entropy ({entr})")
-        binstr_entr = bin(entr)[2:]  # remove '0b'
-        nbits = len(binstr_entr)
+        int_entr = entr
+        nbits = entr.bit_length()
         if nbits > bits[-1]:
             # only the leftmost bits are retained
-            binstr_entr = binstr_entr[:bits[-1]]
+            int_entr >>= nbits - bits[-1]
             nbits = bits[-1]
         elif nbits not in bits:
             # next allowed bit length
@@ -79,7 +88,27 @@ def binstr_from_entropy(entr: Entropy,
 
     if nbits not in bits:
         raise ValueError(f"{nbits} bits entropy provided; expected: {bits}")
-    return binstr_entr.zfill(nbits)  # might need padding with leading zeros
+    return int_entr, nbits
+
+
+def binstr_from_entropy(entr: Entropy,
+                        bits: Union[int, Iterable[int]] = _bits) -> BinStr:
+    """Convert the input entropy to binary 0/1 string.
+
+    Input entropy can be expressed as
+    binary 0/1 string, bytes-like, or integer;
+    by default, it must be 128, 160, 192, 224, or 256 bits.
+
+    In the case of binary 0/1 string and bytes-like
+    leading zeros are not considered redundant padding.
+    In the case of integer, where leading zeros cannot be represented,
+    if the bit length is not an allowed value, then the binary 0/1
+    string is padded with leading zeros up to the first allowed bit
+    length; if the integer bit length is longer than the maximum
+    length, then only the leftmost bits are retained.
+    """
+
+    return _binstr_from_int(*_int_from_entropy(entr, bits))
 
 
 def generate_entropy(bits: int, dice_base: int = 0,
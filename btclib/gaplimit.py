@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Gap-limit address discovery over BIP32 extended public keys.
+
+Given an account-level extended public key, its receive (0) and
+change (1) branches are scanned, deriving children until gap_limit
+consecutive unused addresses are found, where an address is used
+if it belongs to a known set of addresses.
+
+The known addresses are decoded once to their hash160 payload:
+the inner loop only computes hash160 values and looks them up in a
+hash set, without any address string encoding, for each of
+the p2pkh, p2wpkh-p2sh, and p2wpkh script types.
+Address strings are generated (using p2pkh_from_xpub,
+p2wpkh_p2sh_from_xpub, and p2wpkh_from_xpub) for the used ones only.
+
+Multiple extended public keys are scanned in parallel
+using a process pool.
+
+Network information is not taken into account when matching addresses.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
+
+from .alias import String
+from .base58address import (h160s_from_b58addresses, p2pkh_from_xpub,
+                            p2wpkh_p2sh_from_xpub)
+from .bech32address import (has_segwit_prefix, p2wpkh_from_xpub,
+                            witness_from_b32address)
+from .bip32 import BIP32Key, ExtendedKey, derive_range
+from .utils import hash160
+
+SCRIPT_TYPES = ('p2pkh', 'p2wpkh-p2sh', 'p2wpkh')
+
+# (address kind, hash160) with address kind in 'p2pkh', 'p2sh', 'p2wpkh'
+Known = Set[Tuple[str, bytes]]
+
+# (relative derivation path, script type, address)
+Used = Tuple[str, str, bytes]
+
+
+def known_from_addresses(addresses: Iterable[String]) -> Known:
+    """Return the hash set of the known addresses payloads.
+
+    Witness programs which are not p2wpkh ones are neglected.
+    """
+
+    known: Known = set()
+    b58addresses = list()
+    for addr in addresses:
+        if has_segwit_prefix(addr):
+            wv, wp, _, _ = witness_from_b32address(addr)
+            if wv == 0 and len(wp) == 20:
+                known.add(('p2wpkh', wp))
+        else:
+            b58addresses.append(addr)
+    for _, h160, _, is_script_hash in h160s_from_b58addresses(b58addresses):
+        known.add(('p2sh' if is_script_hash else 'p2pkh', h160))
+    return known
+
+
+def _used(pubkey: bytes, known: Known,
+          script_types: Sequence[str]) -> List[str]:
+    # script types for which the public key is used
+
+    h160 = hash160(pubkey)
+    result: List[str] = list()
+    for script_type in script_types:
+        if script_type == 'p2pkh':
+            if ('p2pkh', h160) in known:
+                result.append(script_type)
+        elif script_type == 'p2wpkh':
+            if ('p2wpkh', h160) in known:
+                result.append(script_type)
+        else:  # p2wpkh-p2sh
+            script_h160 = hash160(b'\x00\x14' + h160)
+            if ('p2sh', script_h160) in known:
+                result.append(script_type)
+    return result
+
+
+_ADDRESS_FROM_XPUB = {
+    'p2pkh': p2pkh_from_xpub,
+    'p2wpkh-p2sh': p2wpkh_p2sh_from_xpub,
+    'p2wpkh': p2wpkh_from_xpub,
+}
+
+
+def scan_xpub(xpub: BIP32Key, known: Known, gap_limit: int = 20,
+              script_types: Sequence[str] = SCRIPT_TYPES,
+              branches: Sequence[int] = (0, 1)) -> List[Used]:
+    """Return the used addresses of an account-level extended public key.
+
+    Each branch is scanned until gap_limit consecutive
+    unused indexes are found.
+    """
+
+    if gap_limit < 1:
+        raise ValueError(f"gap_limit ({gap_limit}) must be positive")
+    for script_type in script_types:
+        if script_type not in SCRIPT_TYPES:
+            raise ValueError(f"Unknown script type ({script_type})")
+
+    account = ExtendedKey.from_xkey(xpub)
+    result: List[Used] = list()
+    for branch in branches:
+        node = account.derive(branch)
+        start = 0
+        next_unused = 0  # first index after the last used one
+        while start < next_unused + gap_limit:
+            count = next_unused + gap_limit - start
+            pubkeys = derive_range(node, start, count, True)
+            for i, pubkey in enumerate(pubkeys, start):
+                for script_type in _used(pubkey, known, script_types):
+                    next_unused = i + 1
+                    address = _ADDRESS_FROM_XPUB[script_type](node.derive(i))
+                    result.append((f"./{branch}/{i}", script_type, address))
+            start += count
+    return result
+
+
+# known set of each worker process
+_KNOWN: Known = set()
+
+
+def _init_worker(known: Known) -> None:
+    global _KNOWN
+    _KNOWN = known
+
+
+def _scan_worker(args: Tuple[BIP32Key, int, Sequence[str],
+                             Sequence[int]]) -> List[Used]:
+    xpub, gap_limit, script_types, branches = args
+    return scan_xpub(xpub, _KNOWN, gap_limit, script_types, branches)
+
+
+def scan(xpubs: Sequence[BIP32Key], addresses: Iterable[String],
+         gap_limit: int = 20, script_types: Sequence[str] = SCRIPT_TYPES,
+         branches: Sequence[int] = (0, 1),
+         max_workers: Optional[int] = None) -> List[List[Used]]:
+    """Return the used addresses for each account-level extended public key.
+
+    The extended public keys are scanned in parallel using a pool of
+    max_workers processes (as many as the processors, if None);
+    if max_workers is 1, they are scanned in the current process.
+    """
+
+    known = known_from_addresses(addresses)
+    args = [(xpub, gap_limit, script_types, branches) for xpub in xpubs]
+    if max_workers == 1:
+        _init_worker(known)
+        return [_scan_worker(arg) for arg in args]
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                             initargs=(known,)) as executor:
+        return list(executor.map(_scan_worker, args))
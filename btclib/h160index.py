@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Persistent on-disk hash160 to (xpub, derivation path) index.
+
+The index file maps the hash160 of the public keys derived from
+a set of account-level extended public keys (and optionally
+the hash160 of their p2wpkh-p2sh redeem scripts)
+back to the extended public key and to the relative derivation path.
+
+File layout (all integers are big-endian):
+
+- magic b'h160idx1'
+- number of extended public keys (4 bytes)
+- number of records (8 bytes)
+- fan-out table: for each first byte value b,
+  the number of records whose hash160 starts with a byte <= b
+  (256 entries, 8 bytes each)
+- extended public keys (111 bytes each, base58 serialization)
+- records sorted by hash160 (32 bytes each):
+  hash160 (20 bytes),
+  script hash flag (1 byte),
+  extended public key position (3 bytes),
+  branch index (4 bytes),
+  address index (4 bytes)
+
+The lookup memory-maps the file and performs a binary search inside
+the fan-out table bucket, without loading the records into memory.
+
+The builder sorts bounded runs of records in memory,
+spilling them to temporary files to be merged afterwards.
+"""
+
+import heapq
+import mmap
+import tempfile
+from typing import BinaryIO, Iterator, List, Sequence, Tuple
+
+from .bip32 import BIP32Key, ExtendedKey, derive_range
+from .utils import hash160
+
+_MAGIC = b'h160idx1'
+_RECORD_SIZE = 32
+_XPUB_SIZE = 111
+_HEADER_SIZE = len(_MAGIC) + 4 + 8
+_FANOUT_SIZE = 256 * 8
+
+# (extended public key, relative derivation path, script hash flag)
+Entry = Tuple[bytes, str, bool]
+
+
+def _records(xpub_id: int, xkey: ExtendedKey, count: int,
+             branches: Sequence[int], p2wpkh_p2sh: bool) -> Iterator[bytes]:
+
+    xpub_id_bytes = xpub_id.to_bytes(3, 'big')
+    for branch in branches:
+        node = xkey.derive(branch)
+        path = branch.to_bytes(4, 'big')
+        for i, pubkey in enumerate(derive_range(node, 0, count, True)):
+            h160 = hash160(pubkey)
+            index = i.to_bytes(4, 'big')
+            yield h160 + b'\x00' + xpub_id_bytes + path + index
+            if p2wpkh_p2sh:
+                script_h160 = hash160(b'\x00\x14' + h160)
+                yield script_h160 + b'\x01' + xpub_id_bytes + path + index
+
+
+def _read_records(f: BinaryIO) -> Iterator[bytes]:
+    while True:
+        record = f.read(_RECORD_SIZE)
+        if not record:
+            return
+        yield record
+
+
+def build_index(filename: str, xpubs: Sequence[BIP32Key], count: int,
+                branches: Sequence[int] = (0, 1), p2wpkh_p2sh: bool = False,
+                max_records: int = 1_000_000) -> int:
+    """Write the index file, returning the number of records.
+
+    For each account-level extended public key, the first count
+    addresses of each branch are indexed.
+    At most max_records records are sorted in memory at once.
+    """
+
+    if max_records < 1:
+        raise ValueError(f"max_records ({max_records}) must be positive")
+    if len(xpubs) >= 1 << 24:
+        raise ValueError(f"Too many extended public keys: {len(xpubs)}")
+
+    xkeys = [ExtendedKey.from_xkey(xpub) for xpub in xpubs]
+    serialized = [xkey.serialize() for xkey in xkeys]
+    for xkey, s in zip(xkeys, serialized):
+        if xkey.is_private:
+            raise ValueError(f"Not a public extended key: {s.decode()}")
+
+    runs: List[BinaryIO] = list()
+    try:
+        records: List[bytes] = list()
+        for xpub_id, xkey in enumerate(xkeys):
+            for record in _records(xpub_id, xkey, count,
+                                   branches, p2wpkh_p2sh):
+                records.append(record)
+                if len(records) == max_records:
+                    records.sort()
+                    run = tempfile.TemporaryFile()
+                    run.writelines(records)
+                    run.seek(0)
+                    runs.append(run)
+                    records.clear()
+        records.sort()
+        merged = heapq.merge(records, *[_read_records(r) for r in runs])
+
+        fanout = [0] * 256
+        n = 0
+        with open(filename, 'wb') as f:
+            f.write(b'\x00' * (_HEADER_SIZE + _FANOUT_SIZE))
+            f.writelines(serialized)
+            for record in merged:
+                f.write(record)
+                fanout[record[0]] += 1
+                n += 1
+            f.seek(0)
+            f.write(_MAGIC)
+            f.write(len(xpubs).to_bytes(4, 'big'))
+            f.write(n.to_bytes(8, 'big'))
+            total = 0
+            for c in fanout:
+                total += c
+                f.write(total.to_bytes(8, 'big'))
+    finally:
+        for run in runs:
+            run.close()
+    return n
+
+
+class H160Index:
+    """Memory-mapped read-only view of an index file.
+
+    It can be used as a context manager, closing the file at exit.
+    """
+
+    def __init__(self, filename: str) -> None:
+        with open(filename, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self._mm
+        if len(mm) < _HEADER_SIZE + _FANOUT_SIZE or mm[:8] != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not an index file: {filename}")
+        self.n_xpubs = int.from_bytes(mm[8:12], 'big')
+        self.n_records = int.from_bytes(mm[12:20], 'big')
+        self._records_start = (_HEADER_SIZE + _FANOUT_SIZE +
+                               self.n_xpubs * _XPUB_SIZE)
+        size = self._records_start + self.n_records * _RECORD_SIZE
+        if len(mm) != size:
+            self._mm.close()
+            m = f"Invalid index file size: {len(mm)} instead of {size}"
+            raise ValueError(m)
+
+    def __enter__(self) -> "H160Index":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def xpub(self, xpub_id: int) -> bytes:
+        """Return the extended public key at the given position."""
+
+        if not 0 <= xpub_id < self.n_xpubs:
+            raise ValueError(f"Invalid xpub position: {xpub_id}")
+        start = _HEADER_SIZE + _FANOUT_SIZE + xpub_id * _XPUB_SIZE
+        return self._mm[start:start + _XPUB_SIZE]
+
+    def _bucket(self, first_byte: int) -> Tuple[int, int]:
+        # record range of the fan-out table bucket
+        mm = self._mm
+        start = _HEADER_SIZE + first_byte * 8
+        hi = int.from_bytes(mm[start:start + 8], 'big')
+        if first_byte == 0:
+            return 0, hi
+        lo = int.from_bytes(mm[start - 8:start], 'big')
+        return lo, hi
+
+    def lookup(self, h160: bytes) -> List[Entry]:
+        """Return the (xpub, path, is_script_hash) entries of a hash160."""
+
+        if len(h160) != 20:
+            raise ValueError(f"Invalid hash160 length: {len(h160)}")
+
+        mm = self._mm
+        base = self._records_start
+        lo, hi = self._bucket(h160[0])
+        # leftmost record not less than h160
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = base + mid * _RECORD_SIZE
+            if mm[start:start + 20] < h160:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        result: List[Entry] = list()
+        start = base + lo * _RECORD_SIZE
+        while lo < self.n_records and mm[start:start + 20] == h160:
+            record = mm[start:start + _RECORD_SIZE]
+            xpub_id = int.from_bytes(record[21:24], 'big')
+            branch = int.from_bytes(record[24:28], 'big')
+            index = int.from_bytes(record[28:32], 'big')
+            path = f"./{branch}/{index}"
+            result.append((self.xpub(xpub_id), path, record[20] == 1))
+            lo += 1
+            start += _RECORD_SIZE
+        return result
+
+
+def lookup(filename: str, h160: bytes) -> List[Entry]:
+    """Return the (xpub, path, is_script_hash) entries of a hash160.
+
+    Use an H160Index instance for multiple lookups.
+    """
+
+    with H160Index(filename) as index:
+        return index.lookup(h160)
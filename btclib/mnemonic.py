@@ -10,7 +10,8 @@
 
 """Functions for entropy conversion from/to mnemonic sentence.
 
-Entropy must be represented as binary 0/1 string.
+Entropy must be represented as binary 0/1 string,
+or as (int, bit length) pair.
 
 Warning: these functions are not meant for end-users which are
 better served by the bip39 and electrum module functions.
@@ -20,12 +21,26 @@ import math
 from hashlib import pbkdf2_hmac
 from typing import List
 
-from .entropy import BinStr
+from .entropy import BinStr, IntEntropy, _binstr_from_int
 from .wordlists import _wordlists
 
 Mnemonic = str
 
 
+def _indexes_from_int_entropy(entropy: IntEntropy, lang: str) -> List[int]:
+    """Return the word-list indexes for a given (int, bit length) entropy.
+
+    Leading zeros are not considered redundant padding.
+    """
+
+    int_entropy, bits = entropy
+    bpw = _wordlists.bits_per_word(lang)
+    mask = (1 << bpw) - 1
+    nwords = math.ceil(bits/bpw)
+    return [(int_entropy >> (bpw * i)) & mask
+            for i in reversed(range(nwords))]
+
+
 def _indexes_from_entropy(entropy: BinStr, lang: str) -> List[int]:
     """Return the word-list indexes for a given binary 0/1 string entropy.
 
@@ -36,21 +51,7 @@ def _indexes_from_entropy(entropy: BinStr, lang: str) -> List[int]:
     are not considered redundant padding.
     """
 
-    bits = len(entropy)
-    int_entropy = int(entropy, 2)
-    n = _wordlists.language_length(lang)
-    indexes = []
-    while int_entropy:
-        int_entropy, index = divmod(int_entropy, n)
-        indexes.append(index)
-
-    # do not lose leading zeros entropy
-    bpw = _wordlists.bits_per_word(lang)
-    nwords = math.ceil(bits/bpw)
-    while len(indexes) < nwords:
-        indexes.append(0)
-
-    return list(reversed(indexes))
+    return _indexes_from_int_entropy((int(entropy, 2), len(entropy)), lang)
 
 
 def _mnemonic_from_indexes(indexes: List[int], lang: str) -> Mnemonic:
@@ -68,17 +69,26 @@ def _mnemonic_from_indexes(indexes: List[int], lang: str) -> Mnemonic:
     return ' '.join(words)
 
 
-def _indexes_from_mnemonic(mnemonic: Mnemonic, lang: str) -> List[int]:
+def _indexes_from_mnemonic(mnemonic: Mnemonic, lang: str,
+                           abbreviated: bool = False) -> List[int]:
     """Return the word-list indexes for a given mnemonic.
 
     Return the list of integer indexes into a language word-list
-    for a given mnemonic.
+    for a given mnemonic, possibly made of abbreviated words.
     """
 
     words = mnemonic.split()
-    wordlist = _wordlists.wordlist(lang)
-    indexes = [wordlist.index(w) for w in words]
-    return indexes
+    return [_wordlists.index(w, lang, abbreviated) for w in words]
+
+
+def _int_entropy_from_indexes(indexes: List[int], lang: str) -> IntEntropy:
+    """Return the (int, bit length) entropy from a list of indexes."""
+
+    bpw = _wordlists.bits_per_word(lang)
+    entropy = 0
+    for index in indexes:
+        entropy = (entropy << bpw) + index
+    return entropy, len(indexes)*bpw
 
 
 def _entropy_from_indexes(indexes: List[int], lang: str) -> BinStr:
@@ -88,16 +98,4 @@ def _entropy_from_indexes(indexes: List[int], lang: str) -> BinStr:
     a given language word-list.
     """
 
-    n = _wordlists.language_length(lang)
-    entropy = 0
-    for index in indexes:
-        entropy = entropy*n + index
-
-    binentropy = bin(entropy)[2:]    # remove '0b'
-
-    # do not lose leading zeros entropy
-    bpw = _wordlists.bits_per_word(lang)
-    bits = len(indexes)*bpw
-    binentropy = binentropy.zfill(bits)
-
-    return binentropy
+    return _binstr_from_int(*_int_entropy_from_indexes(indexes, lang))
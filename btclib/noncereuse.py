@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Nonce reuse detection over large signature corpora.
+
+Two signatures from the same private key sharing the same
+ephemeral key (nonce) k also share the same r: the private key
+can then be recovered using dsa.crack_prvkey or ssa.crack_prvkey.
+
+The scanner ingests (msg, pubkey, sig) records as a stream,
+indexing them by a compact hash of (r, pubkey).
+The in-memory index is bounded: when full, it is spilled
+to an on-disk SQLite database, which is looked up afterwards.
+Recovered private keys are yielded as soon as a collision appears.
+
+It is intended for auditing one's own signers.
+"""
+
+import os
+import sqlite3
+import tempfile
+from hashlib import sha256
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+
+from . import dsa, ssa
+from .alias import DSASig, HashF, PubKey, SSASig, String
+from .curve import Curve
+from .curvemult import mult
+from .curves import secp256k1
+from .secpoint import bytes_from_point
+from .to_pubkey import to_pubkey_tuple
+
+Record = Tuple[String, PubKey, Union[DSASig, SSASig]]
+
+# (pubkey, q, k)
+Cracked = Tuple[bytes, int, int]
+
+
+def records_from_file(filename: str) -> Iterator[Tuple[bytes, bytes, bytes]]:
+    """Yield (msg, pubkey, sig) records from a text file.
+
+    Each line is made of three whitespace separated hex-strings:
+    message, public key, and signature (DER for ECDSA,
+    64 bytes for BIP340-Schnorr). Blank lines are skipped.
+    """
+
+    with open(filename, 'r') as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            msg, pubkey, sig = fields
+            yield bytes.fromhex(msg), bytes.fromhex(pubkey), bytes.fromhex(sig)
+
+
+class _Index:
+    # bounded in-memory dict, spilled to an SQLite table when full
+
+    def __init__(self, max_entries: int, filename: Optional[str]) -> None:
+        self.max_entries = max_entries
+        self.filename = filename
+        self.mem: Dict[bytes, Tuple[bytes, int]] = dict()
+        self.db: Optional[sqlite3.Connection] = None
+        self.tmpfile: Optional[str] = None
+
+    def get(self, key: bytes) -> Optional[Tuple[bytes, int]]:
+        value = self.mem.get(key)
+        if value is not None or self.db is None:
+            return value
+        row = self.db.execute("SELECT msg, s FROM idx WHERE key = ?",
+                              (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], int.from_bytes(row[1], byteorder='big')
+
+    def add(self, key: bytes, msg: bytes, s: int) -> None:
+        self.mem[key] = msg, s
+        if len(self.mem) >= self.max_entries:
+            self.spill()
+
+    def spill(self) -> None:
+        if self.db is None:
+            if self.filename is None:
+                fd, self.tmpfile = tempfile.mkstemp(suffix='.sqlite')
+                os.close(fd)
+                self.filename = self.tmpfile
+            self.db = sqlite3.connect(self.filename)
+            # discard the rows left over by a previous scan
+            self.db.execute("DROP TABLE IF EXISTS idx")
+            self.db.execute("CREATE TABLE idx "
+                            "(key BLOB PRIMARY KEY, msg BLOB, s BLOB)")
+        rows = ((key, msg, s.to_bytes((s.bit_length() + 7) // 8, 'big'))
+                for key, (msg, s) in self.mem.items())
+        self.db.executemany("INSERT OR IGNORE INTO idx VALUES (?, ?, ?)", rows)
+        self.db.commit()
+        self.mem.clear()
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+        if self.tmpfile is not None:
+            os.remove(self.tmpfile)
+            self.tmpfile = None
+
+
+def _crack(msg1: bytes, r: int, s1: int, msg2: bytes, s2: int,
+           pubkey: bytes, bip340: bool,
+           ec: Curve, hf: HashF) -> Optional[Tuple[int, int]]:
+    # return (q, k), if successfully checked against the public key
+
+    if s1 == s2:  # identical signatures
+        return None
+    if bip340:
+        candidates = [s2]
+    else:
+        # ECDSA low-s encoding might have negated one of the two s
+        candidates = [s2, ec.n - s2]
+    for s in candidates:
+        try:
+            if bip340:
+                q, k = ssa.crack_prvkey(msg1, (r, s1), msg2, (r, s),
+                                        pubkey, ec, hf)
+                if mult(q, ec.G, ec)[0] == int.from_bytes(pubkey, 'big'):
+                    return q, k
+            else:
+                q, k = dsa.crack_prvkey(msg1, (r, s1), msg2, (r, s), ec, hf)
+                if bytes_from_point(mult(q, ec.G, ec), True, ec) == pubkey:
+                    return q, k
+        except Exception:
+            pass
+    return None
+
+
+def scan(records: Iterable[Record], bip340: bool = False,
+         max_entries: int = 1_000_000, spill_filename: Optional[str] = None,
+         ec: Curve = secp256k1, hf: HashF = sha256) -> Iterator[Cracked]:
+    """Yield (pubkey, q, k) for each private key with reused nonce.
+
+    Records are ECDSA (msg, pubkey, sig) triples,
+    or BIP340-Schnorr ones if bip340 is True.
+    Records that cannot be parsed are skipped.
+
+    At most max_entries records are kept in memory: the others are
+    spilled to the SQLite spill_filename (a temporary file,
+    removed at the end of the scan, if not provided):
+    its index table, if already existing, is overwritten.
+    Each private key is yielded only once, together with the
+    compressed SEC (ECDSA) or x-only (BIP340-Schnorr) public key,
+    after having been checked against the public key itself.
+    """
+
+    if max_entries < 1:
+        raise ValueError(f"max_entries ({max_entries}) must be positive")
+
+    index = _Index(max_entries, spill_filename)
+    cracked: Set[bytes] = set()
+    try:
+        for msg, pubkey, sig in records:
+            try:
+                if isinstance(msg, str):
+                    msg = msg.encode()
+                if bip340:
+                    x_Q = ssa.to_bip340_pubkey_tuple(pubkey, ec)[0]
+                    pubkey_bytes = x_Q.to_bytes(ec.psize, 'big')
+                    r, s = ssa._to_sig(sig, ec)
+                else:
+                    Q = to_pubkey_tuple(pubkey, ec)
+                    pubkey_bytes = bytes_from_point(Q, True, ec)
+                    r, s = dsa._to_sig(sig, ec)
+            except Exception:
+                continue
+
+            if pubkey_bytes in cracked:
+                continue
+
+            rsize = max(ec.psize, ec.nsize)
+            h = sha256(r.to_bytes(rsize, 'big') + pubkey_bytes)
+            key = h.digest()[:16]
+            value = index.get(key)
+            if value is None:
+                index.add(key, msg, s)
+                continue
+
+            msg2, s2 = value
+            result = _crack(msg, r, s, msg2, s2, pubkey_bytes, bip340, ec, hf)
+            if result is not None:
+                cracked.add(pubkey_bytes)
+                yield (pubkey_bytes,) + result
+    finally:
+        index.close()
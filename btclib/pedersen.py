@@ -30,16 +30,20 @@ It is crucial for H to be Nothing-Up-My-Sleeve (NUMS), i.e.
 the discrete logarithm of H with respect to G must be unknown.
 """
 
+from functools import lru_cache
 from hashlib import sha256
+from typing import List, Sequence
 
-from .alias import HashF, Point
-from .curve import Curve
-from .curvemult import double_mult
+from .alias import HashF, JacPoint, Point
+from .curve import Curve, _jac_from_aff
+from .curvemult import (FixedBaseTable, _fixed_base_table, _generator_table,
+                        _mult_fixed, _multi_mult)
 from .curves import secp256k1
 from .secpoint import bytes_from_point
 from .utils import int_from_bits
 
 
+@lru_cache(maxsize=None)
 def second_generator(ec: Curve = secp256k1, hf: HashF = sha256) -> Point:
     """Second (with respect to G) elliptic curve generator.
 
@@ -53,6 +57,8 @@ def second_generator(ec: Curve = secp256k1, hf: HashF = sha256) -> Point:
     idea: https://crypto.stackexchange.com/questions/25581/second-generator-for-secp256k1-curve
 
     source: https://github.com/ElementsProject/secp256k1-zkp/blob/secp256k1-zkp/src/modules/rangeproof/main_impl.h
+
+    The result is cached for each (ec, hf) pair.
     """
 
     G_bytes = bytes_from_point(ec.G, False, ec)
@@ -70,6 +76,20 @@ def second_generator(ec: Curve = secp256k1, hf: HashF = sha256) -> Point:
     return hx, hy
 
 
+@lru_cache(maxsize=None)
+def _second_generator_table(ec: Curve, hf: HashF) -> FixedBaseTable:
+    # fixed-base table of H, computed once for each (ec, hf) pair
+    H = second_generator(ec, hf)
+    return _fixed_base_table(_jac_from_aff(H), ec)
+
+
+def _commit(r: int, v: int, ec: Curve, hf: HashF) -> JacPoint:
+    # rG+vH as two fixed-base multiplications, in Jacobian coordinates
+    RJ = _mult_fixed(r, _generator_table(ec), ec)
+    VJ = _mult_fixed(v, _second_generator_table(ec, hf), ec)
+    return ec._add_jac(RJ, VJ)
+
+
 def commit(r: int, v: int, ec: Curve = secp256k1, hf: HashF = sha256) -> Point:
     """Commit to r, returning rG+vH.
 
@@ -77,12 +97,30 @@ def commit(r: int, v: int, ec: Curve = secp256k1, hf: HashF = sha256) -> Point:
     (NUMS) generator of the curve.
     """
 
-    H = second_generator(ec, hf)
-    Q = double_mult(v, H, r, ec.G, ec)
+    Q = ec._aff_from_jac(_commit(r, v, ec, hf))
     assert Q[1] != 0, "how did you do that?!?"
     return Q
 
 
+def commit_many(rs: Sequence[int], vs: Sequence[int],
+                ec: Curve = secp256k1, hf: HashF = sha256) -> List[Point]:
+    """Return the commitments r_i*G+v_i*H for each (r_i, v_i) pair.
+
+    Jacobian coordinates are converted to affine ones
+    with a single modular inversion for the whole batch.
+    """
+
+    if len(rs) != len(vs):
+        errMsg = f"mismatch between number of r ({len(rs)}) "
+        errMsg += f"and number of v ({len(vs)})"
+        raise ValueError(errMsg)
+
+    Qs = ec._aff_from_jac_batch([_commit(r, v, ec, hf) for r, v in zip(rs, vs)])
+    for Q in Qs:
+        assert Q[1] != 0, "how did you do that?!?"
+    return Qs
+
+
 def open(r: int, v: int, C: Point, ec: Curve = secp256k1, hf: HashF = sha256) -> bool:
     """Open the commitment C and return True if valid."""
 
@@ -92,3 +130,42 @@ def open(r: int, v: int, C: Point, ec: Curve = secp256k1, hf: HashF = sha256) ->
     except:
         return False
     return C == P
+
+
+def verify_sum(inputs: Sequence[Point], outputs: Sequence[Point],
+               ec: Curve = secp256k1) -> bool:
+    """Return True if the input commitments minus the outputs are zero.
+
+    Pedersen commitments are additively homomorphic:
+    the check is performed as a single multi scalar multiplication
+    of the input commitments and of the opposite output commitments.
+    """
+
+    # try/except wrapper for the Errors raised by _verify_sum
+    try:
+        _verify_sum(inputs, outputs, ec)
+    except Exception:
+        return False
+    else:
+        return True
+
+
+def _verify_sum(inputs: Sequence[Point], outputs: Sequence[Point],
+                ec: Curve) -> None:
+
+    scalars: List[int] = list()
+    points: List[JacPoint] = list()
+    for C in inputs:
+        ec.require_on_curve(C)
+        scalars.append(1)
+        points.append(_jac_from_aff(C))
+    for C in outputs:
+        # opposite point, with unit scalar: a n-1 scalar would be
+        # an unfortunate input for the Bos-Coster algorithm
+        C = ec.opposite(C)
+        scalars.append(1)
+        points.append(_jac_from_aff(C))
+
+    if points:
+        RJ = _multi_mult(scalars, points, ec)
+        assert RJ[2] == 0, "inputs minus outputs is not zero"
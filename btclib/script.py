@@ -18,10 +18,13 @@ where Token = Union[int, str, bytes]:
 * int [-1, 16] are shorcuts for 'OP_1NEGATE', 'OP_0' - 'OP_16'
 * str are for opcodes (e.g. 'OP_HASH160') or hexstring data
 * bytes are for data (but integers are often casted to int)
+
+For bulk parsing, iter_decode lazily yields opcodes as int
+and pushed data as memoryview of the input script.
 """
 
 from io import BytesIO
-from typing import BinaryIO, Iterable, List, Union
+from typing import BinaryIO, Iterable, Iterator, List, Union
 
 from . import varint
 from .alias import Octets
@@ -244,52 +247,56 @@ Token = Union[int, str, bytes]
 Script = Union[bytes, Iterable[Token]]
 
 
-def _op_pushdata(data: Octets) -> bytes:
-    """Convert to canonical push: OP_PUSHDATA (if needed) | length | data.
+def _pushdata_header(length: int) -> bytes:
+    """Return the canonical push header: OP_PUSHDATA (if needed) | length.
 
     According to standardness rules (BIP-62) the
     minimum possible PUSHDATA operator must be used.
     Byte vectors on the stack are not allowed to be more than 520 bytes long.
     """
 
-    data = bytes_from_octets(data)
-    r = b''
-    length = len(data)
     if length < 75:     # 1-byte-length
-        r += length.to_bytes(1, byteorder='little')
+        return length.to_bytes(1, byteorder='little')
     elif length < 256:  # OP_PUSHDATA1 | 1-byte-length
-        r += OP_CODES['OP_PUSHDATA1']
-        r += length.to_bytes(1, byteorder='little')
+        return OP_CODES['OP_PUSHDATA1'] + length.to_bytes(1, byteorder='little')
     elif length < 521:  # OP_PUSHDATA2 | 2-byte-length
-        r += OP_CODES['OP_PUSHDATA2']
-        r += length.to_bytes(2, byteorder='little')
+        return OP_CODES['OP_PUSHDATA2'] + length.to_bytes(2, byteorder='little')
     else:
         # because of the 520 bytes limit
         # there is no need to use OP_PUSHDATA4
         # r += OP_CODES['OP_PUSHDATA4']
         # r += length.to_bytes(4, byteorder='little')
         raise ValueError(f"Script: Cannot push {length} bytes on the stack")
-    r += data
-    return r
+
+
+def _op_pushdata(data: Octets) -> bytes:
+    """Convert to canonical push: OP_PUSHDATA (if needed) | length | data."""
+
+    data = bytes_from_octets(data)
+    return _pushdata_header(len(data)) + data
+
+
+# opcodes of the integers [-1, 16]
+_SMALL_INTS = {i: OP_CODES['OP_' + str(i)] for i in range(17)}
+_SMALL_INTS[-1] = OP_CODES['OP_1NEGATE']
 
 
 def encode(script: Iterable[Token]) -> bytes:
-    r = b''
+    r = bytearray()
     for token in script:
         if isinstance(token, int):
             # Short 1-byte opcodes exist
             # to push numbers in [-1, 16]
-            if token >= 0 and token <= 16:
-                r += OP_CODES['OP_' + str(token)]
-            elif token == -1:
-                r += OP_CODES['OP_1NEGATE']
+            if token in _SMALL_INTS:
+                r += _SMALL_INTS[token]
             # Pushing any other number requires an
             # explicit push operation of its bytes encoding
             # FIXME: negative numbers?
             else:
                 nbytes = (token.bit_length() + 7) // 8
                 data = token.to_bytes(nbytes, byteorder='little')
-                r += _op_pushdata(data)
+                r += _pushdata_header(nbytes)
+                r += data
         elif isinstance(token, str):
             token = token.strip()
             token = token.upper()
@@ -297,15 +304,50 @@ def encode(script: Iterable[Token]) -> bytes:
                 r += OP_CODES[token]
             else:
                 try:
-                   token = bytes.fromhex(token)
+                   data = bytes.fromhex(token)
                 except Exception:
                     raise ValueError(f"Script: invalid {token!r} opcode")
-                r += _op_pushdata(token)
+                r += _pushdata_header(len(data))
+                r += data
         elif isinstance(token, bytes):
-                r += _op_pushdata(token)
+                r += _pushdata_header(len(token))
+                r += token
         else:
             raise ValueError(f"Script: unmanaged {type(token)} token type")
-    return r
+    return bytes(r)
+
+
+def iter_decode(script: Union[Octets, memoryview]
+                ) -> Iterator[Union[int, memoryview]]:
+    """Yield the script tokens lazily, without copying the pushed data.
+
+    Operations are yielded as opcode int (e.g. 0 for OP_0, 118 for OP_DUP),
+    pushed data as memoryview of the input script.
+    """
+
+    script = bytes_from_octets(script)
+    view = memoryview(script)
+
+    length = len(script)
+    i = 0
+    while i < length:
+        op = script[i]
+        i += 1
+        if 0 < op < 76:
+            # 1-byte-data-length | data
+            size = op
+        elif 76 <= op <= 78:
+            # OP_PUSHDATA1/2/4 | 1/2/4-byte-data-length | data
+            n = 1 << (op - 76)
+            size = int.from_bytes(script[i:i+n], byteorder='little')
+            i += n
+        else:
+            yield op
+            continue
+        if i + size > length:
+            raise ValueError(f"Script: truncated push of {size} bytes")
+        yield view[i:i+size]
+        i += size
 
 
 def decode(script: Octets) -> List[Token]:
@@ -316,11 +358,10 @@ def decode(script: Octets) -> List[Token]:
     r: List[Union[str, int, bytes]] = []
 
     length = len(script)
-    s = BytesIO(script)  # TODO: avoid unnecessary streamification
     counter = 0
     while counter < length:
-        # get one byte and convert it to an integer
-        i = s.read(1)[0]
+        # get one byte as an integer
+        i = script[counter]
         counter += 1
         if i == 0:
             # numeric value 0 (OP_0)
@@ -333,7 +374,7 @@ def decode(script: Octets) -> List[Token]:
             r.append(i-80)
         elif i < 76:
             # 1-byte-data-length | data
-            data = s.read(i)
+            data = script[counter:counter+i]
             counter += i
             n = int.from_bytes(data, byteorder='little')
             if n <= 0xffffffff:
@@ -341,24 +382,14 @@ def decode(script: Octets) -> List[Token]:
                 r.append(n)
             else:
                 r.append(data.hex())
-        elif i == 76:
-            # OP_PUSHDATA1 | 1-byte-data-length | data
-            data_length = int.from_bytes(s.read(1), byteorder='little')
-            data = s.read(data_length)
-            counter += 1 + data_length
-            r.append(data.hex())
-        elif i == 77:
-            # OP_PUSHDATA2 | 2-byte-data-length | data
-            data_length = int.from_bytes(s.read(2), byteorder='little')
-            data = s.read(data_length)
-            counter += 2 + data_length
-            r.append(data.hex())
-        elif i == 78:
-            # OP_PUSHDATA4 | 4-byte-data-length | data
-            data_length = int.from_bytes(s.read(4), byteorder='little')
-            data = s.read(data_length)
-            counter += 4 + data_length
-            r.append(data.hex())
+        elif i < 79:
+            # OP_PUSHDATA1/2/4 | 1/2/4-byte-data-length | data
+            n = 1 << (i - 76)
+            data_length = int.from_bytes(script[counter:counter+n],
+                                         byteorder='little')
+            counter += n
+            r.append(script[counter:counter+data_length].hex())
+            counter += data_length
         else:
             # OP_CODE
             r.append(OP_CODE_NAMES[i])
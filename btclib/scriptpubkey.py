@@ -12,17 +12,19 @@
 
 """
 
-from typing import Iterable, List, Tuple, Union
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from .alias import Octets, PubKey, String
 from .base58address import b58address_from_h160, h160_from_b58address
 from .bech32address import (b32address_from_witness, has_segwit_prefix,
                             witness_from_b32address)
 from .curves import secp256k1
-from .network import _NETWORKS, _P2PKH_PREFIXES, _P2SH_PREFIXES
+from .network import (_NETWORKS, _P2PKH_PREFIXES, _P2SH_PREFIXES,
+                      _P2W_PREFIXES)
 from .script import Token, encode
 from .to_pubkey import to_pubkey_bytes
-from .utils import bytes_from_octets
+from .utils import bytes_from_octets, stream_map
 
 
 def nulldata_scriptPubKey(data: Octets) -> List[Token]:
@@ -113,25 +115,87 @@ def p2wsh_scriptPubKey(script_h256: Octets) -> List[Token]:
     return [0, script_h256.hex()]
 
 
+def payload_from_scriptPubKey(script: Octets) -> Tuple[str, memoryview]:
+    """Return (type, payload) of the input raw scriptPubKey.
+
+    The standard scriptPubKey templates are recognized
+    by length and fixed opcode positions, without decoding the script:
+
+    * 'p2pk': the pubkey
+    * 'p2pkh': the HASH160 pubkey-hash
+    * 'p2sh': the HASH160 script-hash
+    * 'p2wpkh': the HASH160 pubkey-hash witness program
+    * 'p2wsh': the SHA256 script-hash witness program
+    * 'p2ms': the pubkeys pushes (1-byte-length | pubkey) between m and n
+    * 'nulldata': the data pushed after OP_RETURN
+
+    The payload is a memoryview of the input script (i.e. no copy);
+    any other script is 'nonstandard' with the whole script as payload.
+    """
+
+    if isinstance(script, str):
+        script = bytes_from_octets(script)
+    s = memoryview(script)
+    length = len(s)
+
+    # OP_DUP OP_HASH160 0x14{20-byte pubkey-hash} OP_EQUALVERIFY OP_CHECKSIG
+    if (length == 25 and s[0] == 0x76 and s[1] == 0xa9 and s[2] == 0x14
+            and s[23] == 0x88 and s[24] == 0xac):
+        return 'p2pkh', s[3:23]
+    # OP_HASH160 0x14{20-byte script-hash} OP_EQUAL
+    if length == 23 and s[0] == 0xa9 and s[1] == 0x14 and s[22] == 0x87:
+        return 'p2sh', s[2:22]
+    # 0x0014{20-byte pubkey-hash}
+    if length == 22 and s[0] == 0x00 and s[1] == 0x14:
+        return 'p2wpkh', s[2:]
+    # 0x0020{32-byte script-hash}
+    if length == 34 and s[0] == 0x00 and s[1] == 0x20:
+        return 'p2wsh', s[2:]
+    # 0x21{33-byte compressed pubkey} OP_CHECKSIG
+    # 0x41{65-byte uncompressed pubkey} OP_CHECKSIG
+    if length == 35 and s[0] == 0x21 and s[1] in (2, 3) and s[34] == 0xac:
+        return 'p2pk', s[1:34]
+    if length == 67 and s[0] == 0x41 and s[1] == 4 and s[66] == 0xac:
+        return 'p2pk', s[1:66]
+    # OP_RETURN [single push of up to 80 bytes]
+    if length and s[0] == 0x6a:
+        if length == 1:
+            return 'nulldata', s[1:]
+        if s[1] < 0x4c and length == 2 + s[1]:
+            return 'nulldata', s[2:]
+        if s[1] == 0x4c and length > 2 and length == 3 + s[2] <= 83:
+            return 'nulldata', s[3:]
+    # OP_m {n 0x21|0x41 pubkey pushes} OP_n OP_CHECKMULTISIG
+    if length > 3 and s[-1] == 0xae and 0x51 <= s[0] <= s[-2] <= 0x60:
+        n = s[-2] - 0x50
+        i = 1
+        end = length - 2
+        for _ in range(n):
+            if i >= end or s[i] not in (0x21, 0x41):
+                break
+            i += 1 + s[i]
+        else:
+            if i == end:
+                return 'p2ms', s[1:end]
+
+    return 'nonstandard', s
+
+
 def address_from_scriptPubKey(s: Union[Iterable[Token], bytes],
                               network: str = "mainnet") -> bytes:
     """Return the bech32/base58 address from the input scriptPubKey."""
 
     if not isinstance(s, bytes):
         s = encode(s)
-    length = len(s)
-    # [0, script_hash] : 0x0020{32-byte key-script_hash}
-    if length == 34 and s[:2] == b'\x00\x20':
-        return b32address_from_witness(0, s[2:], network)
-    # [0, key_hash]    : 0x0014{20-byte key-hash}
-    elif length == 22 and s[:2] == b'\x00\x14':
-        return b32address_from_witness(0, s[2:], network)
-    elif length == 23 and s[:2] == b'\xa9\x14' and s[-1:] == b'\x87':
+    script_type, payload = payload_from_scriptPubKey(s)
+    if script_type in ('p2wpkh', 'p2wsh'):
+        return b32address_from_witness(0, bytes(payload), network)
+    elif script_type == 'p2sh':
         prefix = _P2SH_PREFIXES[_NETWORKS.index(network)]
-        return b58address_from_h160(prefix, s[2:length-1])
-    elif length == 25 and s[:3] == b'\x76\xa9\x14' and s[-2:] == b'\x88\xac':
+        return b58address_from_h160(prefix, bytes(payload))
+    elif script_type == 'p2pkh':
         prefix = _P2PKH_PREFIXES[_NETWORKS.index(network)]
-        return b58address_from_h160(prefix, s[3:length-2])
+        return b58address_from_h160(prefix, bytes(payload))
     else:
         raise ValueError(f"No address for script {s.decode()}")
 
@@ -156,3 +220,68 @@ def scriptPubKey_from_address(addr: String) -> Tuple[List[Token], str]:
             return p2sh_scriptPubKey(h160), network
         else:
             return p2pkh_scriptPubKey(h160), network
+
+
+# (scriptPubKey, network, error message):
+# scriptPubKey and network are empty for invalid addresses,
+# the error message is empty for valid ones
+ScriptPubKeyResult = Tuple[bytes, str, str]
+
+_SEGWIT_PREFIXES = tuple(hrp + '1' for hrp in _P2W_PREFIXES)
+# max length of the segwit prefixes
+_SEGWIT_PREFIX_LEN = max(len(prefix) for prefix in _SEGWIT_PREFIXES)
+
+
+def _scriptpubkey_from_address(addr: String) -> ScriptPubKeyResult:
+    # raw scriptPubKey from an address classified by its prefix
+
+    try:
+        addr = addr.strip()
+        prefix = addr[:_SEGWIT_PREFIX_LEN]
+        if isinstance(prefix, bytes):
+            prefix = prefix.decode('ascii')
+        if prefix.lower().startswith(_SEGWIT_PREFIXES):
+            witvers, witprog, network, _ = witness_from_b32address(addr)
+            if witvers != 0:
+                return b'', '', f"Unhandled witness version ({witvers})"
+            # 0x0014{20-byte key-hash} or 0x0020{32-byte script-hash}
+            return b'\x00' + bytes([len(witprog)]) + witprog, network, ''
+        _, h160, network, is_p2sh = h160_from_b58address(addr)
+    except ValueError as e:
+        return b'', '', str(e)
+    if is_p2sh:
+        return b'\xa9\x14' + h160 + b'\x87', network, ''
+    return b'\x76\xa9\x14' + h160 + b'\x88\xac', network, ''
+
+
+def _scriptpubkeys_worker(addresses: List[String]) -> List[ScriptPubKeyResult]:
+    return [_scriptpubkey_from_address(addr) for addr in addresses]
+
+
+def scriptpubkeys_from_addresses(addresses: Iterable[String],
+                                 max_workers: Optional[int] = 1,
+                                 threads: bool = False,
+                                 chunk_size: int = 1000
+                                 ) -> Iterator[ScriptPubKeyResult]:
+    """Yield (scriptPubKey, network, error) for bech32/base58 addresses.
+
+    The scriptPubKey is returned as raw script bytes,
+    the address type being identified by its prefix.
+    Invalid addresses do not raise, but are reported
+    with empty scriptPubKey and network and the error message,
+    so that results are always aligned with the input addresses.
+
+    The input iterable is consumed lazily in chunks of chunk_size
+    addresses; if max_workers is not 1, chunks are converted by a pool
+    of max_workers processes (as many as the processors, if None),
+    or threads if threads is True; results are yielded
+    in the input order, as soon as available.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+    addresses = iter(addresses)
+    chunks = iter(lambda: list(islice(addresses, chunk_size)), [])
+    for results in stream_map(_scriptpubkeys_worker, chunks,
+                              max_workers, threads):
+        yield from results
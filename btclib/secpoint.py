@@ -10,6 +10,9 @@
 
 """SEC compressed/uncompressed point representation."""
 
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from .alias import Octets, Point
 from .curve import Curve
 from .curves import secp256k1
@@ -36,27 +39,66 @@ def bytes_from_point(Q: Point, compressed: bool = True, ec: Curve = secp256k1) -
     return b'\x04' + bPx + Q[1].to_bytes(ec.psize, byteorder='big')
 
 
+def _point_from_compressed(pubkey: bytes, ec: Curve) -> Point:
+    # pubkey is assumed to be a bytes compressed point, ec.psize+1 long
+    if pubkey[0] not in (0x02, 0x03):
+        msg = f"{ec.psize+1} bytes, but not a compressed point"
+        raise ValueError(msg)
+    Px = int.from_bytes(pubkey[1:], byteorder='big')
+    try:
+        Py = ec.y_odd(Px, pubkey[0] % 2)  # also check Px validity
+        return Px, Py
+    except:
+        msg = f"{ec.psize+1} bytes, but not a valid x coordinate {Px}"
+        raise ValueError(msg)
+
+
+# decompression requires a modular square root:
+# recurring keys are served by an LRU cache
+_POINT_CACHE_SIZE = 4096
+_cached_point_from_compressed = lru_cache(
+    maxsize=_POINT_CACHE_SIZE)(_point_from_compressed)
+
+
+def point_cache_resize(maxsize: Optional[int] = _POINT_CACHE_SIZE) -> None:
+    """Resize (and clear) the compressed point decompression cache.
+
+    A maxsize of 0 disables the cache, None makes it unbounded.
+    """
+    global _cached_point_from_compressed
+    _cached_point_from_compressed = lru_cache(
+        maxsize=maxsize)(_point_from_compressed)
+
+
+def point_cache_info() -> Tuple[int, int, Optional[int], int]:
+    """Return the decompression cache statistics.
+
+    The statistics are hits, misses, maxsize, and currsize,
+    as a named tuple.
+    """
+    return _cached_point_from_compressed.cache_info()
+
+
+def point_cache_clear() -> None:
+    """Clear the decompression cache and its statistics."""
+    _cached_point_from_compressed.cache_clear()
+
+
 def point_from_octets(pubkey: Octets, ec: Curve = secp256k1) -> Point:
     """Return a tuple (Px, Py) that belongs to the curve.
 
     Return a tuple (Px, Py) that belongs to the curve according to
     SEC 1 v.2, section 2.3.4.
+
+    Compressed points are decompressed using an LRU cache.
     """
 
     pubkey = bytes_from_octets(pubkey)
 
     bsize = len(pubkey)  # bytes
     if bsize == ec.psize + 1:                 # compressed point
-        if pubkey[0] not in (0x02, 0x03):
-            msg = f"{ec.psize+1} bytes, but not a compressed point"
-            raise ValueError(msg)
-        Px = int.from_bytes(pubkey[1:], byteorder='big')
-        try:
-            Py = ec.y_odd(Px, pubkey[0] % 2)  # also check Px validity
-            return Px, Py
-        except:
-            msg = f"{ec.psize+1} bytes, but not a valid x coordinate {Px}"
-            raise ValueError(msg)
+        # bytes(...) as bytearray is not hashable
+        return _cached_point_from_compressed(bytes(pubkey), ec)
     else:                                     # uncompressed point
         if bsize != 2*ec.psize + 1:
             msg = f"wrong byte-size ({bsize}) for a point: it "
@@ -72,3 +114,22 @@ def point_from_octets(pubkey: Octets, ec: Curve = secp256k1) -> Point:
             return P
         else:
             raise ValueError(f"point {P} not on curve")
+
+
+def points_from_octets_batch(pubkeys: Sequence[Octets],
+                             ec: Curve = secp256k1) -> List[Point]:
+    """Return the list of points from a list of octet sequences.
+
+    Duplicated octet sequences are converted only once.
+    """
+
+    points: Dict[bytes, Point] = dict()
+    result: List[Point] = list()
+    for pubkey in pubkeys:
+        pubkey = bytes(bytes_from_octets(pubkey))
+        P = points.get(pubkey)
+        if P is None:
+            P = point_from_octets(pubkey, ec)
+            points[pubkey] = P
+        result.append(P)
+    return result
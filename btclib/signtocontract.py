@@ -34,14 +34,14 @@ with e = hash(R||c)) and W.x being known from the signature.
 """
 
 from hashlib import sha256
-from typing import Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from btclib import bip32
 
 from . import dsa, ssa
-from .alias import HashF, Octets, Point
-from .curve import Curve
-from .curvemult import mult
+from .alias import INFJ, HashF, JacPoint, Octets, Point
+from .curve import Curve, _jac_from_aff
+from .curvemult import _generator_table, _mult_fixed, mult
 from .curves import secp256k1
 from .rfc6979 import rfc6979
 from .to_prvkey import to_prvkey_int
@@ -125,12 +125,26 @@ def ecssa_commit_sign(c: Octets, m: Octets,
 # FIXME: have create_commit instead of commit_sign
 
 
+def _tweaked_jac(c: Octets, R: Point, ec: Curve, hf: HashF) -> JacPoint:
+    # W = R + hash(R||hash(c))G, in Jacobian coordinates
+
+    c = bytes_from_octets(c)
+
+    h = hf()
+    h.update(c)
+    ch = h.digest()
+    h = hf()
+    h.update(bytes_from_point(R, True, ec) + ch)
+    e = h.digest()
+    e = int_from_bits(e, ec.nlen) % ec.n
+    # eG using the precomputed fixed-base table of the generator
+    return ec._add_jac(_jac_from_aff(R), _mult_fixed(e, _generator_table(ec), ec))
+
+
 def verify_commit(c: Octets, receipt: Receipt,
                   ec: Curve = secp256k1, hf: HashF = sha256) -> bool:
     """Open the commitment c inside an EC DSA/SSA signature."""
 
-    c = bytes_from_octets(c)
-
     # FIXME: verify the signature
 
     w, R = receipt
@@ -140,14 +154,39 @@ def verify_commit(c: Octets, receipt: Receipt,
 
     # verify R is a good point?
 
-    h = hf()
-    h.update(c)
-    ch = h.digest()
-    h = hf()
-    h.update(bytes_from_point(R, True, ec) + ch)
-    e = h.digest()
-    e = int_from_bits(e, ec.nlen) % ec.n
-    W = ec.add(R, mult(e, ec.G, ec))
+    W = ec._aff_from_jac(_tweaked_jac(c, R, ec, hf))
     # different verify functions?
     # return w == W[0] # ECSS
     return w == W[0] % ec.n  # ECDS, FIXME: ECSSA
+
+
+def verify_commit_many(cs: Sequence[Octets], receipts: Sequence[Receipt],
+                       ec: Curve = secp256k1,
+                       hf: HashF = sha256) -> List[bool]:
+    """Open the commitments cs inside EC DSA/SSA signatures.
+
+    Return a list of booleans, one for each (c, receipt) pair.
+
+    The receipt only provides the x-coordinate of W, not its
+    y-coordinate: W = R+eG cannot be folded into a single randomized
+    multi scalar equation, as the sign of each W would be unknown.
+    Instead, eG is computed with the fixed-base table of the generator
+    and all the W points are converted to affine coordinates
+    with a single modular inversion.
+    """
+
+    if len(cs) != len(receipts):
+        errMsg = f"mismatch between number of commitments ({len(cs)}) "
+        errMsg += f"and number of receipts ({len(receipts)})"
+        raise ValueError(errMsg)
+
+    WJs: List[JacPoint] = list()
+    for c, (_, R) in zip(cs, receipts):
+        try:
+            WJs.append(_tweaked_jac(c, R, ec, hf))
+        except Exception:
+            WJs.append(INFJ)  # invalid input: it will not match
+
+    Ws = ec._aff_from_jac_batch(WJs)
+    return [W[1] != 0 and w == W[0] % ec.n
+            for W, (w, _) in zip(Ws, receipts)]
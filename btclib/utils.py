@@ -16,7 +16,12 @@ https://www.secg.org/sec1-v2.pdf
 """
 
 import hashlib
-from typing import Optional, Union
+import os
+from collections import deque
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from typing import (Any, Callable, Deque, Iterable, Iterator, Optional,
+                    Union)
 
 from .alias import HashF, Octets
 
@@ -88,3 +93,43 @@ def ensure_is_power_of_two(n: int, var_name: str = None) -> None:
     # http://www.graphics.stanford.edu/~seander/bithacks.html
     if n & (n - 1) != 0:
         raise ValueError(f"{var_name} ({n}) must be a power of two")
+
+
+def stream_map(worker: Callable[[Any], Any], args: Iterable[Any],
+               max_workers: Optional[int] = None,
+               threads: bool = False) -> Iterator[Any]:
+    """Yield worker(arg) for each arg, computed by a pool of workers.
+
+    The computations are distributed over a pool of max_workers
+    processes (as many as the processors, if None), or threads if
+    threads is True; if max_workers is 1, they are performed in the
+    current process.
+    Results are yielded in the input order, as soon as available;
+    the input iterable is consumed lazily, with a bounded number
+    of pending computations, which are cancelled if the generator
+    is closed before exhaustion.
+    """
+
+    if max_workers == 1:
+        yield from map(worker, args)
+        return
+    pool: Executor
+    if threads:
+        pool = ThreadPoolExecutor(max_workers)
+    else:
+        pool = ProcessPoolExecutor(max_workers)
+    window = 4 * (max_workers or os.cpu_count() or 1)
+    pending: Deque = deque()
+    try:
+        for arg in args:
+            pending.append(pool.submit(worker, arg))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # if the consumer stops early (or a worker fails) drop the
+        # queued work: Executor.shutdown(cancel_futures=True) is 3.9+
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
@@ -8,16 +8,219 @@
 # No part of btclib including this file, may be copied, modified, propagated,
 # or distributed except according to the terms contained in the LICENSE file.
 
-"""Class for word-lists to be used in entropy/mnemonic conversions."""
+"""Class for word-lists to be used in entropy/mnemonic conversions.
+
+Word-lists text files are the source of truth; anyway, if available,
+a precompiled binary word-list (with the same file name and
+.bin extension) is loaded instead, being memory-mapped
+(and shared among forked processes) instead of being parsed.
+Words are then looked up directly in its hash table.
+
+A binary word-list is used only if up to date, i.e. if the source
+text file has the recorded size and modification time or, failing
+the latter, the recorded SHA256; a stale or invalid binary word-list
+is ignored, falling back to the text file.
+
+Binary word-list layout (all integers are unsigned little-endian):
+
+- magic b'btclibw3'
+- number of words (4 bytes)
+- bits per word (1 byte)
+- number of hash table slots, a power of two (4 bytes)
+- size of the source text file (8 bytes)
+- modification time of the source text file in nanoseconds (8 bytes)
+- SHA256 of the source text file (32 bytes)
+- offsets table: start of each word in the words blob,
+  plus the end of the last one ((number of words + 1) * 4 bytes)
+- hash table: 1 + word index, or zero for empty slots (4 bytes each),
+  slot is the zlib.crc32 of the UTF-8 word, with linear probing
+- words blob: concatenated UTF-8 words
+
+Binary word-lists are (re)generated with build_binary_wordlist.
+"""
 
 import math
+import mmap
+import os
+import sys
+import zlib
+from array import array
+from hashlib import sha256
 from os import path
-from typing import List
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from btclib.utils import ensure_is_power_of_two
 
 WordList = List[str]
 
+# length of the word prefixes indexed for abbreviated words lookup
+_PREFIX_LEN = 4
+
+_MAGIC = b'btclibw3'
+_HEADER_SIZE = len(_MAGIC) + 4 + 1 + 4 + 8 + 8 + 32
+
+
+def _words_from_text(filename: str) -> WordList:
+    # word-list from a text file, one word per line
+
+    with open(filename, 'r') as f:
+        lines = f.readlines()
+    nwords = len(lines)
+    ensure_is_power_of_two(nwords, "wordlist length")
+    # clean up and normalization are missing, but removal of \n
+    return [line[:-1] for line in lines]
+
+
+def _bin_filename(filename: str) -> str:
+    return path.splitext(filename)[0] + '.bin'
+
+
+def _text_digest(filename: str) -> bytes:
+    with open(filename, 'rb') as f:
+        return sha256(f.read()).digest()
+
+
+def build_binary_wordlist(filename: str,
+                          bin_filename: Optional[str] = None) -> str:
+    """Build the binary word-list from the text file, returning its name.
+
+    By default, the binary word-list has the same name of the text file,
+    with .bin extension.
+    """
+
+    words = [w.encode() for w in _words_from_text(filename)]
+    nwords = len(words)
+    stat = os.stat(filename)
+
+    offsets = [0]
+    for w in words:
+        offsets.append(offsets[-1] + len(w))
+
+    nslots = 2 * nwords
+    table = [0] * nslots
+    for i, w in enumerate(words):
+        slot = zlib.crc32(w) & (nslots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (nslots - 1)
+        table[slot] = i + 1
+
+    if bin_filename is None:
+        bin_filename = _bin_filename(filename)
+    with open(bin_filename, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(nwords.to_bytes(4, 'little'))
+        f.write(int(math.log(nwords, 2)).to_bytes(1, 'little'))
+        f.write(nslots.to_bytes(4, 'little'))
+        f.write(stat.st_size.to_bytes(8, 'little'))
+        f.write(stat.st_mtime_ns.to_bytes(8, 'little'))
+        f.write(_text_digest(filename))
+        f.writelines(offset.to_bytes(4, 'little') for offset in offsets)
+        f.writelines(slot.to_bytes(4, 'little') for slot in table)
+        f.writelines(words)
+    return bin_filename
+
+
+def _uint32s(mm: mmap.mmap, start: int, count: int) -> Sequence[int]:
+    # little-endian 4-bytes integers, without copy if possible
+
+    if sys.byteorder == 'little' and array('I').itemsize == 4:
+        return memoryview(mm)[start:start + count * 4].cast('I')
+    values = array('L' if array('I').itemsize < 4 else 'I')
+    values.extend(int.from_bytes(mm[i:i + 4], 'little')
+                  for i in range(start, start + count * 4, 4))
+    return values
+
+
+class _BinaryWordList:
+    # memory-mapped binary word-list
+
+    def __init__(self, filename: str) -> None:
+        with open(filename, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._check_header(filename)
+        except ValueError:
+            self.mm.close()
+            raise
+
+    def _check_header(self, filename: str) -> None:
+        mm = self.mm
+        size = len(mm)
+        if size < _HEADER_SIZE or mm[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Not a binary word-list: {filename}")
+        self.nwords = int.from_bytes(mm[8:12], 'little')
+        self.bits_per_word = mm[12]
+        self.nslots = int.from_bytes(mm[13:17], 'little')
+        self.text_size = int.from_bytes(mm[17:25], 'little')
+        self.text_mtime_ns = int.from_bytes(mm[25:33], 'little')
+        self.digest = mm[33:65]
+        if self.nwords == 0 or self.nwords != 1 << self.bits_per_word:
+            msg = f"Invalid number of words ({self.nwords}) "
+            msg += f"for {self.bits_per_word} bits per word: {filename}"
+            raise ValueError(msg)
+        nslots = self.nslots
+        if nslots <= self.nwords or nslots & (nslots - 1):
+            msg = f"Invalid number of hash table slots ({nslots}): {filename}"
+            raise ValueError(msg)
+        self.offsets_start = _HEADER_SIZE
+        self.table_start = self.offsets_start + (self.nwords + 1) * 4
+        self.words_start = self.table_start + nslots * 4
+        if size < self.words_start:
+            raise ValueError(f"Truncated binary word-list: {filename}")
+        end = int.from_bytes(mm[self.table_start - 4:self.table_start],
+                             'little')
+        if size != self.words_start + end:
+            msg = f"Invalid binary word-list size ({size} bytes "
+            msg += f"instead of {self.words_start + end}): {filename}"
+            raise ValueError(msg)
+
+    def is_up_to_date(self, filename: str) -> bool:
+        stat = os.stat(filename)
+        if stat.st_size != self.text_size:
+            return False
+        if stat.st_mtime_ns == self.text_mtime_ns:
+            return True
+        # e.g. a fresh checkout: check the content
+        return self.digest == _text_digest(filename)
+
+    def open(self) -> None:
+        self.offsets = _uint32s(self.mm, self.offsets_start, self.nwords + 1)
+        self.table = _uint32s(self.mm, self.table_start, self.nslots)
+        offsets = self.offsets
+        if offsets[0] != 0 or any(offsets[i] > offsets[i + 1]
+                                  for i in range(self.nwords)):
+            self.close()
+            raise ValueError("Invalid binary word-list offsets")
+
+    def close(self) -> None:
+        for name in ('offsets', 'table'):
+            view = self.__dict__.pop(name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        self.mm.close()
+
+    def words(self) -> WordList:
+        blob = self.mm[self.words_start:]
+        offsets = self.offsets
+        return [blob[offsets[i]:offsets[i + 1]].decode()
+                for i in range(self.nwords)]
+
+    def index(self, word: str) -> Optional[int]:
+        w = word.encode()
+        mm = self.mm
+        offsets = self.offsets
+        table = self.table
+        words_start = self.words_start
+        mask = self.nslots - 1
+        slot = zlib.crc32(w) & mask
+        while True:
+            i = table[slot]
+            if i == 0:
+                return None
+            if mm[words_start + offsets[i - 1]:words_start + offsets[i]] == w:
+                return i - 1
+            slot = (slot + 1) & mask
+
 
 class WordLists:
     """Class for word-lists to be used in entropy/mnemonic conversions.
@@ -30,6 +233,15 @@ class WordLists:
     More word-lists can be added using the load_lang method.
 
     Word-lists are loaded only if needed and read only once from disk.
+
+    At load time, a word to index dictionary is built;
+    a trie of the word prefixes up to four letters (flattened as
+    a prefix to indexes dictionary) is built when first needed,
+    so that words and abbreviated words are looked up without
+    scanning the word-list.
+    If an up to date precompiled binary word-list is available,
+    it is memory-mapped instead: words are looked up using its
+    hash table, while the word-list is built only when first needed.
     """
 
     def __init__(self) -> None:
@@ -44,6 +256,9 @@ class WordLists:
         # create dictionaries where each language has empty word-list
         wordlists: List[List[str]] = [[] for _ in self.languages]
         self._wordlist = dict(zip(self.languages, wordlists))
+        self._word_index: Dict[str, Dict[str, int]] = dict()
+        self._prefixes: Dict[str, Dict[str, Tuple[int, ...]]] = dict()
+        self._binary: Dict[str, _BinaryWordList] = dict()
 
         zeros = len(self.languages)*[0]
         self._bits_per_word = dict(zip(self.languages, zeros))
@@ -70,17 +285,49 @@ class WordLists:
 
         # language has not been loaded yet
         if self._language_length[lang] == 0:
-            with open(self.language_files[lang], 'r') as f:
-                lines = f.readlines()
-            f.closed
-
-            nwords = len(lines)
-            ensure_is_power_of_two(nwords, "wordlist length")
+            filename = self.language_files[lang]
+            bin_filename = _bin_filename(filename)
+            if path.isfile(bin_filename):
+                binary = self._load_binary(filename, bin_filename)
+                if binary is not None:
+                    self._binary[lang] = binary
+                    self._bits_per_word[lang] = binary.bits_per_word
+                    self._language_length[lang] = binary.nwords
+                    return
 
+            wordlist = _words_from_text(filename)
+            nwords = len(wordlist)
             self._bits_per_word[lang] = int(math.log(nwords, 2))
             self._language_length[lang] = nwords
-            # clean up and normalization are missing, but removal of \n
-            self._wordlist[lang] = [line[:-1] for line in lines]
+            self._wordlist[lang] = wordlist
+            self._word_index[lang] = {w: i for i, w in enumerate(wordlist)}
+
+    @staticmethod
+    def _load_binary(filename: str,
+                     bin_filename: str) -> Optional[_BinaryWordList]:
+        # the binary word-list, if valid and up to date
+
+        try:
+            binary = _BinaryWordList(bin_filename)
+        except ValueError:
+            return None
+        if not binary.is_up_to_date(filename):
+            binary.close()
+            return None
+        try:
+            binary.open()
+        except ValueError:
+            return None
+        return binary
+
+    def _build_prefixes(self, lang: str) -> None:
+
+        wordlist = self.wordlist(lang)
+        prefixes: Dict[str, List[int]] = dict()
+        for i, w in enumerate(wordlist):
+            for n in range(1, min(len(w), _PREFIX_LEN) + 1):
+                prefixes.setdefault(w[:n], []).append(i)
+        self._prefixes[lang] = {k: tuple(v) for k, v in prefixes.items()}
 
     def bits_per_word(self, lang: str) -> int:
         """Return the number of bits represented by a single word.
@@ -95,8 +342,40 @@ class WordLists:
         """Return the language word-list."""
 
         self.load_lang(lang)
+        if not self._wordlist[lang]:
+            self._wordlist[lang] = self._binary[lang].words()
         return self._wordlist[lang]
 
+    def index(self, word: str, lang: str, abbreviated: bool = False) -> int:
+        """Return the index of the word in the language word-list.
+
+        If abbreviated is True, a word can also be abbreviated
+        to any of its prefixes, as long as the prefix is not shared
+        with other words (e.g. the first four letters in BIP39 word-lists).
+        """
+
+        self.load_lang(lang)
+        if lang in self._binary:
+            index = self._binary[lang].index(word)
+        else:
+            index = self._word_index[lang].get(word)
+        if index is not None:
+            return index
+        if abbreviated and word:
+            if lang not in self._prefixes:
+                self._build_prefixes(lang)
+            wordlist = self.wordlist(lang)
+            candidates = self._prefixes[lang].get(word[:_PREFIX_LEN], ())
+            if len(word) > _PREFIX_LEN:
+                candidates = tuple(i for i in candidates
+                                   if wordlist[i].startswith(word))
+            if len(candidates) == 1:
+                return candidates[0]
+            if len(candidates) > 1:
+                m = f"ambiguous abbreviated word '{word}' for language '{lang}'"
+                raise ValueError(m)
+        raise ValueError(f"'{word}' is not in '{lang}' word-list")
+
     def language_length(self, lang: str) -> int:
         """Return the number of words in the language word-list."""
 
@@ -11,7 +11,8 @@
 import unittest
 
 from btclib.base58 import (_b58decode, _b58decode_to_int, _b58encode,
-                           _b58encode_from_int, b58decode, b58encode)
+                           _b58encode_from_int, b58decode, b58decode_many,
+                           b58encode, b58encode_many)
 
 
 class TestBase58CheckEncoding(unittest.TestCase):
@@ -41,6 +42,37 @@ class TestBase58CheckEncoding(unittest.TestCase):
         self.assertEqual(_b58decode_to_int(digits), number)
         self.assertEqual(_b58encode_from_int(number), digits[1:])
 
+    def test_limbs(self):
+        digits = b'123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+        # limb boundaries
+        for n in (9, 10, 11, 19, 20, 21, 100):
+            for i in (58**n - 1, 58**n, 58**n + 1):
+                expected = b''
+                j = i
+                while j:
+                    j, idx = divmod(j, 58)
+                    expected = digits[idx:idx+1] + expected
+                self.assertEqual(_b58encode_from_int(i), expected)
+                self.assertEqual(_b58decode_to_int(expected), i)
+
+    def test_encode_many(self):
+        vs = [b'', b'\x00', b'\x00\x00hello world', "ff" * 78, bytes(range(82))]
+        self.assertEqual(b58encode_many(vs), [b58encode(v) for v in vs])
+        self.assertEqual(b58encode_many(iter(vs)), [b58encode(v) for v in vs])
+        self.assertEqual(b58encode_many([]), [])
+
+    def test_decode_many(self):
+        vs = [b'', b'\x00', b'\x00\x00hello world', bytes(range(82))]
+        encoded = b58encode_many(vs)
+        encoded[1] = encoded[1].decode()
+        self.assertEqual(b58decode_many(encoded), vs)
+        self.assertEqual(b58decode_many(encoded[3:], 82), vs[3:])
+        self.assertRaises(ValueError, b58decode_many, encoded, 82)
+        # invalid characters
+        for char in b'0OIl+/\x00\xff':
+            invalid = encoded[3][:7] + bytes([char]) + encoded[3][8:]
+            self.assertRaises(ValueError, b58decode_many, [invalid])
+
     def test_exceptions(self):
         # int is not hex-string or bytes
         self.assertRaises(TypeError, b58encode, 3)
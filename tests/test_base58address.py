@@ -13,9 +13,9 @@ import unittest
 from btclib import bip32, slip32
 from btclib.base58 import b58decode, b58encode
 from btclib.base58address import (_b58segwitaddress, b58address_from_h160,
-                                  h160_from_b58address, p2pkh, p2pkh_from_wif,
-                                  p2sh, p2wpkh_p2sh, p2wpkh_p2sh_from_wif,
-                                  p2wsh_p2sh)
+                                  h160_from_b58address, h160s_from_b58addresses,
+                                  p2pkh, p2pkh_from_wif, p2sh, p2wpkh_p2sh,
+                                  p2wpkh_p2sh_from_wif, p2wsh_p2sh)
 from btclib.base58wif import prvkeytuple_from_wif, wif_from_xprv
 from btclib.bech32address import p2wpkh_from_wif, witness_from_b32address
 from btclib.curves import secp256k1 as ec
@@ -45,6 +45,21 @@ class TestAddresses(unittest.TestCase):
         self.assertRaises(ValueError, b58address_from_h160, bad_prefix, payload)
         #b58address_from_h160(bad_prefix, payload)
 
+    def test_h160s_from_b58addresses(self):
+        addresses = [
+            b58address_from_h160(prefix, bytes([i]) * 20)
+            for i, prefix in enumerate([b'\x00', b'\x05', b'\x6f', b'\xc4'])
+        ]
+        addresses[0] = " " + addresses[0].decode() + " "
+        expected = [h160_from_b58address(a) for a in addresses]
+        self.assertEqual(h160s_from_b58addresses(addresses), expected)
+        self.assertEqual(h160s_from_b58addresses(iter(addresses)), expected)
+        self.assertEqual([n for _, _, n, _ in expected],
+                         ['mainnet', 'mainnet', 'testnet', 'testnet'])
+        # invalid prefix
+        invalid = b58encode(b'\x01' + b'\x00' * 20)
+        self.assertRaises(ValueError, h160s_from_b58addresses, [invalid])
+
     def test_p2pkh_from_wif(self):
         seed = b"00"*32  # better be random
         rxprv = bip32.rootxprv_from_seed(seed)
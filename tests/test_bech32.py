@@ -41,7 +41,7 @@ with the following modifications:
 
 import unittest
 
-from btclib.bech32 import b32decode
+from btclib.bech32 import _polymod, b32decode, b32encode
 
 VALID_CHECKSUM = [
     "A12UEL5L",
@@ -86,6 +86,39 @@ class TestBech32(unittest.TestCase):
         for test in INVALID_CHECKSUM:
             self.assertRaises(ValueError, b32decode, test)
 
+    def test_polymod(self):
+        """Test the table-driven polymod against the reference one."""
+
+        def reference_polymod(values):
+            generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa,
+                         0x3d4233dd, 0x2a1462b3]
+            chk = 1
+            for value in values:
+                top = chk >> 25
+                chk = (chk & 0x1ffffff) << 5 ^ value
+                for i in range(5):
+                    chk ^= generator[i] if ((top >> i) & 1) else 0
+            return chk
+
+        values = bytes((i * 7) % 32 for i in range(100))
+        for n in range(len(values)):
+            self.assertEqual(_polymod(values[:n]),
+                             reference_polymod(values[:n]))
+        # resumed computation
+        self.assertEqual(_polymod(values[50:], _polymod(values[:50])),
+                         _polymod(values))
+
+    def test_encode(self):
+        """Test encoding/decoding round trips."""
+        for test in VALID_CHECKSUM:
+            hrp, data = b32decode(test)
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(b32encode(hrp, data), test.lower().encode())
+            self.assertEqual(b32encode(hrp, list(data)), test.lower().encode())
+
+        # invalid 5-bit value
+        self.assertRaises(ValueError, b32encode, "bc", [0, 32])
+
 
 if __name__ == "__main__":
     # execute only if run as a script
@@ -43,8 +43,10 @@ with the following modifications:
 import unittest
 
 from btclib.base58address import p2wpkh_p2sh, p2wsh_p2sh
-from btclib.bech32address import (b32address_from_witness, has_segwit_prefix,
-                                  p2wpkh, p2wsh_address,
+from btclib.bech32address import (_b32_from_bytes, _bytes_from_b32,
+                                  _convertbits, b32address_from_witness,
+                                  b32addresses_from_witnesses,
+                                  has_segwit_prefix, p2wpkh, p2wsh_address,
                                   witness_from_b32address)
 from btclib.curves import secp256k1 as ec
 from btclib.script import encode
@@ -231,6 +233,36 @@ class TestSegwitAddress(unittest.TestCase):
         self.assertRaises(ValueError, b32address_from_witness, 0, witness_script_bytes[1:])
         #b32address_from_witness(0, witness_script_bytes)
 
+    def test_convertbits(self):
+        for n in range(42):
+            data = bytes((i * 37 + n) % 256 for i in range(n))
+            values = _b32_from_bytes(data)
+            self.assertEqual(values, bytes(_convertbits(data, 8, 5)))
+            self.assertEqual(_bytes_from_b32(values), data)
+            self.assertEqual(_bytes_from_b32(values),
+                             bytes(_convertbits(values, 5, 8, False)))
+
+        # invalid 5-bit value
+        self.assertRaises(ValueError, _bytes_from_b32, b'\x20' * 8)
+        # non-zero padding
+        self.assertRaises(ValueError, _bytes_from_b32, b'\x01' * 4)
+        # padding of more than 4 bits
+        self.assertRaises(ValueError, _bytes_from_b32, b'\x00' * 3)
+
+    def test_b32addresses_from_witnesses(self):
+        witnesses = [(0, 20 * b'\x05'), (0, 32 * b'\x06'), (1, 32 * b'\x07')]
+        for network in ('mainnet', 'testnet'):
+            addresses = b32addresses_from_witnesses(witnesses, network)
+            expected = [b32address_from_witness(wv, wp, network)
+                        for wv, wp in witnesses]
+            self.assertEqual(addresses, expected)
+        self.assertEqual(b32addresses_from_witnesses(iter(witnesses)),
+                         b32addresses_from_witnesses(witnesses))
+
+        # witness program length (21) is not 20 or 32
+        self.assertRaises(ValueError, b32addresses_from_witnesses,
+                          [(0, 21 * b'\x05')])
+
 
 if __name__ == "__main__":
     # execute only if run as a script
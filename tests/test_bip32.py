@@ -9,18 +9,31 @@
 # or distributed except according to the terms contained in the LICENSE file.
 
 import json
+import time
 import unittest
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from os import path
 
-from btclib import bip39, slip32
+from btclib import bip32, bip39, slip32
 from btclib.base58 import b58decode, b58encode
 from btclib.base58address import p2pkh_from_xpub, p2wpkh_p2sh_from_xpub
 from btclib.bech32address import p2wpkh_from_xpub
-from btclib.bip32 import (crack_prvkey, derive, deserialize, fingerprint,
-                          rootxprv_from_bip39mnemonic, rootxprv_from_seed,
-                          serialize, xpub_from_xprv)
+from btclib.base58wif import wif_from_xprv
+from btclib import electrum
+from btclib.bip32 import (ExtendedKey, Path, crack_prvkey, derivation_cache_clear,
+                          derivation_cache_info, derivation_cache_pin,
+                          derivation_cache_resize, derive, derive_range,
+                          deserialize,
+                          fingerprint, masterxprv_from_electrummnemonic,
+                          masterxprvs_from_electrummnemonics,
+                          rootxprv_from_bip39mnemonic,
+                          rootxprvs_from_bip39mnemonics,
+                          rootxprv_from_seed, serialize, xpub_from_xprv)
 from btclib.curvemult import mult
 from btclib.curves import secp256k1 as ec
+from btclib.to_prvkey import to_prvkey_int
+from btclib.to_pubkey import to_pubkey_tuple
 from btclib.network import (_PRV_VERSIONS, MAIN_xprv, MAIN_yprv, MAIN_Yprv,
                             MAIN_zprv, MAIN_Zprv, TEST_tprv, TEST_uprv,
                             TEST_Uprv, TEST_vprv, TEST_Vprv)
@@ -702,6 +715,32 @@ class TestBIP32(unittest.TestCase):
         exp = b'xprv9s21ZrQH143K3ZxBCax3Wu25iWt3yQJjdekBuGrVa5LDAvbLeCT99U59szPSFdnMe5szsWHbFyo8g5nAFowWJnwe8r6DiecBXTVGHG124G1'
         self.assertEqual(rootxprv, exp)
 
+    def test_rootxprvs_from_mnemonics(self):
+        mnemonics = [bip39.mnemonic_from_entropy(i.to_bytes(16, 'big'))
+                     for i in range(1, 12)]
+        passphrase = "TREZOR"
+        expected = [(m, bip39.seed_from_mnemonic(m, passphrase),
+                     rootxprv_from_bip39mnemonic(m, passphrase))
+                    for m in mnemonics]
+        for max_workers, threads in ((1, False), (2, False), (3, True)):
+            results = rootxprvs_from_bip39mnemonics(
+                iter(mnemonics), passphrase,
+                max_workers=max_workers, threads=threads)
+            self.assertEqual(list(results), expected)
+        # invalid checksum
+        results = rootxprvs_from_bip39mnemonics(["abandon " * 12], threads=True)
+        self.assertRaises(ValueError, list, results)
+
+        mnemonics = [electrum.mnemonic_from_entropy(version, 0xf1e2d3c4b5a69788)
+                     for version in ('standard', 'segwit')]
+        expected = [(m, electrum._seed_from_mnemonic(m, passphrase)[1],
+                     masterxprv_from_electrummnemonic(m, passphrase, 'testnet'))
+                    for m in mnemonics]
+        for max_workers, threads in ((1, False), (2, False), (2, True)):
+            results = masterxprvs_from_electrummnemonics(
+                mnemonics, passphrase, 'testnet', max_workers, threads)
+            self.assertEqual(list(results), expected)
+
     def test_crack(self):
         parent_xpub = b'xpub6BabMgRo8rKHfpAb8waRM5vj2AneD4kDMsJhm7jpBDHSJvrFAjHJHU5hM43YgsuJVUVHWacAcTsgnyRptfMdMP8b28LYfqGocGdKCFjhQMV'
         child_xprv = b'xprv9xkG88dGyiurKbVbPH1kjdYrA8poBBBXa53RKuRGJXyruuoJUDd8e4m6poiz7rV8Z4NoM5AJNcPHN6aj8wRFt5CWvF8VPfQCrDUcLU5tcTm'
@@ -736,6 +775,223 @@ class TestBIP32(unittest.TestCase):
                           parent_xpub, hardened_child_xprv)
         #crack_prvkey(parent_xpub, hardened_child_xprv)
 
+    def test_extended_key(self):
+        rootxprv = b"xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
+        rootxpub = b"xpub661MyMwAqRbcFtXgS5sYJABqqG9YLmC4Q1Rdap9gSE8NqtwybGhePY2gZ29ESFjqJoCu1Rupje8YtGqsefD265TMg7usUDFdp6W1EGMcet8"
+
+        xprv = ExtendedKey.from_xkey(rootxprv)
+        self.assertIs(ExtendedKey.from_xkey(xprv), xprv)
+        self.assertEqual(xprv.serialize(), rootxprv)
+        self.assertEqual(ExtendedKey.from_xkey(rootxprv.decode()).serialize(), rootxprv)
+        # a mutable input is copied, not cached
+        xkey = bytearray(rootxprv)
+        serialized = ExtendedKey.from_xkey(xkey).serialize()
+        xkey[-1] ^= 1
+        self.assertIsInstance(serialized, bytes)
+        self.assertEqual(serialized, rootxprv)
+        self.assertIsInstance(derive(bytearray(rootxprv), []), bytes)
+        self.assertEqual(xprv.to_dict(), deserialize(rootxprv))
+        self.assertEqual(deserialize(xprv), deserialize(rootxprv))
+        self.assertEqual(serialize(xprv), rootxprv)
+        self.assertEqual(xprv.Q, mult(xprv.q))
+        self.assertEqual(xprv.fingerprint, fingerprint(rootxprv))
+        self.assertEqual(fingerprint(xprv), fingerprint(rootxprv))
+        self.assertEqual(xprv.xpub().serialize(), rootxpub)
+        self.assertEqual(xpub_from_xprv(xprv), rootxpub)
+
+        xpub = ExtendedKey.from_xkey(deserialize(rootxpub))
+        self.assertEqual(xpub.serialize(), rootxpub)
+        self.assertEqual(xpub.pubkey, xprv.pubkey)
+        self.assertEqual(xpub.Q, xprv.Q)
+        self.assertRaises(ValueError, xpub.xpub)
+
+        # BIP32 test vector 1
+        child = xprv.derive("m/0h/1/2h/2/1000000000")
+        self.assertIsInstance(child, ExtendedKey)
+        self.assertEqual(child.serialize(), b"xprvA41z7zogVVwxVSgdKUHDy1SKmdb533PjDz7J6N6mV6uS3ze1ai8FHa8kmHScGpWmj4WggLyQjgPie1rFSruoUihUZREPSL39UNdE3BBDu76")
+        self.assertEqual(derive(xprv, "m/0h/1/2h/2/1000000000"), child.serialize())
+        self.assertEqual(child.xpub().serialize(), b"xpub6H1LXWLaKsWFhvm6RVpEL9P4KfRZSW7abD2ttkWP3SSQvnyA8FSVqNTEcYFgJS2UaFcxupHiYkro49S8yGasTvXEYBVPamhGW6cFJodrTHy")
+        child_pub = xprv.derive("m/0h/1/2h").xpub().derive([2, 1000000000])
+        self.assertEqual(child_pub.serialize(), child.xpub().serialize())
+
+        # accepted wherever an XkeyDict or a string is
+        self.assertEqual(to_prvkey_int(child), child.q)
+        self.assertEqual(to_pubkey_tuple(child.xpub()), child.Q)
+        self.assertEqual(wif_from_xprv(child), wif_from_xprv(child.serialize()))
+        self.assertEqual(p2pkh_from_xpub(child.xpub()),
+                         p2pkh_from_xpub(child.xpub().serialize()))
+        parent_xpub = xprv.derive("m/0h/1/2h").xpub()
+        self.assertEqual(crack_prvkey(parent_xpub, xprv.derive("m/0h/1/2h/2")),
+                         xprv.derive("m/0h/1/2h").serialize())
+
+        # public key points are computed only when needed
+        derivation_cache_clear()
+        hardened = xprv.derive("m/1h/2h/3h")
+        self.assertIsNone(hardened._Q)
+        normal = hardened.derive("./0/1")
+        self.assertIsNotNone(hardened._Q)
+        self.assertIsNone(normal._Q)
+        self.assertEqual(normal.Q, mult(normal.q))
+        self.assertEqual(normal.xpub().serialize(),
+                         hardened.xpub().derive("./0/1").serialize())
+
+        # hardened derivation from pubkey is impossible
+        self.assertRaises(ValueError, xpub.derive, "m/0h")
+        # absolute derivation path for non-root master key
+        self.assertRaises(ValueError, child.derive, "m/0")
+        # invalid key
+        self.assertRaises(ValueError, ExtendedKey.from_xkey, rootxprv[:-1])
+
+    def test_derivation_cache(self):
+        rootxprv = b"xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
+        exp = b"xprvA41z7zogVVwxVSgdKUHDy1SKmdb533PjDz7J6N6mV6uS3ze1ai8FHa8kmHScGpWmj4WggLyQjgPie1rFSruoUihUZREPSL39UNdE3BBDu76"
+        path = "m/0h/1/2h/2/1000000000"
+
+        derivation_cache_resize(5)
+        self.assertEqual(derivation_cache_info().maxsize, 5)
+        self.assertEqual(derive(rootxprv, path), exp)
+        info = derivation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 5, 5))
+        self.assertEqual(derive(rootxprv, path), exp)
+        # also across base58 serialization
+        self.assertEqual(derive(derive(rootxprv, "m/0h/1"), "./2h/2/1000000000"), exp)
+        info = derivation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (10, 5, 5))
+
+        # least recently used nodes are evicted
+        derivation_cache_resize(3)
+        self.assertEqual(derive(rootxprv, path), exp)
+        info = derivation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 5, 3))
+        self.assertEqual(derive(derive(rootxprv, "m/0h/1/2h"), "./2/1000000000"), exp)
+
+        # pinned nodes are not evicted
+        derivation_cache_clear()
+        account = derivation_cache_pin(rootxprv, "m/0h/1/2h")
+        self.assertEqual(account.serialize(), derive(rootxprv, "m/0h/1/2h"))
+        self.assertEqual(derivation_cache_info().pinned, 3)
+        for i in range(5):
+            derive(rootxprv, f"m/0h/1/2h/2/{i}")
+        self.assertEqual(derive(rootxprv, path), exp)
+        info = derivation_cache_info()
+        self.assertEqual((info.currsize, info.pinned), (3, 3))
+        # derivation_cache_resize keeps pinned nodes
+        derivation_cache_resize(0)
+        self.assertEqual(derive(rootxprv, path), exp)
+        info = derivation_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 2, 0))
+
+        derivation_cache_clear(unpin=True)
+        self.assertEqual(derivation_cache_info().pinned, 0)
+        self.assertRaises(ValueError, derivation_cache_resize, -1)
+        derivation_cache_resize()
+
+    def test_derivation_cache_threads(self):
+        rootxprv = b"xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
+        xpub = ExtendedKey.from_xkey(rootxprv).derive("m/0h").xpub()
+        expected = [xpub.derive(f"./{i % 3}").serialize() for i in range(200)]
+
+        class SlowOrderedDict(OrderedDict):
+            # switch thread after each lookup, widening race windows
+            def get(self, *args):
+                result = super().get(*args)
+                time.sleep(0.0001)
+                return result
+
+            def pop(self, *args):
+                result = super().pop(*args)
+                time.sleep(0.0001)
+                return result
+
+        def worker(i):
+            return xpub.derive(f"./{i % 3}").serialize()
+
+        # a tiny cache maximizes evictions among concurrent lookups
+        derivation_cache_resize(2)
+        nodes = bip32._DERIVATION_CACHE.nodes
+        bip32._DERIVATION_CACHE.nodes = SlowOrderedDict()
+        try:
+            with ThreadPoolExecutor(16) as pool:
+                results = list(pool.map(worker, range(200)))
+            self.assertEqual(results, expected)
+            self.assertLessEqual(derivation_cache_info().currsize, 2)
+        finally:
+            bip32._DERIVATION_CACHE.nodes = nodes
+            derivation_cache_resize()
+
+    def test_derive_range(self):
+        rootxprv = b"xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
+        xpub = xpub_from_xprv(derive(rootxprv, "m/0h/1"))
+
+        start = 250
+        count = 10
+        chunk = bip32._RANGE_CHUNK
+        bip32._RANGE_CHUNK = 4  # spanning three chunks, the last partial
+        try:
+            children = list(derive_range(xpub, start, count))
+            pubkeys = list(derive_range(deserialize(xpub), start, count, True))
+        finally:
+            bip32._RANGE_CHUNK = chunk
+        self.assertEqual(len(children), count)
+        for i, child in enumerate(children, start):
+            self.assertEqual(child, derive(xpub, i))
+            self.assertEqual(child, xpub_from_xprv(derive(rootxprv, f"m/0h/1/{i}")))
+        self.assertEqual(pubkeys, [deserialize(c)['key'] for c in children])
+        self.assertEqual(list(derive_range(xpub, 0, 0)), [])
+
+        # lazy generation
+        children = derive_range(xpub, 0, 0x80000000)
+        self.assertEqual(next(children), derive(xpub, 0))
+
+        # extended key is not a public one
+        self.assertRaises(ValueError, next, derive_range(rootxprv, 0, 1))
+        # hardened indexes
+        self.assertRaises(ValueError, next, derive_range(xpub, 0x7fffffff, 2))
+        self.assertRaises(ValueError, next, derive_range(xpub, -1, 2))
+
+    def test_path(self):
+        rootxprv = b"xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
+        account = Path("m/44h/0'/0H")
+        self.assertEqual(str(account), "m/44h/0h/0h")
+        self.assertEqual(repr(account), "Path('m/44h/0h/0h')")
+        self.assertEqual(len(account), 3)
+        # parsed only once
+        self.assertIs(Path("m/44h/0'/0H").indexes, account.indexes)
+
+        receive = account / 0
+        self.assertEqual(account, Path("m/44h/0h/0h"))
+        self.assertEqual(receive, Path("m/44h/0h/0h/0"))
+        self.assertEqual(hash(receive), hash(Path("m/44h/0h/0h/0")))
+        self.assertNotEqual(receive, Path("./44h/0h/0h/0"))
+        self.assertNotEqual(receive, "m/44h/0h/0h/0")
+        self.assertEqual(account / "1h", Path("m/44h/0h/0h/1h"))
+        self.assertEqual(account / b"\x00\x00\x00\x01", account / 1)
+        self.assertEqual(Path([0, 0x80000001]), Path("./0/1h"))
+        self.assertEqual(str(Path()), ".")
+
+        for i in range(3):
+            path = receive / i
+            expected = derive(rootxprv, f"m/44h/0h/0h/0/{i}")
+            self.assertEqual(derive(rootxprv, path), expected)
+            self.assertEqual(ExtendedKey.from_xkey(rootxprv).derive(path).serialize(), expected)
+        xprv = derive(rootxprv, account)
+        self.assertEqual(derive(xprv, Path("./0/2")),
+                         derive(rootxprv, "m/44h/0h/0h/0/2"))
+
+        # absolute path for non-root key
+        self.assertRaises(ValueError, derive, xprv, account)
+        # invalid steps
+        self.assertRaises(ValueError, account.__truediv__, -1)
+        self.assertRaises(ValueError, account.__truediv__, 0x100000000)
+        self.assertRaises(ValueError, account.__truediv__, b"\x00")
+        self.assertRaises(ValueError, account.__truediv__, "1/2")
+        self.assertRaises(ValueError, Path, "x/1")
+        # depth
+        path = Path([0] * 255)
+        self.assertRaises(ValueError, path.__truediv__, 0)
+        self.assertRaises(ValueError, Path, [0] * 256)
+        self.assertRaises(ValueError, derive, xprv, Path([0] * 253))
+
 
 if __name__ == "__main__":
     # execute only if run as a script
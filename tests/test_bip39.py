@@ -27,6 +27,12 @@ class TestBIP39(unittest.TestCase):
         r = int(r, 2).to_bytes(size, byteorder='big')
         self.assertEqual(r, raw_entr)
 
+        # abbreviated mnemonic
+        abbr = "aban aban atom trus ankl waln oil acro awak bunk divo abst"
+        self.assertRaises(ValueError, bip39.entropy_from_mnemonic, abbr, lang)
+        r = bip39.entropy_from_mnemonic(abbr, lang, True)
+        self.assertEqual(bip39.mnemonic_from_entropy(r, lang), mnemonic)
+
         # mnemonic with wrong number of words
         wrong_mnemonic = mnemonic + " abandon"
         self.assertRaises(ValueError, bip39.entropy_from_mnemonic, wrong_mnemonic, lang)
@@ -40,6 +46,15 @@ class TestBIP39(unittest.TestCase):
         # Invalid number of bits (130) for BIP39 entropy; must be in ...
         binstr_entropy = '01' * 65  # 130 bits
         self.assertRaises(ValueError, bip39._entropy_checksum, binstr_entropy)
+        self.assertRaises(ValueError, bip39._int_entropy_checksum, (1, 130))
+
+        # integer and binary 0/1 string checksums
+        for bits in (128, 160, 192, 224, 256):
+            int_entropy = (1 << bits) // 3
+            binstr = bin(int_entropy)[2:].zfill(bits)
+            checksum = bip39._int_entropy_checksum((int_entropy, bits))
+            self.assertEqual(bin(checksum)[2:].zfill(bits // 32),
+                             bip39._entropy_checksum(binstr))
         #bip39._entropy_checksum(binstr_entropy)
 
     def test_vectors(self):
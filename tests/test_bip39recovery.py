@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+import unittest
+
+from btclib import bip39
+from btclib.base58address import p2pkh_from_xpub, p2wpkh_p2sh_from_xpub
+from btclib.bech32address import p2wpkh_from_xpub
+from btclib.bip32 import (derivation_cache_info, derive,
+                          rootxprv_from_bip39mnemonic, xpub_from_xprv)
+from btclib.bip39recovery import _default_path, candidates, recover
+from btclib.network import TEST_tprv, TEST_uprv
+
+
+class TestBIP39Recovery(unittest.TestCase):
+    def test_candidates(self):
+        mnemonic = bip39.mnemonic_from_entropy(bytes(range(16)))
+        words = mnemonic.split()
+
+        missing = " ".join(words[:3] + ["?"] + words[4:])
+        result = list(candidates(missing))
+        # the checksum filters out about 15/16 of the candidates
+        self.assertLess(len(result), 2048 // 8)
+        self.assertIn(mnemonic, result)
+        for m in result:
+            bip39.entropy_from_mnemonic(m)
+
+        # unreadable word and missing last word
+        missing = " ".join(words[:5] + ["xyz"] + words[6:11] + ["?"])
+        result = list(candidates(missing))
+        self.assertIn(mnemonic, result)
+        self.assertEqual(len(result), 2048 * 128)
+
+        # erroneous word at a suspected position
+        wrong = " ".join(words[:7] + ["zoo"] + words[8:])
+        self.assertIn(mnemonic, candidates(wrong, positions=[7]))
+
+        # no missing words
+        self.assertEqual(list(candidates(mnemonic)), [mnemonic])
+
+        self.assertRaises(ValueError, next, candidates(" ".join(words[:11])))
+        self.assertRaises(ValueError, next, candidates(mnemonic, positions=[12]))
+
+    def test_recover(self):
+        mnemonic = bip39.mnemonic_from_entropy(bytes(range(16)))
+        words = mnemonic.split()
+        missing = " ".join(words[:3] + ["?"] + words[4:])
+        passphrase = "TREZOR"
+        rootxprv = rootxprv_from_bip39mnemonic(mnemonic, passphrase)
+
+        xprv = derive(rootxprv, "m/44h/0h/0h/0/0")
+        p2pkh = p2pkh_from_xpub(xpub_from_xprv(xprv))
+        self.assertEqual(list(recover(missing, p2pkh, passphrase)), [mnemonic])
+        # candidates are not derived through the derivation cache
+        currsize = derivation_cache_info().currsize
+        result = recover(missing, p2pkh, passphrase, max_workers=1)
+        self.assertEqual(list(result), [mnemonic])
+        self.assertEqual(derivation_cache_info().currsize, currsize)
+        # default BIP49 receive address path of a p2wpkh-p2sh address
+        xprv = derive(rootxprv, "m/49h/0h/0h/0/0")
+        address = p2wpkh_p2sh_from_xpub(xpub_from_xprv(xprv))
+        result = recover(missing, address, passphrase, max_workers=1)
+        self.assertEqual(list(result), [mnemonic])
+        # explicit path
+        xprv = derive(rootxprv, "m/0h/1")
+        address = p2wpkh_from_xpub(xpub_from_xprv(xprv))
+        result = recover(missing, address, passphrase, "m/0h/1",
+                         max_workers=2)
+        self.assertEqual(list(result), [mnemonic])
+
+        # default BIP44 account path of a testnet tpub
+        rootxprv = rootxprv_from_bip39mnemonic(mnemonic, passphrase, TEST_tprv)
+        xpub = xpub_from_xprv(derive(rootxprv, "m/44h/1h/0h"))
+        result = recover(missing, xpub.decode(), passphrase, threads=True)
+        self.assertEqual(list(result), [mnemonic])
+
+        # default BIP49 account path of a testnet upub
+        rootxprv = rootxprv_from_bip39mnemonic(mnemonic, passphrase, TEST_uprv)
+        xpub = xpub_from_xprv(derive(rootxprv, "m/49h/1h/0h"))
+        self.assertEqual(_default_path(xpub), "m/49h/1h/0h")
+        result = recover(missing, xpub.decode(), passphrase, threads=True)
+        self.assertEqual(list(result), [mnemonic])
+
+        # wrong passphrase
+        self.assertEqual(list(recover(missing, p2pkh, "", max_workers=1)), [])
+
+        # not a public key
+        self.assertRaises(ValueError, next, recover(missing, rootxprv))
+        # not a p2wpkh
+        address = "bc1qrp33g0q5c5txsp9arysrx4k6zdkfs4nce4xj0gdcccefvpysxf3qccfmv3"
+        self.assertRaises(ValueError, next, recover(missing, address))
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    unittest.main()
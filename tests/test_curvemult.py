@@ -13,8 +13,10 @@ import unittest
 from typing import List
 
 from btclib.alias import INF, INFJ, Point
-from btclib.curvemult import (Curve, _jac_from_aff, _mult_jac, double_mult,
-                              mult, multi_mult)
+from btclib.curvemult import (Curve, _fixed_base_table, _generator_table,
+                              _jac_from_aff, _mult_fixed, _mult_jac,
+                              _mult_windows, _windows, double_mult, mult,
+                              multi_mult)
 from btclib.curves import (all_curves, ec23_31, low_card_curves, secp112r1,
                            secp160r1, secp256k1, secp256r1, secp384r1)
 
@@ -33,6 +35,48 @@ class TestEllipticCurve(unittest.TestCase):
         self.assertEqual(INF, ec._mult_aff(3, INF))
         self.assertEqual(INFJ, _mult_jac(3, INFJ, ec))
 
+    def test_mult_fixed(self):
+        for ec in low_card_curves:
+            T = _generator_table(ec)
+            for q in range(ec.n):
+                Q = ec._aff_from_jac(_mult_fixed(q, T, ec))
+                self.assertEqual(Q, ec._mult_aff(q, ec.G))
+
+        ec = secp256k1
+        Q = mult(0xdeadbeef, ec.G, ec)
+        T = _fixed_base_table(_jac_from_aff(Q), ec)
+        for q in (1, 2, 0xbadc0ffee, ec.n // 3, ec.n - 1, 2**ec.nlen - 1):
+            QJ = _mult_fixed(q, T, ec)
+            self.assertEqual(ec._aff_from_jac(QJ), mult(q, Q, ec))
+            GJ = _mult_fixed(q, _generator_table(ec), ec)
+            self.assertEqual(ec._aff_from_jac(GJ), mult(q, ec.G, ec))
+        self.assertEqual(INFJ, _mult_fixed(ec.n, T, ec))
+
+    def test_mult_windows(self):
+        for ec in low_card_curves:
+            for q in range(ec.n):
+                windows = _windows(q, ec)
+                Q = ec._aff_from_jac(_mult_windows(windows, ec.GJ, ec))
+                self.assertEqual(Q, ec._mult_aff(q, ec.G))
+
+        ec = secp256k1
+        q = 0xbadc0ffee
+        windows = _windows(q, ec)
+        for m in (1, 2, ec.n // 3, ec.n - 1):
+            QJ = _mult_jac(m, ec.GJ, ec)
+            RJ = _mult_windows(windows, QJ, ec)
+            self.assertEqual(ec._aff_from_jac(RJ), mult(q * m, ec.G, ec))
+        self.assertEqual(INFJ, _mult_windows(windows, INFJ, ec))
+        self.assertEqual(INFJ, _mult_windows(_windows(ec.n, ec), ec.GJ, ec))
+
+    def test_aff_from_jac_batch(self):
+        ec = secp256k1
+        QJs = [_mult_jac(q, ec.GJ, ec) for q in (1, 2, 0, 3, ec.n - 1)]
+        Qs = ec._aff_from_jac_batch(QJs)
+        self.assertEqual(Qs, [ec._aff_from_jac(QJ) for QJ in QJs])
+        self.assertEqual(ec._aff_from_jac_batch([INFJ, INFJ]), [INF, INF])
+        self.assertEqual(ec._aff_from_jac_batch([]), [])
+
     def test_shamir(self):
         ec = ec23_31
         for k1 in range(ec.n):
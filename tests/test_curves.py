@@ -16,7 +16,9 @@ from btclib.curvemult import Curve
 from btclib.curves import (all_curves, ec23_31, low_card_curves, secp112r1,
                            secp160r1, secp256k1, secp256r1, secp384r1)
 from btclib.numbertheory import mod_sqrt
-from btclib.secpoint import bytes_from_point, point_from_octets
+from btclib.secpoint import (bytes_from_point, point_cache_clear,
+                             point_cache_info, point_cache_resize,
+                             point_from_octets, points_from_octets_batch)
 
 
 class TestEllipticCurve(unittest.TestCase):
@@ -203,6 +205,53 @@ class TestEllipticCurve(unittest.TestCase):
         P = x, ec._p+1
         self.assertRaises(ValueError, ec.is_on_curve, P)
 
+    def test_point_cache(self):
+        ec = secp256k1
+        Q = ec.mult(ec._p)
+        Q_bytes = bytes_from_point(Q, True, ec)
+
+        point_cache_resize(2)
+        self.assertEqual(point_cache_info().maxsize, 2)
+        self.assertEqual(point_from_octets(Q_bytes, ec), Q)
+        self.assertEqual(point_from_octets(Q_bytes.hex(), ec), Q)
+        self.assertEqual(point_from_octets(bytearray(Q_bytes), ec), Q)
+        info = point_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+        # same octets, but different curve
+        ec2 = secp256r1
+        Q2 = ec2.mult(ec2._p)
+        Q2_bytes = bytes_from_point(Q2, True, ec2)
+        self.assertEqual(point_from_octets(Q2_bytes, ec2), Q2)
+        self.assertEqual(point_cache_info().currsize, 2)
+
+        # invalid points are not cached
+        self.assertRaises(ValueError, point_from_octets, b'\x01' * 33, ec)
+        self.assertEqual(point_cache_info().currsize, 2)
+
+        point_cache_clear()
+        self.assertEqual(point_cache_info().currsize, 0)
+
+        # no cache
+        point_cache_resize(0)
+        self.assertEqual(point_from_octets(Q_bytes, ec), Q)
+        self.assertEqual(point_cache_info().currsize, 0)
+
+        point_cache_resize()
+
+    def test_points_from_octets_batch(self):
+        ec = secp256k1
+        Qs = [ec.mult(q) for q in (1, 2, 3)]
+        pubkeys = [bytes_from_point(Q, True, ec) for Q in Qs]
+        pubkeys.append(bytes_from_point(Qs[1], False, ec))
+        pubkeys += [pubkeys[0], pubkeys[0].hex(), pubkeys[2]]
+        result = points_from_octets_batch(pubkeys, ec)
+        self.assertEqual(result, [Qs[0], Qs[1], Qs[2], Qs[1],
+                                  Qs[0], Qs[0], Qs[2]])
+        self.assertEqual(points_from_octets_batch([], ec), [])
+        self.assertRaises(ValueError, points_from_octets_batch,
+                          [b'\x01' * 33], ec)
+
     def test_opposite(self):
         for ec in all_curves:
             Q = ec.mult(ec._p)  # just a random point, not INF
@@ -32,6 +32,46 @@ class TestEcdh(unittest.TestCase):
                                         dV, QU, size, ec, hf)
         self.assertEqual(keyingdataU, keyingdataV)
 
+    def test_ecdh_many(self):
+        size = 20
+
+        dU = 0x1
+        dVs = [0x2, 0x3, ec.n - 1]
+        QVs = [mult(dV, ec.G, ec) for dV in dVs]
+        keyingdata = dh.diffie_hellman_many(dh.ansi_x963_kdf,
+                                            dU, QVs, size, ec, hf)
+        for dV, QV, k in zip(dVs, QVs, keyingdata):
+            self.assertEqual(k, dh.diffie_hellman(dh.ansi_x963_kdf,
+                                                  dU, QV, size, ec, hf))
+            QU = mult(dU, ec.G, ec)
+            self.assertEqual(k, dh.diffie_hellman(dh.ansi_x963_kdf,
+                                                  dV, QU, size, ec, hf))
+        self.assertEqual(dh.diffie_hellman_many(dh.ansi_x963_kdf,
+                                                dU, [], size, ec, hf), [])
+
+        # invalid (zero) private key
+        self.assertRaises(ValueError, dh.diffie_hellman_many,
+                          dh.ansi_x963_kdf, ec.n, QVs, size, ec, hf)
+
+        # peer public key not on curve
+        self.assertRaises(ValueError, dh.diffie_hellman_many,
+                          dh.ansi_x963_kdf, dU, [(1, 1)], size, ec, hf)
+
+    def test_kdf_stream(self):
+        z = bytes.fromhex('ca7c0f8c3ffa87a96e1b74ac8e6af594347bb40a')
+        hsize = hf().digest_size
+        for size in (1, hsize - 1, hsize, hsize + 1, 3 * hsize, 1000):
+            chunks = list(dh.ansi_x963_kdf_stream(z, size, hf))
+            self.assertEqual(len(chunks), (size + hsize - 1) // hsize)
+            keyingdata = b''.join(chunks)
+            self.assertEqual(len(keyingdata), size)
+            self.assertEqual(keyingdata, dh.ansi_x963_kdf(z, size, ec, hf))
+            # Hash(z||counter) for counter = 1, 2, ...
+            for i, chunk in enumerate(chunks, 1):
+                digest = hf(z + i.to_bytes(4, 'big')).digest()
+                self.assertEqual(chunk, digest[:len(chunk)])
+        self.assertEqual(dh.ansi_x963_kdf(z, 0, ec, hf), b'')
+
     def test_key_deployment(self):
         """GEC 2: Test Vectors for SEC 1, section 4.1
 
@@ -67,6 +67,24 @@ class TestMnemonicDictionaries(unittest.TestCase):
                           mnemonic, passphrase)
         #bip32.masterxprv_from_electrummnemonic(mnemonic, passphrase)
 
+    def test_mnemonic_search(self):
+        # the search crosses the 12-word to 13-word boundary
+        entropy = (1 << 132) - 3
+        for version in ('standard', 'segwit', '2fa', '2fa_segwit'):
+            mnemonic = electrum.mnemonic_from_entropy(version, entropy)
+            self.assertEqual(electrum.version_from_mnemonic(mnemonic), version)
+            # the first valid entropy is not below the input one
+            entr = int(electrum.entropy_from_mnemonic(mnemonic), 2)
+            self.assertGreaterEqual(entr, entropy)
+            v = electrum._MNEMONIC_VERSIONS[version]
+            self.assertIsNone(electrum._search(v, entropy, entr - entropy, "en"))
+            self.assertEqual(electrum._search(v, entropy, entr - entropy + 1, "en"),
+                             (entr, mnemonic))
+            # the parallel search returns the same first valid mnemonic
+            mnemonic2 = electrum.mnemonic_from_entropy(version, entropy,
+                                                       max_workers=2)
+            self.assertEqual(mnemonic2, mnemonic)
+
     def test_vectors(self):
         file = "electrum_test_vectors.json"
         filename = path.join(path.dirname(__file__), "data", file)
@@ -13,7 +13,8 @@ import random
 import secrets
 import unittest
 
-from btclib.entropy import Entropy, binstr_from_entropy, generate_entropy
+from btclib.entropy import (Entropy, _bits_slice, _int_from_entropy,
+                            binstr_from_entropy, generate_entropy)
 
 random.seed(42)
 
@@ -106,6 +107,20 @@ class TestEntropy(unittest.TestCase):
         invalid_entropy = tuple()
         self.assertRaises(TypeError, binstr_from_entropy, invalid_entropy)
 
+    def test_int_entropy(self):
+        for entropy in ('0' * 120 + '10110111', b'\x00' * 15 + b'\xb7', 0xb7,
+                        (0xb7 << 300) + 1):
+            int_entropy, nbits = _int_from_entropy(entropy)
+            self.assertEqual(bin(int_entropy)[2:].zfill(nbits),
+                             binstr_from_entropy(entropy))
+        self.assertEqual(_int_from_entropy((0xb7 << 300) + 1), (0xb7 << 248, 256))
+
+        binstr = '0010110111'
+        entropy = int(binstr, 2), len(binstr)
+        for start, stop in ((0, 10), (0, 3), (2, 7), (7, 10), (4, 4)):
+            expected = int(binstr[start:stop] or '0', 2)
+            self.assertEqual(_bits_slice(entropy, start, stop), expected)
+
     def test_generate_entropy(self):
         bits = 256
         dice_base = 20
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+import unittest
+
+from btclib.base58address import p2pkh_from_xpub, p2wpkh_p2sh_from_xpub
+from btclib.bech32address import b32address_from_witness, p2wpkh_from_xpub
+from btclib.bip32 import derive, rootxprv_from_seed, xpub_from_xprv
+from btclib.gaplimit import known_from_addresses, scan, scan_xpub
+
+
+def _account(seed: str) -> bytes:
+    rootxprv = rootxprv_from_seed(bytes.fromhex(seed))
+    return xpub_from_xprv(derive(rootxprv, "m/44h/0h/0h"))
+
+
+class TestGapLimit(unittest.TestCase):
+    def test_scan_xpub(self):
+        xpub = _account("00" * 16)
+        used = {
+            "./0/0": p2pkh_from_xpub(derive(xpub, "./0/0")),
+            "./0/3": p2wpkh_from_xpub(derive(xpub, "./0/3")),
+            "./0/7": p2wpkh_p2sh_from_xpub(derive(xpub, "./0/7")),
+            "./1/2": p2pkh_from_xpub(derive(xpub, "./1/2")),
+        }
+        # beyond the gap limit
+        far = p2pkh_from_xpub(derive(xpub, "./0/12"))
+        # non-p2wpkh witness program
+        p2wsh = b32address_from_witness(0, b"\x01" * 32)
+        known = known_from_addresses(list(used.values()) + [far, p2wsh])
+        self.assertEqual(len(known), 5)
+
+        result = scan_xpub(xpub, known, gap_limit=4)
+        self.assertEqual({path: addr for path, _, addr in result}, used)
+        self.assertEqual([t for _, t, _ in result],
+                         ['p2pkh', 'p2wpkh', 'p2wpkh-p2sh', 'p2pkh'])
+
+        # the wider gap limit reaches the far address
+        result = scan_xpub(xpub, known, gap_limit=5)
+        self.assertEqual(len(result), 5)
+        self.assertEqual(result[3], ("./0/12", 'p2pkh', far))
+
+        # restricted script types
+        result = scan_xpub(xpub, known, 4, ['p2pkh'])
+        self.assertEqual([path for path, _, _ in result], ["./0/0", "./1/2"])
+
+        # receive branch only
+        result = scan_xpub(xpub, known, 4, branches=[0])
+        self.assertEqual(len(result), 3)
+
+        self.assertRaises(ValueError, scan_xpub, xpub, known, 0)
+        self.assertRaises(ValueError, scan_xpub, xpub, known, 4, ['p2tr'])
+
+    def test_scan(self):
+        xpubs = [_account(f"{i:02x}" * 16) for i in range(3)]
+        addresses = [p2pkh_from_xpub(derive(xpubs[0], "./0/1")),
+                     p2wpkh_from_xpub(derive(xpubs[2], "./1/0"))]
+        expected = [[("./0/1", 'p2pkh', addresses[0])],
+                    [],
+                    [("./1/0", 'p2wpkh', addresses[1])]]
+
+        self.assertEqual(scan(xpubs, addresses, 3, max_workers=1), expected)
+        self.assertEqual(scan(xpubs, addresses, 3, max_workers=2), expected)
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+import os
+import tempfile
+import unittest
+
+from btclib.base58address import (h160_from_b58address, p2pkh_from_xpub,
+                                  p2wpkh_p2sh_from_xpub)
+from btclib.bip32 import derive, rootxprv_from_seed, xpub_from_xprv
+from btclib.h160index import H160Index, build_index, lookup
+
+
+def _account(seed: str) -> bytes:
+    rootxprv = rootxprv_from_seed(bytes.fromhex(seed))
+    return xpub_from_xprv(derive(rootxprv, "m/44h/0h/0h"))
+
+
+class TestH160Index(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.idx')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_index(self):
+        xpubs = [_account(f"{i:02x}" * 16) for i in range(3)]
+        n = build_index(self.filename, xpubs, 10, p2wpkh_p2sh=True,
+                        max_records=7)
+        self.assertEqual(n, 3 * 2 * 10 * 2)
+
+        with H160Index(self.filename) as index:
+            self.assertEqual(len(index), n)
+            for xpub_id, xpub in enumerate(xpubs):
+                self.assertEqual(index.xpub(xpub_id), xpub)
+            for xpub in xpubs:
+                for path in ("./0/0", "./0/9", "./1/4"):
+                    addr = p2pkh_from_xpub(derive(xpub, path))
+                    h160 = h160_from_b58address(addr)[1]
+                    self.assertEqual(index.lookup(h160), [(xpub, path, False)])
+                    addr = p2wpkh_p2sh_from_xpub(derive(xpub, path))
+                    h160 = h160_from_b58address(addr)[1]
+                    self.assertEqual(index.lookup(h160), [(xpub, path, True)])
+            # beyond the indexed range
+            addr = p2pkh_from_xpub(derive(xpubs[0], "./0/10"))
+            h160 = h160_from_b58address(addr)[1]
+            self.assertEqual(index.lookup(h160), [])
+            self.assertEqual(index.lookup(b'\x00' * 20), [])
+            self.assertEqual(index.lookup(b'\xff' * 20), [])
+            self.assertRaises(ValueError, index.lookup, b'\x00' * 19)
+            self.assertRaises(ValueError, index.xpub, 3)
+
+        # the same result without external sort runs
+        addr = p2pkh_from_xpub(derive(xpubs[1], "./1/3"))
+        h160 = h160_from_b58address(addr)[1]
+        expected = [(xpubs[1], "./1/3", False)]
+        self.assertEqual(lookup(self.filename, h160), expected)
+        build_index(self.filename, xpubs, 10, p2wpkh_p2sh=True)
+        self.assertEqual(lookup(self.filename, h160), expected)
+
+        # duplicated xpub
+        build_index(self.filename, [xpubs[1], xpubs[1]], 5, [1])
+        self.assertEqual(lookup(self.filename, h160), expected * 2)
+
+        # empty index
+        self.assertEqual(build_index(self.filename, [], 10), 0)
+        self.assertEqual(lookup(self.filename, h160), [])
+
+    def test_exceptions(self):
+        xprv = rootxprv_from_seed(bytes.fromhex("00" * 16))
+        self.assertRaises(ValueError, build_index, self.filename, [xprv], 1)
+        xpub = xpub_from_xprv(xprv)
+        self.assertRaises(ValueError, build_index, self.filename, [xpub], 1,
+                          max_records=0)
+
+        with open(self.filename, 'wb') as f:
+            f.write(b'\x00' * 3000)
+        self.assertRaises(ValueError, H160Index, self.filename)
+
+        build_index(self.filename, [xpub], 2)
+        with open(self.filename, 'ab') as f:
+            f.write(b'\x00')
+        self.assertRaises(ValueError, H160Index, self.filename)
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    unittest.main()
@@ -44,6 +44,30 @@ class TestMnemonic(unittest.TestCase):
         indexes = _indexes_from_entropy(entropy, lang)
         self.assertEqual(indexes, test_indexes)
 
+    def test_abbreviated(self):
+        lang = "en"
+        test_mnemonic = "ozone drill grab fiber curtain grace " \
+                        "pudding thank cruise elder eight picnic"
+        test_indexes = _indexes_from_mnemonic(test_mnemonic, lang)
+
+        # first four letters, while shorter words are kept
+        abbreviated = " ".join(w[:4] for w in test_mnemonic.split())
+        self.assertRaises(ValueError, _indexes_from_mnemonic, abbreviated, lang)
+        indexes = _indexes_from_mnemonic(abbreviated, lang, True)
+        self.assertEqual(indexes, test_indexes)
+        # unambiguous longer and shorter prefixes
+        indexes = _indexes_from_mnemonic("ozon dril grab puddi", lang, True)
+        self.assertEqual(indexes, test_indexes[:3] + test_indexes[6:7])
+        indexes = _indexes_from_mnemonic("zoo zon", lang, True)
+        self.assertEqual(_mnemonic_from_indexes(indexes, lang), "zoo zone")
+
+        # ambiguous abbreviated word
+        self.assertRaises(ValueError, _indexes_from_mnemonic, "gra", lang, True)
+        # unknown words
+        self.assertRaises(ValueError, _indexes_from_mnemonic, "ozonee", lang, True)
+        self.assertRaises(ValueError, _indexes_from_mnemonic, "xyz", lang, True)
+        self.assertRaises(ValueError, _indexes_from_mnemonic, "xyz", lang)
+
 
 if __name__ == "__main__":
     # execute only if run as a script
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2020 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+import os
+import tempfile
+import unittest
+from hashlib import sha256
+
+from btclib import der, dsa, ssa
+from btclib.curvemult import mult
+from btclib.curves import secp256k1 as ec
+from btclib.noncereuse import records_from_file, scan
+from btclib.secpoint import bytes_from_point
+
+
+def _dsa_records():
+    # q=1 and q=2 reuse nonces, q=3 does not
+    records = list()
+    for q in (1, 2, 3):
+        Q = bytes_from_point(mult(q))
+        for i in range(3):
+            msg = f"message {i}".encode()
+            k = 0xbadc0ffee if q != 3 else 0xbadc0ffee + i
+            records.append((msg, Q, dsa.sign(msg, q, k)))
+    # reorder so that collisions are spread in the stream
+    return records[::3] + records[1::3] + records[2::3]
+
+
+class TestNonceReuse(unittest.TestCase):
+    def test_dsa(self):
+        records = _dsa_records()
+        cracked = list(scan(records))
+        self.assertEqual(len(cracked), 2)
+        for pubkey, q, k in cracked:
+            self.assertEqual(bytes_from_point(mult(q)), pubkey)
+            self.assertEqual(k, 0xbadc0ffee)
+        self.assertEqual(sorted(q for _, q, _ in cracked), [1, 2])
+
+        # nothing to crack without nonce reuse
+        self.assertEqual(list(scan(records[:3])), [])
+        # identical signatures
+        self.assertEqual(list(scan(records[:3] + records[:3])), [])
+
+        # invalid records are skipped
+        invalid = [(b"msg", b"\x02" + b"\x00" * 32, (1, 1)),
+                   (b"msg", bytes_from_point(mult(1)), (0, 1))]
+        self.assertEqual(len(list(scan(invalid + records))), 2)
+
+        # string messages
+        records = [(m.decode(), Q, sig) for m, Q, sig in records]
+        self.assertEqual(len(list(scan(records))), 2)
+
+        self.assertRaises(ValueError, next, scan(records, max_entries=0))
+
+    def test_ssa(self):
+        records = list()
+        for q in (1, 2):
+            x_Q = mult(q)[0].to_bytes(32, 'big')
+            for i in range(2):
+                msg = sha256(f"message {i}".encode()).digest()
+                records.append((msg, x_Q, ssa.sign(msg, q, 0xbadc0ffee)))
+        cracked = list(scan(records, bip340=True))
+        self.assertEqual(len(cracked), 2)
+        for pubkey, q, _ in cracked:
+            self.assertEqual(mult(q)[0].to_bytes(32, 'big'), pubkey)
+
+    def test_spill(self):
+        records = _dsa_records()
+        # temporary spill file
+        cracked = list(scan(records, max_entries=1))
+        self.assertEqual(sorted(q for _, q, _ in cracked), [1, 2])
+
+        # user provided spill file
+        fd, filename = tempfile.mkstemp(suffix='.sqlite')
+        os.close(fd)
+        try:
+            cracked = list(scan(records, max_entries=2,
+                                spill_filename=filename))
+            self.assertEqual(sorted(q for _, q, _ in cracked), [1, 2])
+            # rows from the previous scan are not reused
+            self.assertEqual(list(scan(records[3:6], max_entries=1,
+                                       spill_filename=filename)), [])
+        finally:
+            os.remove(filename)
+
+    def test_records_from_file(self):
+        records = _dsa_records()
+        fd, filename = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(fd, 'w') as f:
+            for msg, Q, sig in records:
+                dersig = der.serialize(*sig, ec=ec)
+                f.write(f"{msg.hex()} {Q.hex()} {dersig.hex()}\n\n")
+        try:
+            cracked = list(scan(records_from_file(filename)))
+            self.assertEqual(sorted(q for _, q, _ in cracked), [1, 2])
+        finally:
+            os.remove(filename)
+
+
+if __name__ == "__main__":
+    # execute only if run as a script
+    unittest.main()
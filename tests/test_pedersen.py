@@ -130,6 +130,52 @@ class TestPedersenCommitment(unittest.TestCase):
         # commit does not open (with catched exception)
         self.assertFalse(pedersen.open((r1, r1), v1, C2, ec, hf))
 
+        # commit is consistent with the straightforward rG+vH
+        H = pedersen.second_generator(ec, hf)
+        self.assertEqual(C1, double_mult(v1, H, r1, ec.G, ec))
+        C = pedersen.commit(r1, v1, secp256r1, hf)
+        H = pedersen.second_generator(secp256r1, hf)
+        self.assertEqual(C, double_mult(v1, H, r1, secp256r1.G, secp256r1))
+
+    def test_commit_many(self):
+
+        ec = secp256k1
+        hf = sha256
+
+        rs = [0x1, 0x3, ec.n - 1]
+        vs = [0x2, 0x4, 0x5]
+        Cs = pedersen.commit_many(rs, vs, ec, hf)
+        self.assertEqual(Cs, [pedersen.commit(r, v, ec, hf)
+                              for r, v in zip(rs, vs)])
+        self.assertEqual(pedersen.commit_many([], [], ec, hf), [])
+
+        # mismatch between number of r and number of v
+        self.assertRaises(ValueError, pedersen.commit_many, rs, vs[1:], ec, hf)
+
+    def test_verify_sum(self):
+
+        ec = secp256k1
+        hf = sha256
+
+        # inputs: (r1, v1), (r2, v2); outputs: (r3, v3), (r4, v4)
+        # with r1+r2 = r3+r4 and v1+v2 = v3+v4
+        inputs = pedersen.commit_many([1, 2], [10, 20], ec, hf)
+        outputs = pedersen.commit_many([2, 1], [5, 25], ec, hf)
+        self.assertTrue(pedersen.verify_sum(inputs, outputs, ec))
+        self.assertTrue(pedersen.verify_sum(outputs, inputs, ec))
+        self.assertTrue(pedersen.verify_sum([], [], ec))
+
+        # unbalanced values
+        outputs = pedersen.commit_many([2, 1], [5, 26], ec, hf)
+        self.assertFalse(pedersen.verify_sum(inputs, outputs, ec))
+
+        # unbalanced blinding factors
+        outputs = pedersen.commit_many([2, 2], [5, 25], ec, hf)
+        self.assertFalse(pedersen.verify_sum(inputs, outputs, ec))
+
+        # invalid point
+        self.assertFalse(pedersen.verify_sum(inputs, [(1, 1)], ec))
+
 
 if __name__ == "__main__":
     # execute only if run as a script
@@ -11,7 +11,7 @@
 import unittest
 
 from btclib.script import (OP_CODE_NAMES, OP_CODES, decode, encode, deserialize,
-                           serialize)
+                           iter_decode, serialize)
 
 
 class TestScript(unittest.TestCase):
@@ -113,6 +113,34 @@ class TestScript(unittest.TestCase):
         # encode(script)
         # FIXME: why is the error message reporting 522 bytes instead of 521
 
+    def test_iter_decode(self):
+        script_list = ['OP_DUP', 'OP_HASH160', "1f"*20, 'OP_EQUALVERIFY',
+                       'OP_CHECKSIG', 0, -1, 16, "2f"*75, "3f"*256]
+        script_bytes = encode(script_list)
+        tokens = list(iter_decode(script_bytes))
+        expected = [0x76, 0xa9, b'\x1f'*20, 0x88, 0xac, 0, 0x4f, 0x60,
+                    b'\x2f'*75, b'\x3f'*256]
+        self.assertEqual(tokens, expected)
+        for token in tokens:
+            if isinstance(token, memoryview):
+                self.assertIs(token.obj, script_bytes)
+        self.assertEqual(list(iter_decode(script_bytes.hex())), expected)
+        self.assertEqual(list(iter_decode(memoryview(script_bytes))), expected)
+
+        # OP_PUSHDATA4
+        script_bytes = b'\x4e\x09\x02\x00\x00' + 521 * b'\xff'
+        self.assertEqual(list(iter_decode(script_bytes)), [521 * b'\xff'])
+
+        # Script: truncated push of 20 bytes
+        script_bytes = encode(['OP_HASH160', "1f"*20])[:-1]
+        self.assertRaises(ValueError, list, iter_decode(script_bytes))
+        # list(iter_decode(script_bytes))
+
+        # Script: truncated push of 133454 bytes
+        script_bytes = b'NN\t\x02\x00\x00' + 521 * b'\xff'
+        self.assertRaises(ValueError, list, iter_decode(script_bytes))
+        # list(iter_decode(script_bytes))
+
 
 if __name__ == "__main__":
     # execute only if run as a script
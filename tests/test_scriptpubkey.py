@@ -18,7 +18,9 @@ from btclib.scriptpubkey import (address_from_scriptPubKey,
                                  nulldata_scriptPubKey, p2ms_scriptPubKey,
                                  p2pk_scriptPubKey, p2pkh_scriptPubKey,
                                  p2sh_scriptPubKey, p2wpkh_scriptPubKey,
-                                 p2wsh_scriptPubKey, scriptPubKey_from_address)
+                                 p2wsh_scriptPubKey, payload_from_scriptPubKey,
+                                 scriptPubKey_from_address,
+                                 scriptpubkeys_from_addresses)
 from btclib.utils import hash160, sha256
 
 
@@ -252,6 +254,101 @@ class TestScriptPubKey(unittest.TestCase):
         self.assertRaises(ValueError, scriptPubKey_from_address, addr)
         # scriptPubKey_from_address(addr)
 
+    def test_payload_from_scriptPubKey(self):
+
+        pubkey = "03 a1af804ac108a8a51782198c2d034b28bf90c8803f5a53f76276fa69a4eae77f"
+        uncompressed = ("04 a1af804ac108a8a51782198c2d034b28bf90c8803f5a53f76276fa69a4eae77f"
+                        "  e9e1e3ff9a0ac0e7c4b1a39b0ab08ee8c8dd4dee4e1e6a2b6e51e2c0f4b3a8a1")
+        h160 = hash160(pubkey)
+        h256 = sha256(pubkey)
+        data = b'\x11' * 80
+        scripts = [
+            ('p2pk', [pubkey, 'OP_CHECKSIG'], bytes.fromhex(pubkey)),
+            ('p2pk', [uncompressed, 'OP_CHECKSIG'], bytes.fromhex(uncompressed)),
+            ('p2pkh', p2pkh_scriptPubKey(h160), h160),
+            ('p2sh', p2sh_scriptPubKey(h160), h160),
+            ('p2wpkh', p2wpkh_scriptPubKey(h160), h160),
+            ('p2wsh', p2wsh_scriptPubKey(h256), h256),
+            ('nulldata', ['OP_RETURN'], b''),
+            ('nulldata', nulldata_scriptPubKey(''), b''),
+            ('nulldata', nulldata_scriptPubKey(data[:20]), data[:20]),
+            ('nulldata', nulldata_scriptPubKey(data), data),
+            ('p2ms', [1, pubkey, uncompressed, 2, 'OP_CHECKMULTISIG'],
+             b'\x21' + bytes.fromhex(pubkey) + b'\x41' + bytes.fromhex(uncompressed)),
+            ('p2ms', [2, pubkey, pubkey, 2, 'OP_CHECKMULTISIG'],
+             (b'\x21' + bytes.fromhex(pubkey)) * 2),
+        ]
+        for script_type, script, payload in scripts:
+            script = encode(script)
+            result = payload_from_scriptPubKey(script)
+            self.assertEqual(result[0], script_type)
+            self.assertIsInstance(result[1], memoryview)
+            self.assertEqual(result[1], payload)
+            self.assertEqual(payload_from_scriptPubKey(script.hex()), result)
+            self.assertEqual(payload_from_scriptPubKey(memoryview(script)), result)
+
+        nonstandard = [
+            [],
+            [pubkey, 'OP_CHECKSIGVERIFY'],
+            ['OP_HASH160', h160, 'OP_EQUALVERIFY'],
+            [16, h160],
+            [1, h256],
+            ['OP_RETURN', data + b'\x11'],
+            ['OP_RETURN', data[:20], data[:20]],
+            # m > n
+            [2, pubkey, 1, 'OP_CHECKMULTISIG'],
+            # n does not match the number of pubkeys
+            [1, pubkey, pubkey, 3, 'OP_CHECKMULTISIG'],
+            [1, pubkey, h160, 2, 'OP_CHECKMULTISIG'],
+        ]
+        for script in nonstandard:
+            script = encode(script)
+            script_type, payload = payload_from_scriptPubKey(script)
+            self.assertEqual(script_type, 'nonstandard')
+            self.assertEqual(payload, script)
+
+    def test_scriptpubkeys_from_addresses(self):
+
+        pubkey = "03 a1af804ac108a8a51782198c2d034b28bf90c8803f5a53f76276fa69a4eae77f"
+        pubkey_hash = hash160(pubkey)
+        script_hash = sha256(pubkey_hash)
+        addresses = [
+            b58address_from_h160(_P2PKH_PREFIXES[1], pubkey_hash),
+            address_from_scriptPubKey(p2sh_scriptPubKey(pubkey_hash)),
+            " " + b32address_from_witness(0, pubkey_hash).decode() + " ",
+            b32address_from_witness(0, script_hash, 'regtest').decode().upper(),
+        ]
+        expected = []
+        for addr in addresses:
+            script, network = scriptPubKey_from_address(addr)
+            expected.append((encode(script), network, ''))
+        # invalid addresses are reported in-band
+        invalid = [
+            b32address_from_witness(16, pubkey_hash[2:]),  # witness version
+            b58encode(b'\x01' + pubkey_hash),  # base58 prefix
+            "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t5",  # checksum
+            "",
+        ]
+        addresses += invalid
+        for addr in invalid:
+            results = list(scriptpubkeys_from_addresses([addr]))
+            self.assertEqual(len(results), 1)
+            self.assertEqual(results[0][:2], (b'', ''))
+            self.assertNotEqual(results[0][2], '')
+            expected += results
+
+        results = list(scriptpubkeys_from_addresses(addresses))
+        self.assertEqual(results, expected)
+        for chunk_size in (1, 3):
+            results = scriptpubkeys_from_addresses(iter(addresses * 3),
+                                                   max_workers=2, threads=True,
+                                                   chunk_size=chunk_size)
+            self.assertEqual(list(results), expected * 3)
+
+        # Invalid chunk size: 0
+        results = scriptpubkeys_from_addresses(addresses, chunk_size=0)
+        self.assertRaises(ValueError, list, results)
+
 
 if __name__ == "__main__":
     # execute only if run as a script
@@ -14,7 +14,7 @@ from hashlib import sha256
 from btclib import dsa, ssa
 from btclib.curvemult import mult
 from btclib.signtocontract import (ecdsa_commit_sign, ecssa_commit_sign,
-                                   verify_commit)
+                                   verify_commit, verify_commit_many)
 from btclib.curves import secp256k1 as ec
 
 
@@ -35,6 +35,34 @@ class TestSignToContract(unittest.TestCase):
         self.assertIsNone(ssa._verify(m, pub, ssa_sig, ec, sha256))
         self.assertTrue(verify_commit(c, ssa_receipt))
 
+    def test_verify_commit_many(self):
+        m = sha256(b"to be signed").digest()
+        cs = [b"commit one", b"commit two", b"commit three"]
+        receipts = list()
+        for prv, c in enumerate(cs, 1):
+            _, receipt = ecdsa_commit_sign(c, m, prv, None)
+            receipts.append(receipt)
+            _, receipt = ecssa_commit_sign(c, m, prv, None)
+            receipts.append(receipt)
+        cs = [c for c in cs for _ in range(2)]
+
+        self.assertEqual(verify_commit_many(cs, receipts), [True] * 6)
+        self.assertEqual(verify_commit_many([], []), [])
+
+        # wrong commitment
+        wrong_cs = cs[:1] + [b"wrong commitment"] + cs[2:]
+        result = verify_commit_many(wrong_cs, receipts)
+        self.assertEqual(result, [True, False, True, True, True, True])
+
+        # invalid R point
+        w, _ = receipts[2]
+        wrong_receipts = receipts[:2] + [(w, (1, 1))] + receipts[3:]
+        result = verify_commit_many(cs, wrong_receipts)
+        self.assertEqual(result, [True, True, False, True, True, True])
+
+        # mismatch between number of commitments and number of receipts
+        self.assertRaises(ValueError, verify_commit_many, cs[1:], receipts)
+
 
 if __name__ == "__main__":
     # execute only if run as a script
@@ -8,10 +8,11 @@
 # No part of btclib including this file, may be copied, modified, propagated,
 # or distributed except according to the terms contained in the LICENSE file.
 
+import time
 import unittest
 
 from btclib.curves import secp256k1 as ec
-from btclib.utils import hash160, hash256
+from btclib.utils import hash160, hash256, stream_map
 
 
 class TestUtils(unittest.TestCase):
@@ -21,6 +22,29 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(hash160(s), hash160(bytes.fromhex(s)))
         self.assertEqual(hash256(s), hash256(bytes.fromhex(s)))
 
+    def test_stream_map(self):
+        args = [i.to_bytes(2, 'big') for i in range(100)]
+        expected = [hash256(arg) for arg in args]
+        self.assertEqual(list(stream_map(hash256, args, 1)), expected)
+        self.assertEqual(list(stream_map(hash256, iter(args), 3, True)),
+                         expected)
+        self.assertEqual(list(stream_map(hash256, args, 2)), expected)
+        self.assertEqual(list(stream_map(hash256, [], 2, True)), [])
+
+        # closing the generator early drops the queued computations
+        calls = []
+
+        def slow_hash256(arg):
+            calls.append(arg)
+            time.sleep(0.05)
+            return hash256(arg)
+
+        results = stream_map(slow_hash256, args, 2, True)
+        self.assertEqual(next(results), expected[0])
+        results.close()
+        self.assertLess(len(calls), 8)
+
+
 if __name__ == "__main__":
     # execute only if run as a script
     unittest.main()
@@ -8,10 +8,13 @@
 # No part of btclib including this file, may be copied, modified, propagated,
 # or distributed except according to the terms contained in the LICENSE file.
 
+import os
+import tempfile
 import unittest
 from os import path
 
-from btclib.wordlists import _wordlists
+from btclib.wordlists import (WordLists, _bin_filename, _BinaryWordList,
+                              _wordlists, build_binary_wordlist)
 
 
 class TestWordLists(unittest.TestCase):
@@ -48,6 +51,99 @@ class TestWordLists(unittest.TestCase):
         length = _wordlists.language_length(lang)
         self.assertEqual(length, 2048)
 
+    def test_binary(self):
+        wordlists = WordLists()
+        for lang in ("en", "it"):
+            filename = wordlists.language_files[lang]
+            # the shipped binary word-lists are up to date,
+            # but for the text modification time (bytes 25:33)
+            fd, bin_filename = tempfile.mkstemp(suffix='.bin')
+            os.close(fd)
+            try:
+                build_binary_wordlist(filename, bin_filename)
+                with open(bin_filename, 'rb') as f:
+                    built = f.read()
+            finally:
+                os.remove(bin_filename)
+            with open(_bin_filename(filename), 'rb') as f:
+                shipped = f.read()
+            self.assertEqual(shipped[:25], built[:25])
+            self.assertEqual(shipped[33:], built[33:])
+
+            # binary and text word-lists are equivalent
+            wordlists.load_lang(lang)
+            self.assertIn(lang, wordlists._binary)
+            with open(filename, 'r') as f:
+                words = [line[:-1] for line in f.readlines()]
+            self.assertEqual(wordlists.language_length(lang), len(words))
+            self.assertEqual(wordlists.bits_per_word(lang), 11)
+            for i, word in enumerate(words):
+                self.assertEqual(wordlists.index(word, lang), i)
+            self.assertEqual(wordlists.wordlist(lang), words)
+            self.assertRaises(ValueError, wordlists.index, "xyz", lang)
+            self.assertEqual(wordlists.index(words[7][:4], lang, True), 7)
+
+        # a text-only language
+        wordlists.load_lang("en2", path.join(path.dirname(__file__),
+                                             "data", "english.txt"))
+        self.assertNotIn("en2", wordlists._binary)
+        self.assertEqual(wordlists.wordlist("en2"), wordlists.wordlist("en"))
+
+        tmpdir = tempfile.mkdtemp()
+        filename = path.join(tmpdir, "wordlist.txt")
+        bin_filename = _bin_filename(filename)
+        en_words = wordlists.wordlist("en")
+        try:
+            with open(filename, 'w') as f:
+                f.writelines(w + '\n' for w in en_words)
+            build_binary_wordlist(filename)
+            stat = os.stat(filename)
+
+            # same content, different modification time
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            wordlists.load_lang("touched", filename)
+            self.assertIn("touched", wordlists._binary)
+            self.assertEqual(wordlists.index(en_words[5], "touched"), 5)
+
+            # a stale binary word-list is ignored
+            with open(filename, 'w') as f:
+                f.writelines(w + '\n' for w in reversed(en_words))
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            wordlists.load_lang("stale", filename)
+            self.assertNotIn("stale", wordlists._binary)
+            self.assertEqual(wordlists.index(en_words[0], "stale"), 2047)
+
+            # invalid binary word-lists are ignored
+            build_binary_wordlist(filename)
+            with open(bin_filename, 'rb') as f:
+                data = f.read()
+            invalids = [
+                b'\x00' * 64,  # not a binary word-list
+                data[:-1],  # truncated
+                data + b'\x00',
+                data[:40],
+                data[:12] + b'\x0a' + data[13:],  # bits per word
+                data[:13] + b'\x00\x04' + data[15:],  # hash table slots
+                data[:65] + b'\xff' + data[66:],  # offsets
+            ]
+            for i, invalid in enumerate(invalids):
+                with open(bin_filename, 'wb') as f:
+                    f.write(invalid)
+                if i < len(invalids) - 1:
+                    self.assertRaises(ValueError, _BinaryWordList, bin_filename)
+                else:
+                    binary = _BinaryWordList(bin_filename)
+                    self.assertRaises(ValueError, binary.open)
+                lang = f"invalid{i}"
+                wordlists.load_lang(lang, filename)
+                self.assertNotIn(lang, wordlists._binary)
+                self.assertEqual(wordlists.index(en_words[0], lang), 2047)
+        finally:
+            for name in (filename, bin_filename):
+                if path.isfile(name):
+                    os.remove(name)
+            os.rmdir(tmpdir)
+
 
 if __name__ == "__main__":
     # execute only if run as a script